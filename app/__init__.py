@@ -1,5 +1,8 @@
 from flask import Flask
+from . import responses, startup
 from .routes import bp as routes_bp
+from .database import warm_up_pool, warm_up_pool_async
+from .storage import STORAGE_BACKEND
 from config import Config
 
 def create_app():
@@ -12,6 +15,17 @@ def create_app():
     # 라우트 등록
     app.register_blueprint(routes_bp)
 
-    return app
+    # orjson 인코더 + gzip/brotli 응답 압축
+    responses.init_app(app)
+
+    # 콜드 스타트 측정 + `flask profile-startup` 명령
+    startup.init_app(app)
 
+    # DB 풀 워밍업: 빠른 시작 모드는 백그라운드, 아니면 부팅 중 동기 연결 (Postgres 저장소만)
+    if STORAGE_BACKEND == "postgres":
+        if app.config["FAST_STARTUP"]:
+            warm_up_pool_async()
+        else:
+            warm_up_pool()
 
+    return app
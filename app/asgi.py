@@ -0,0 +1,212 @@
+import asyncio
+import io
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack
+
+from app import create_app
+from app.database import close_async_pools, get_async_connection, warm_up_async_pool
+from app.storage import STORAGE_BACKEND
+from app.storage.bridge import PoolBridge, bridging
+
+# ASGI 서빙 모드 (비동기 DB 접근)
+#   uvicorn app.asgi:app --host 0.0.0.0 --port 8000
+#   GET /api/* 조회: 같은 블루프린트 뷰를 스레드 풀에서 한 번 실행하고 쿼리만 psycopg 3 비동기 풀로 (app/storage/bridge.py)
+#     → 요청 수만큼 DB 커넥션을 잡지 않고 비동기 풀(DB_ASYNC_POOL_MAX) 하나를 프로세스 전체가 공유
+#     → JSON 직렬화 / 압축 같은 CPU 작업은 스레드에서 — 이벤트 루프를 막지 않음
+#     → SQL / 직렬화 / 압축 모두 동기 모드(gunicorn run:app)와 같은 코드라 응답 JSON 동일
+#     → 쿼리를 기다리는 동안 뷰 스레드는 대기 — 동시에 처리하는 조회 수는 ASGI_THREADS 까지
+#   그 외 (페이지, 정적 파일, 스냅샷, 크롤러 실행, SSE, 시뮬레이션)는 기존 WSGI 앱을 스레드 풀에서 실행
+#   Postgres 저장소가 아니면 모든 요청을 스레드 풀에서 실행
+ASGI_THREADS = int(os.getenv("ASGI_THREADS", 32))
+# /api/ 중에서도 스레드 풀로 보낼 경로: SSE 스트림, CPU 위주(numpy) 시뮬레이션
+THREADED_API_PATHS = ("/api/crawl/", "/api/simulate")
+
+flask_app = create_app()
+_executor = ThreadPoolExecutor(max_workers=ASGI_THREADS, thread_name_prefix="asgi-wsgi")
+_END = object()
+
+
+def _wsgi_environ(scope, body):
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client")
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", "").encode().decode("latin-1"),
+        "PATH_INFO": scope["path"].encode().decode("latin-1"),
+        "QUERY_STRING": scope["query_string"].decode("latin-1"),
+        "SERVER_NAME": server[0],
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope['http_version']}",
+        "REMOTE_ADDR": client[0] if client else "",
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    for name, value in scope["headers"]:
+        name = name.decode("latin-1")
+        value = value.decode("latin-1")
+        if name == "content-type":
+            environ["CONTENT_TYPE"] = value
+        elif name == "content-length":
+            environ["CONTENT_LENGTH"] = value
+        else:
+            key = "HTTP_" + name.upper().replace("-", "_")
+            environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
+
+
+def _is_async_path(scope):
+    if STORAGE_BACKEND != "postgres" or scope["method"] not in ("GET", "HEAD"):
+        return False
+    path = scope["path"]
+    return path.startswith("/api/") and not path.startswith(THREADED_API_PATHS)
+
+
+# ---------------------------------------------------------------------
+# 조회 API: 뷰는 스레드 풀에서 한 번, 쿼리는 이벤트 루프에서 비동기 풀로
+# ---------------------------------------------------------------------
+def _dispatch_view(environ, bridge):
+    """뷰 실행 (스레드 풀). 반환: (status, headers, body)"""
+    with flask_app.request_context(environ):
+        with bridging(bridge):
+            try:
+                response = flask_app.full_dispatch_request()
+            except Exception as e:
+                response = flask_app.make_response(flask_app.handle_exception(e))
+        app_iter, status, headers = response.get_wsgi_response(environ)
+        try:
+            body = b"".join(app_iter)
+        finally:
+            if hasattr(app_iter, "close"):
+                app_iter.close()
+        return status, headers, body
+
+
+async def _run_view(environ):
+    loop = asyncio.get_running_loop()
+    async with AsyncExitStack() as stack:
+        conns = {}
+
+        async def fetch(sql, params, readonly, max_lag):
+            # 요청 하나는 (readonly, max_lag) 별로 커넥션 하나 (동기 모드의 커서 하나와 같은 라우팅)
+            key = (readonly, max_lag)
+            conn = conns.get(key)
+            if conn is None:
+                conn = conns[key] = await stack.enter_async_context(
+                    get_async_connection(readonly=readonly, max_lag=max_lag))
+            async with conn.cursor() as cur:
+                await cur.execute(sql, params)
+                return await cur.fetchall() if cur.description else []
+
+        return await loop.run_in_executor(_executor, _dispatch_view, environ, PoolBridge(loop, fetch))
+
+
+# ---------------------------------------------------------------------
+# 나머지: 기존 WSGI 앱을 스레드 풀에서 (응답 본문은 조각 단위로 전송 — SSE 포함)
+# ---------------------------------------------------------------------
+def _start_wsgi(environ):
+    started = {}
+
+    def start_response(status, headers, exc_info=None):
+        started["status"] = status
+        started["headers"] = headers
+
+        def write(data):
+            raise RuntimeError("write() 콜러블은 지원하지 않습니다")
+        return write
+
+    result = flask_app(environ, start_response)
+    iterator = iter(result)
+    first = next(iterator, _END)
+    return started["status"], started["headers"], result, iterator, first
+
+
+async def _run_wsgi(environ, send, disconnected):
+    loop = asyncio.get_running_loop()
+    status, headers, result, iterator, chunk = await loop.run_in_executor(_executor, _start_wsgi, environ)
+    try:
+        await send(_response_start(status, headers))
+        while chunk is not _END and not disconnected.is_set():
+            if chunk:
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            chunk = await loop.run_in_executor(_executor, next, iterator, _END)
+        await send({"type": "http.response.body", "body": b""})
+    finally:
+        if hasattr(result, "close"):
+            await loop.run_in_executor(_executor, result.close)
+
+
+def _response_start(status, headers):
+    return {
+        "type": "http.response.start",
+        "status": int(status.split(" ", 1)[0]),
+        "headers": [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers],
+    }
+
+
+# ---------------------------------------------------------------------
+# ASGI 진입점
+# ---------------------------------------------------------------------
+async def _read_body(receive):
+    body = b""
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return None
+        body += message.get("body", b"")
+        if not message.get("more_body"):
+            return body
+
+
+async def _watch_disconnect(receive, disconnected):
+    while (await receive())["type"] != "http.disconnect":
+        pass
+    disconnected.set()
+
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            if STORAGE_BACKEND == "postgres":
+                await warm_up_async_pool()
+            else:
+                print(f"[WARN] 비동기 DB 는 Postgres 저장소만 지원 — 모든 요청을 스레드 풀에서 처리 ({STORAGE_BACKEND})")
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await close_async_pools()
+            _executor.shutdown(wait=False)
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+    if scope["type"] != "http":
+        return
+
+    body = await _read_body(receive)
+    if body is None:
+        return
+    environ = _wsgi_environ(scope, body)
+
+    if _is_async_path(scope):
+        status, headers, body = await _run_view(environ)
+        await send(_response_start(status, headers))
+        await send({"type": "http.response.body", "body": body})
+        return
+
+    disconnected = asyncio.Event()
+    watcher = asyncio.create_task(_watch_disconnect(receive, disconnected))
+    try:
+        await _run_wsgi(environ, send, disconnected)
+    finally:
+        watcher.cancel()
@@ -0,0 +1,3 @@
+# 성능 측정 도구
+#   datagen:  대규모 합성 데이터 생성 (python -m app.bench.datagen)
+#   loadtest: API 부하 테스트 + 커밋 간 비교 (python -m app.bench.loadtest)
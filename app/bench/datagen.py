@@ -0,0 +1,146 @@
+import argparse
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+from app.storage import get_storage
+
+# 합성 데이터 생성기
+#   실제 수집 경로(insert_records)로 users / boards / betting_stats 를 채우고 마지막에 rebuild_stats 로 파생 테이블 생성
+#   python -m app.bench.datagen --days 365 --users 20000 --posts-per-day 12
+#   같은 --seed 면 같은 데이터 → 커밋 간 부하 테스트 결과 비교 가능
+BOARD_SLUGS = ("pan_setkacup", "pan_ccy", "starbbs")
+RETURN_RATIO = 0.95   # 총 풀 대비 반환 비율 (수수료 5%)
+HEDGE_RATE = 0.05     # 양방 배팅 비율
+CHUNK_POSTS = 200     # insert_records 한 번에 넘기는 게시물 수
+POST_ID_STRIDE = 10_000_000  # 게시판별 post_id 대역 (배치 dict 키 충돌 방지)
+
+
+def _board_slugs(n_boards):
+    return [BOARD_SLUGS[i] if i < len(BOARD_SLUGS) else f"board{i:02d}" for i in range(n_boards)]
+
+
+def _user_weights(rng, n_users, skew):
+    # 활동량은 멱법칙: 소수 헤비 유저가 대부분의 배팅에 참여
+    weights = 1.0 / np.arange(1, n_users + 1) ** skew
+    rng.shuffle(weights)
+    return weights / weights.sum()
+
+
+def generate_posts(rng, slug, board_no, day, n_posts, nicknames, weights, mean_bettors, next_post_no):
+    """
+    하루치 게시물 {post_id: [record, ...]} 생성 (parse_post 결과와 같은 형태).
+    - 참여 인원: 로그정규, 배팅액: 로그정규(100원 단위), 사이드 인기: Beta(2, 2)
+    - 승리 사이드는 풀 비중에 비례한 확률 (인기 사이드가 더 자주 이김), 반환은 파리뮤추얼
+    """
+    posts = {}
+    n_users = len(nicknames)
+    for i in range(n_posts):
+        post_id = board_no * POST_ID_STRIDE + next_post_no + i
+        # 마감은 저녁 시간대에 몰림 (일부는 다음날 00~05시 → 전일 집계)
+        hour = min(int(rng.normal(21, 3)) % 29, 28)
+        deadline = datetime.combine(day, datetime.min.time()) + timedelta(hours=hour, minutes=int(rng.integers(0, 60)))
+
+        k = int(np.clip(rng.lognormal(np.log(mean_bettors), 0.6), 2, min(n_users, mean_bettors * 10)))
+        bettors = rng.choice(n_users, size=k, replace=False, p=weights)
+        side_p = rng.beta(2, 2)
+        sides = (rng.random(k) < side_p).astype(int)
+        amounts = np.maximum(np.round(rng.lognormal(8.0, 1.0, k) / 100) * 100, 100).astype(int)
+
+        bets = [(int(u), int(s), int(a)) for u, s, a in zip(bettors, sides, amounts)]
+        for u in bettors[rng.random(k) < HEDGE_RATE]:
+            bets.append((int(u), 1, int(max(round(rng.lognormal(7.5, 0.8) / 100) * 100, 100))))
+            bets.append((int(u), 0, int(max(round(rng.lognormal(7.5, 0.8) / 100) * 100, 100))))
+        # 같은 (유저, 사이드) 중복은 첫 배팅만 유지 (테이블 유니크 제약과 동일)
+        seen = set()
+        bets = [b for b in bets if (b[0], b[1]) not in seen and not seen.add((b[0], b[1]))]
+
+        pool = [sum(a for _, s, a in bets if s == side) for side in (0, 1)]
+        total = pool[0] + pool[1]
+        winner = 0 if rng.random() < pool[0] / total else 1
+
+        posts[str(post_id)] = [{
+            "post_id": post_id,
+            "slug": slug,
+            "bet_side": side,
+            "nickname": nicknames[u],
+            "bet_amount": amount,
+            "payout_amount": int(amount * total * RETURN_RATIO / pool[winner]) if side == winner else 0,
+            "deadline_at": deadline,
+        } for u, side, amount in bets]
+    return posts
+
+
+def run_datagen(days=365, n_users=20000, n_boards=3, posts_per_day=12.0, mean_bettors=40,
+                skew=0.9, end_date=None, seed=42, append=False):
+    storage = get_storage()
+    if not append:
+        with storage.cursor(commit=True) as cur:
+            storage.ensure_schema(cur)
+            storage.execute(cur, "SELECT EXISTS (SELECT 1 FROM betting_stats)")
+            if cur.fetchone()[0]:
+                sys.exit("[ERROR] betting_stats 가 비어 있지 않습니다 (--append 로 추가 생성)")
+
+    rng = np.random.default_rng(seed)
+    nicknames = [f"u{i:05d}" for i in range(n_users)]
+    weights = _user_weights(rng, n_users, skew)
+    slugs = _board_slugs(n_boards)
+    end_date = end_date or date.today() - timedelta(days=1)
+    start_date = end_date - timedelta(days=days - 1)
+
+    started = time.time()
+    totals = {"posts": 0, "records": 0}
+    post_no = [0] * n_boards
+    chunk = {}
+
+    def flush():
+        result = storage.insert_records(chunk, aggregate=False)
+        totals["posts"] += result["posts"]
+        totals["records"] += result["records"]
+        chunk.clear()
+
+    for d in range(days):
+        day = start_date + timedelta(days=d)
+        for board_no, slug in enumerate(slugs):
+            n_posts = int(rng.poisson(posts_per_day))
+            chunk.update(generate_posts(rng, slug, board_no, day, n_posts, nicknames, weights,
+                                        mean_bettors, post_no[board_no]))
+            post_no[board_no] += n_posts
+            if len(chunk) >= CHUNK_POSTS:
+                flush()
+        if (d + 1) % 30 == 0:
+            print(f"[INFO] {day} 까지 생성: 게시물 {totals['posts']}, 기록 {totals['records']} "
+                  f"({time.time() - started:.1f}초)")
+    if chunk:
+        flush()
+
+    print("[INFO] 파생 통계 재계산 중...")
+    t0 = time.time()
+    storage.rebuild_stats()
+    print(f"[OK] 합성 데이터 생성 완료: {start_date} ~ {end_date}, 게시판 {n_boards}, 유저 {n_users}, "
+          f"게시물 {totals['posts']}, 기록 {totals['records']} "
+          f"(저장 {t0 - started:.1f}초, 집계 {time.time() - t0:.1f}초)")
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="부하 테스트용 합성 데이터 생성 (STORAGE_BACKEND 저장소)")
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--users", type=int, default=20000)
+    parser.add_argument("--boards", type=int, default=3)
+    parser.add_argument("--posts-per-day", type=float, default=12.0, help="게시판당 하루 평균 게시물 수")
+    parser.add_argument("--bettors", type=int, default=40, help="게시물당 평균 참여 인원")
+    parser.add_argument("--skew", type=float, default=0.9, help="유저 활동량 멱법칙 지수 (클수록 쏠림)")
+    parser.add_argument("--end", type=date.fromisoformat, help="마지막 날짜 YYYY-MM-DD (기본: 어제)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--append", action="store_true", help="기존 데이터가 있어도 추가 생성")
+    args = parser.parse_args()
+
+    run_datagen(args.days, args.users, args.boards, args.posts_per_day, args.bettors,
+                args.skew, args.end, args.seed, args.append)
+
+
+if __name__ == "__main__":
+    main()
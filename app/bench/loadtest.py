@@ -0,0 +1,272 @@
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from app.storage import STORAGE_BACKEND, get_storage
+from app.storage.base import as_date
+
+# API 부하 테스트
+#   app/routes.py 의 모든 조회 엔드포인트를 정해진 동시성으로 호출하고 엔드포인트별 처리량/지연 분포 보고
+#   python -m app.bench.loadtest                                  # 앱을 프로세스 안에서 (test client)
+#   python -m app.bench.loadtest --base-url http://localhost:8000 # 실행 중인 서버
+#   python -m app.bench.loadtest --out HEAD.json --compare base.json --max-regression 20
+#   요청 파라미터(닉네임/날짜)는 저장소 데이터에서 --seed 로 뽑으므로 같은 데이터면 커밋 간 비교 가능
+#   /run-crawler, /api/crawl/* 는 부작용/스트리밍/인증이라 제외
+PERCENTILES = (50, 95, 99)
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_scenario(storage, seed, n_nicknames=200):
+    """부하 대상 파라미터 풀: 데이터 기간, 게시판, 활동 유저 닉네임, 데이터 규모"""
+    with storage.cursor(readonly=True) as cur:
+        storage.execute(cur, "SELECT MIN(stat_date), MAX(stat_date) FROM daily_betting_stats")
+        first_day, last_day = cur.fetchone()
+        if first_day is None:
+            sys.exit("[ERROR] 집계 데이터가 없습니다 (python -m app.bench.datagen 먼저 실행)")
+        storage.execute(cur, "SELECT slug FROM boards ORDER BY slug")
+        slugs = [r[0] for r in cur.fetchall()]
+        # 활동량 상위 유저 위주 (실제 검색 패턴과 비슷하게)
+        storage.execute(cur, """
+            SELECT u.nickname
+            FROM user_lifetime_stats s
+            JOIN users u ON u.id = s.user_id
+            WHERE s.board_id = 0
+            ORDER BY s.total_bets DESC, u.nickname
+            LIMIT %s
+        """, (n_nicknames,))
+        nicknames = [r[0] for r in cur.fetchall()]
+        counts = {}
+        for table in ("users", "betting_stats", "post_summary", "daily_betting_stats"):
+            storage.execute(cur, f"SELECT COUNT(*) FROM {table}")
+            counts[table] = cur.fetchone()[0]
+
+    return {
+        "first_day": as_date(first_day),  # SQLite MIN/MAX 는 문자열
+        "last_day": as_date(last_day),
+        "slugs": slugs,
+        "nicknames": nicknames,
+        "counts": counts,
+        "rng": random.Random(seed),
+    }
+
+
+def build_endpoints(s):
+    """(이름, 요청 URL 생성 함수) 목록 — 호출마다 다른 파라미터"""
+    rng = s["rng"]
+    span = (s["last_day"] - s["first_day"]).days
+
+    def day():
+        return s["last_day"] - timedelta(days=rng.randint(0, span))
+
+    def nick():
+        return rng.choice(s["nicknames"])
+
+    def slug():
+        return rng.choice(s["slugs"])
+
+    def month():
+        return day().strftime("%Y-%m")
+
+    def window(days):
+        end = day()
+        return max(end - timedelta(days=days - 1), s["first_day"]), end
+
+    def range_url(days, board=False):
+        start, end = window(days)
+        url = f"/api/range_ranking?startDate={start}&endDate={end}&limit=50"
+        return url + f"&boardSlug={slug()}" if board else url
+
+    year_start = max(s["last_day"] - timedelta(days=364), s["first_day"])
+    return [
+        ("page:index", lambda: "/"),
+        ("page:ranking", lambda: "/ranking"),
+        ("page:board", lambda: f"/{slug()}/ranking"),
+        ("healthz", lambda: "/healthz"),
+        ("daily_stats", lambda: "/api/daily_stats?nickname={}&startDate={}&endDate={}".format(nick(), *window(30))),
+        ("daily_stats(board)", lambda: "/api/daily_stats?nickname={}&startDate={}&endDate={}&boardSlug={}".format(
+            nick(), *window(30), slug())),
+        ("monthly_stats", lambda: f"/api/monthly_stats?nickname={nick()}"),
+        ("monthly_stats(columnar)", lambda: f"/api/monthly_stats?nickname={nick()}&format=columnar"),
+        ("daily_ranking", lambda: f"/api/daily_ranking?statDate={day()}&limit=50"),
+        ("daily_ranking(board)", lambda: f"/api/daily_ranking?statDate={day()}&limit=50&boardSlug={slug()}"),
+        ("daily_ranking(limit=1000)", lambda: f"/api/daily_ranking?statDate={day()}&limit=1000"),
+        ("monthly_ranking", lambda: f"/api/monthly_ranking?statMonth={month()}&limit=50"),
+        ("monthly_ranking(board)", lambda: f"/api/monthly_ranking?statMonth={month()}&limit=50&boardSlug={slug()}"),
+        ("daily_ranking(profit)", lambda: f"/api/daily_ranking?statDate={day()}&limit=50&sort=profit"),
+        ("daily_ranking(win_rate)", lambda: f"/api/daily_ranking?statDate={day()}&limit=50&sort=win_rate"),
+        ("monthly_ranking(bets)", lambda: f"/api/monthly_ranking?statMonth={month()}&limit=50&sort=bets"),
+        ("monthly_ranking(win_rate)", lambda: f"/api/monthly_ranking?statMonth={month()}&limit=50&sort=win_rate"),
+        ("range_ranking(7d)", lambda: range_url(7)),
+        ("range_ranking(90d,board)", lambda: range_url(90, board=True)),
+        ("range_ranking(365d)", lambda: f"/api/range_ranking?startDate={year_start}&endDate={s['last_day']}&limit=50"),
+        ("user_summary", lambda: f"/api/users/{nick()}/summary"),
+        ("user_summary(board)", lambda: f"/api/users/{nick()}/summary?boardSlug={slug()}"),
+        ("rank_history", lambda: f"/api/users/{nick()}/rank_history"),
+        ("rank_history(monthly,board)", lambda: f"/api/users/{nick()}/rank_history?period=monthly&boardSlug={slug()}"),
+        ("dashboard", lambda: f"/api/dashboard?nickname={nick()}&format=columnar"),
+        ("dashboard(board,monthly)", lambda: "/api/dashboard?nickname={}&boardSlug={}&startMonth={}&endMonth={}".format(
+            nick(), slug(), s["first_day"].strftime("%Y-%m"), s["last_day"].strftime("%Y-%m"))),
+        ("board_overview", lambda: "/api/boards/all/overview?startDate={}&endDate={}".format(*window(90))),
+        ("board_overview(board,monthly)", lambda: f"/api/boards/{slug()}/overview?period=monthly"),
+        ("simulate", lambda: "/api/simulate?strategy=all&startDate={}&endDate={}".format(*window(90))),
+        ("posts", lambda: "/api/posts?limit=20"),
+        ("posts(board)", lambda: f"/api/posts?limit=50&boardSlug={slug()}"),
+    ]
+
+
+def _http_client(base_url):
+    def get(path):
+        # 크기는 전송 바이트 기준 (압축 후)
+        req = urllib.request.Request(base_url.rstrip("/") + path, headers={"Accept-Encoding": "gzip"})
+        try:
+            with urllib.request.urlopen(req, timeout=60) as res:
+                return res.status, len(res.read())
+        except urllib.error.HTTPError as e:
+            return e.code, 0
+    return get
+
+
+def _inprocess_client():
+    from run import app
+    local = threading.local()
+
+    def get(path):
+        # 스레드마다 test client 하나
+        if not hasattr(local, "client"):
+            local.client = app.test_client()
+        res = local.client.get(path, headers={"Accept-Encoding": "gzip"})
+        return res.status_code, len(res.get_data())
+    return get
+
+
+def run_endpoint(get, make_url, n_requests, concurrency, warmup):
+    for _ in range(warmup):
+        get(make_url())
+    urls = [make_url() for _ in range(n_requests)]
+
+    def one(url):
+        t0 = time.perf_counter()
+        status, size = get(url)
+        return (time.perf_counter() - t0) * 1000, status, size
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(one, urls))
+    wall = time.perf_counter() - t0
+
+    latencies = np.array([r[0] for r in results])
+    errors = sum(1 for r in results if r[1] >= 400)
+    stats = {
+        "requests": n_requests,
+        "errors": errors,
+        "rps": round(n_requests / wall, 1),
+        "mean_ms": round(float(latencies.mean()), 2),
+        "avg_bytes": int(np.mean([r[2] for r in results])),
+    }
+    for p, v in zip(PERCENTILES, np.percentile(latencies, PERCENTILES)):
+        stats[f"p{p}_ms"] = round(float(v), 2)
+    return stats
+
+
+def print_report(results, baseline=None, max_regression=None):
+    """표 출력. baseline 이 있으면 p95 변화율 표시, 반환: 회귀 엔드포인트 목록"""
+    header = f"{'endpoint':<28}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'err':>6}{'bytes':>9}"
+    if baseline:
+        header += f"{'Δp95':>9}"
+    print(header)
+    print("-" * len(header))
+
+    regressions = []
+    for name, r in results.items():
+        line = (f"{name:<28}{r['rps']:>9}{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}{r['p99_ms']:>9.1f}"
+                f"{r['errors']:>6}{r['avg_bytes']:>9}")
+        base = (baseline or {}).get(name)
+        if base:
+            delta = (r["p95_ms"] / base["p95_ms"] - 1) * 100 if base["p95_ms"] else 0.0
+            line += f"{delta:>+8.1f}%"
+            if max_regression is not None and delta > max_regression:
+                regressions.append(name)
+                line += "  [REGRESSION]"
+        print(line)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 부하 테스트 (엔드포인트별 처리량, p50/p95/p99)")
+    parser.add_argument("--base-url", help="실행 중인 서버 주소 (미지정 시 프로세스 안에서 호출)")
+    parser.add_argument("--requests", type=int, default=200, help="엔드포인트당 요청 수")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--only", help="엔드포인트 이름 부분 문자열 필터 (쉼표 구분)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--out", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", help="비교 기준 결과 JSON")
+    parser.add_argument("--max-regression", type=float, default=20.0, help="p95 허용 증가율(%%), 초과 시 종료 코드 1")
+    args = parser.parse_args()
+
+    scenario = load_scenario(get_storage(), args.seed)
+    endpoints = build_endpoints(scenario)
+    if args.only:
+        keys = [k.strip() for k in args.only.split(",")]
+        endpoints = [(n, f) for n, f in endpoints if any(k in n for k in keys)]
+
+    get = _http_client(args.base_url) if args.base_url else _inprocess_client()
+    print(f"[INFO] 데이터 {scenario['first_day']} ~ {scenario['last_day']}, {scenario['counts']}")
+    print(f"[INFO] 엔드포인트 {len(endpoints)}개 × {args.requests}회, 동시성 {args.concurrency}")
+
+    results = {}
+    for name, make_url in endpoints:
+        # 엔드포인트별로 난수 시드 고정 → --only 로 일부만 돌려도 같은 요청 목록
+        scenario["rng"].seed(f"{args.seed}:{name}")
+        results[name] = run_endpoint(get, make_url, args.requests, args.concurrency, args.warmup)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+    regressions = print_report(results, baseline, args.max_regression if baseline else None)
+
+    if args.out:
+        report = {
+            "meta": {
+                "commit": _git_commit(),
+                "created_at": datetime.now().isoformat(timespec="seconds"),
+                "storage": STORAGE_BACKEND,
+                "target": args.base_url or "in-process",
+                "requests": args.requests,
+                "concurrency": args.concurrency,
+                "seed": args.seed,
+                "python": platform.python_version(),
+                "data": {**scenario["counts"], "first_day": str(scenario["first_day"]),
+                         "last_day": str(scenario["last_day"])},
+            },
+            "results": results,
+        }
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"[OK] 결과 저장: {args.out}")
+
+    if regressions:
+        sys.exit(f"[ERROR] p95 회귀 {len(regressions)}개: {', '.join(regressions)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime
+
+from app.bench.loadtest import _git_commit, _http_client, build_endpoints, load_scenario, run_endpoint
+from app.storage import STORAGE_BACKEND, get_storage
+
+# 서빙 모드 비교 벤치마크: 동기(gunicorn run:app) vs 비동기(uvicorn app.asgi:app)
+#   같은 요청 목록을 동시성 단계별로 두 서버에 보내 처리량/지연 비교
+#   python -m app.bench.serving                                   # 두 서버를 직접 띄워서 (워커 수 지정)
+#   python -m app.bench.serving --sync-workers 2 --concurrency 1,8,32,64 --out serving.json
+#   python -m app.bench.serving --sync-url http://host:8000 --async-url http://host:8001   # 이미 실행 중인 서버
+DEFAULT_ENDPOINTS = "daily_ranking,monthly_ranking,range_ranking(7d),daily_stats,user_summary,rank_history"
+SERVER_START_TIMEOUT = 60
+
+
+def _server_commands(args):
+    sync = [sys.executable, "-m", "gunicorn", "run:app",
+            "-b", f"127.0.0.1:{args.port}", "-w", str(args.sync_workers), "--threads", str(args.sync_threads)]
+    asgi = [sys.executable, "-m", "uvicorn", "app.asgi:app",
+            "--port", str(args.port + 1), "--workers", str(args.async_workers), "--log-level", "warning"]
+    return {
+        "sync": (sync, f"http://127.0.0.1:{args.port}"),
+        "async": (asgi, f"http://127.0.0.1:{args.port + 1}"),
+    }
+
+
+def _wait_ready(base_url, proc):
+    deadline = time.time() + SERVER_START_TIMEOUT
+    while time.time() < deadline:
+        if proc is not None and proc.poll() is not None:
+            sys.exit(f"[ERROR] 서버 종료됨 (exit {proc.returncode}): {base_url}")
+        try:
+            with urllib.request.urlopen(base_url + "/healthz", timeout=2):
+                return
+        except (OSError, urllib.error.URLError):
+            time.sleep(0.5)
+    sys.exit(f"[ERROR] 서버 응답 없음: {base_url}")
+
+
+def run_mode(base_url, scenario, endpoints, levels, args):
+    """반환: {엔드포인트: {동시성: 결과}}"""
+    get = _http_client(base_url)
+    results = {}
+    for name, make_url in endpoints:
+        results[name] = {}
+        for concurrency in levels:
+            # 모드가 달라도 같은 요청 목록
+            scenario["rng"].seed(f"{args.seed}:{name}:{concurrency}")
+            results[name][concurrency] = run_endpoint(get, make_url, args.requests, concurrency, args.warmup)
+    return results
+
+
+def print_report(results, levels):
+    modes = list(results)
+    header = f"{'endpoint':<28}{'conc':>6}" + "".join(f"{m + ' rps':>12}{m + ' p95':>12}" for m in modes)
+    if len(modes) == 2:
+        header += f"{'rps x':>8}"
+    print(header)
+    print("-" * len(header))
+    for name in results[modes[0]]:
+        for concurrency in levels:
+            rows = [results[m][name][concurrency] for m in modes]
+            line = f"{name:<28}{concurrency:>6}" + "".join(f"{r['rps']:>12}{r['p95_ms']:>12.1f}" for r in rows)
+            if len(rows) == 2:
+                line += f"{rows[1]['rps'] / rows[0]['rps']:>8.2f}" if rows[0]["rps"] else f"{'-':>8}"
+            errors = sum(r["errors"] for r in rows)
+            if errors:
+                line += f"  [ERRORS {errors}]"
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동기(WSGI) / 비동기(ASGI) 서빙 모드 동시성별 처리량 비교")
+    parser.add_argument("--concurrency", default="1,8,32,64", help="동시성 단계 (쉼표 구분)")
+    parser.add_argument("--requests", type=int, default=200, help="엔드포인트 × 동시성 단계당 요청 수")
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--only", default=DEFAULT_ENDPOINTS, help="엔드포인트 이름 부분 문자열 필터 (쉼표 구분)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--port", type=int, default=8100, help="직접 띄울 때 동기 서버 포트 (비동기는 +1)")
+    parser.add_argument("--sync-workers", type=int, default=2, help="gunicorn 워커 수")
+    parser.add_argument("--sync-threads", type=int, default=1, help="gunicorn 워커당 스레드 수")
+    parser.add_argument("--async-workers", type=int, default=1, help="uvicorn 워커 수")
+    parser.add_argument("--sync-url", help="이미 실행 중인 동기 서버 (지정 시 직접 띄우지 않음)")
+    parser.add_argument("--async-url", help="이미 실행 중인 비동기 서버")
+    parser.add_argument("--out", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    levels = [int(c) for c in args.concurrency.split(",")]
+    scenario = load_scenario(get_storage(), args.seed)
+    keys = [k.strip() for k in args.only.split(",")]
+    endpoints = [(n, f) for n, f in build_endpoints(scenario) if any(k in n for k in keys)]
+    print(f"[INFO] 데이터 {scenario['first_day']} ~ {scenario['last_day']}, {scenario['counts']}")
+    print(f"[INFO] 엔드포인트 {len(endpoints)}개 × 동시성 {levels} × {args.requests}회")
+
+    commands = _server_commands(args)
+    urls = {"sync": args.sync_url, "async": args.async_url}
+    results = {}
+    for mode, (command, default_url) in commands.items():
+        base_url = urls[mode] or default_url
+        proc = None
+        if not urls[mode]:
+            print(f"[INFO] {mode} 서버 시작: {' '.join(command[1:])}")
+            proc = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+        try:
+            _wait_ready(base_url, proc)
+            results[mode] = run_mode(base_url, scenario, endpoints, levels, args)
+        finally:
+            if proc is not None:
+                proc.terminate()
+                proc.wait(timeout=30)
+
+    print_report(results, levels)
+
+    if args.out:
+        report = {
+            "meta": {
+                "commit": _git_commit(),
+                "created_at": datetime.now().isoformat(timespec="seconds"),
+                "storage": STORAGE_BACKEND,
+                "sync": args.sync_url or f"gunicorn -w {args.sync_workers} --threads {args.sync_threads}",
+                "async": args.async_url or f"uvicorn --workers {args.async_workers}",
+                "requests": args.requests,
+                "concurrency": levels,
+                "seed": args.seed,
+                "python": platform.python_version(),
+            },
+            "results": results,
+        }
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"[OK] 결과 저장: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+import json
+import os
+import subprocess
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timedelta
+
+from app.crawler.events import parse_event
+from app.storage import get_storage
+
+# 크롤링 실행 상태 / 진행 이벤트 (DB: crawl_runs / crawl_events)
+#   /run-crawler 가 띄운 자식 프로세스 stdout 의 이벤트 줄 → DB → /api/crawl/status (폴링), /api/crawl/events (SSE)
+#   워커 프로세스가 여러 개여도 어느 워커에서든 같은 상태를 읽음
+#   실행 중 여부도 DB 기준 — 다른 워커에서 실행 중이면 새 실행 거부
+CRAWL_KEEP_RUNS = int(os.getenv("CRAWL_KEEP_RUNS", "10"))          # 이벤트를 남겨 둘 최근 실행 수
+CRAWL_STALE_SEC = int(os.getenv("CRAWL_STALE_SEC", "900"))         # 이 시간 동안 이벤트가 없으면 중단된 실행으로 처리
+CRAWL_EVENT_POLL_SEC = float(os.getenv("CRAWL_EVENT_POLL_SEC", "1"))
+SSE_HEARTBEAT_SEC = 15
+LOG_TAIL_LINES = 10
+
+
+def _stale_before(now):
+    return now - timedelta(seconds=CRAWL_STALE_SEC)
+
+
+def run_status(run_id=None, after_id=0, limit=200):
+    """
+    실행 상태 + after_id 이후 이벤트 (run_id 미지정 시 가장 최근 실행). 실행 기록이 없으면 None
+    조회 전용 (폴링/SSE 마다 호출) — CRAWL_STALE_SEC 동안 heartbeat 가 없는 running 은 error 로 보여 주고
+    DB 기록 정리는 다음 실행 시작(start_crawl_run) 때
+    """
+    storage = get_storage()
+    storage.prepare_schema()
+    # 진행 중인 실행을 따라가므로 복제 지연 없이 주 DB 에서
+    with storage.cursor(readonly=True, max_lag=0) as cur:
+        run = storage.crawl_run(cur, run_id)
+        if run is None:
+            return None
+        run_id, status, started_at, heartbeat_at, finished_at, summary = run
+        events = storage.crawl_events(cur, run_id, after_id, limit)
+    if status == "running" and heartbeat_at < _stale_before(datetime.now()):
+        status, summary = "error", {"status": "error", "error": "heartbeat lost"}
+    return {
+        "run_id": run_id,
+        "status": status,
+        "started_at": str(started_at),
+        "heartbeat_at": str(heartbeat_at),
+        "finished_at": str(finished_at) if finished_at else None,
+        "summary": summary,
+        "events": [{"id": event_id, "event": event, "data": data} for event_id, event, data in events],
+        "last_event_id": events[-1][0] if events else after_id,
+    }
+
+
+def _format_sse(event_id, event, data):
+    return f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+def stream_events(last_id=0):
+    """
+    SSE 본문 생성기 (가장 최근 실행). DB 를 CRAWL_EVENT_POLL_SEC 간격으로 읽어 요약(summary) 이벤트까지 보내면 종료.
+    실행 중이 아니면 남은 이벤트만 보내고 바로 종료.
+    자동화(워크플로)는 연결을 오래 잡는 이 스트림 대신 /api/crawl/status 폴링 사용
+    """
+    yield "retry: 3000\n\n"
+    idle = 0.0
+    while True:
+        state = run_status(after_id=last_id)
+        if state is None:
+            return
+        for e in state["events"]:
+            yield _format_sse(e["id"], e["event"], {"run_id": state["run_id"], **e["data"]})
+            last_id = e["id"]
+        if state["status"] != "running":
+            if state["summary"] is not None:
+                yield _format_sse(last_id, "summary", {"run_id": state["run_id"], **state["summary"]})
+            return
+        if state["events"]:
+            idle = 0.0
+        elif idle >= SSE_HEARTBEAT_SEC:
+            yield ": keep-alive\n\n"
+            idle = 0.0
+        time.sleep(CRAWL_EVENT_POLL_SEC)
+        idle += CRAWL_EVENT_POLL_SEC
+
+
+def _publish(run_id, event, data):
+    try:
+        get_storage().add_crawl_event(run_id, event, data, datetime.now())
+    except Exception as e:
+        # 진행 이벤트 기록 실패로 크롤링을 멈추지는 않음
+        print(f"[WARN] 크롤링 이벤트 저장 실패 ({event}): {e}")
+
+
+def _run_crawler(run_id):
+    started_at = time.time()
+    totals = {}
+    errors = 0
+    log_tail = deque(maxlen=LOG_TAIL_LINES)
+    returncode = None
+    try:
+        proc = subprocess.Popen(
+            ["python", "-m", "app.crawler.cli"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            env={**os.environ, "PYTHONUNBUFFERED": "1"},
+        )
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            parsed = parse_event(line)
+            if parsed is None:
+                print(line)
+                log_tail.append(line)
+                continue
+            event, data = parsed
+            if event == "crawl_done":
+                totals = data
+            elif event == "error":
+                errors += 1
+            _publish(run_id, event, data)
+        returncode = proc.wait()
+        if returncode != 0:
+            print("[ERROR] Crawler 실패:", "\n".join(log_tail))
+    except Exception as e:
+        print("[ERROR] Crawler 실행 실패:", e)
+        log_tail.append(str(e))
+        errors += 1
+
+    summary = {
+        "status": "ok" if returncode == 0 else "error",
+        "returncode": returncode,
+        "errors": errors,
+        "elapsed_sec": round(time.time() - started_at, 2),
+        **totals,
+    }
+    if returncode != 0:
+        summary["log_tail"] = list(log_tail)
+    try:
+        get_storage().finish_crawl_run(run_id, summary, datetime.now())
+    except Exception as e:
+        # 기록하지 못하면 CRAWL_STALE_SEC 뒤 error 로 정리됨
+        print(f"[ERROR] 크롤링 결과 저장 실패: {e}")
+
+
+def start_crawl():
+    # 백그라운드 크롤링 시작. 이미 (어느 워커에서든) 실행 중이면 None
+    run_id = uuid.uuid4().hex[:12]
+    now = datetime.now()
+    if not get_storage().start_crawl_run(run_id, now, _stale_before(now), CRAWL_KEEP_RUNS):
+        return None
+    _publish(run_id, "started", {})
+    threading.Thread(target=_run_crawler, args=(run_id,), daemon=True).start()
+    return run_id
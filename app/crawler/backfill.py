@@ -0,0 +1,227 @@
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.crawler.events import emit
+from app.crawler.service import PostFetchError, parse_list_page, parse_post
+from app.storage import get_storage
+
+# 과거 기록 백필 (체크포인트 + 병렬 샤드)
+#   python -m app.crawler.cli backfill pan_setkacup:pages:9-400 pan_ccy:posts:120000-125000
+#   - 범위를 샤드로 나눠 워커 스레드가 병렬 처리, 요청 속도는 전체 합산 --rate 이하로 제한
+#   - 단위 작업(리스트 1페이지 / 게시물 --batch 개)마다 샤드별 체크포인트 저장 → 재실행 시 이어서
+#   - 저장만 하고 집계는 마지막에 rebuild_stats 한 번
+#   - 게시물 요청 실패는 FETCH_RETRIES 번 재시도, 그래도 실패하면 crawl_failed_posts 에 남기고 진행
+#     → 같은 작업을 다시 실행하면 남은 실패 게시물부터 다시 시도 (체크포인트를 넘겨도 유실 없음)
+#   pages 범위는 새 글이 올라오면 밀리므로, 긴 작업은 posts(게시물 번호) 범위가 안정적
+MODES = ("pages", "posts")
+FETCH_RETRIES = 3
+RETRY_BACKOFF_SEC = 2.0
+
+
+class RateLimiter:
+    """모든 워커가 공유하는 요청 간격 제한 (초당 rate 회)"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_at = time.monotonic()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_at)
+            self._next_at = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def parse_spec(spec):
+    # 'slug:mode:start-end' → (slug, mode, start, end)
+    try:
+        slug, mode, span = spec.split(":")
+        start, end = (int(v) for v in span.split("-"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"형식: slug:pages|posts:start-end ({spec})")
+    if mode not in MODES or start > end or start < 1:
+        raise argparse.ArgumentTypeError(f"잘못된 범위: {spec}")
+    return slug, mode, start, end
+
+
+def split_shards(start, end, n_shards):
+    # [start, end] 를 연속 구간 n개로 분할 (빈 샤드 없음)
+    total = end - start + 1
+    n_shards = max(1, min(n_shards, total))
+    size, extra = divmod(total, n_shards)
+    shards = []
+    lo = start
+    for i in range(n_shards):
+        hi = lo + size + (1 if i < extra else 0) - 1
+        shards.append((lo, hi))
+        lo = hi + 1
+    return shards
+
+
+class Backfill:
+    def __init__(self, storage, limiter, batch):
+        self.storage = storage
+        self.limiter = limiter
+        self.batch = batch
+        self._write_lock = threading.Lock()  # 저장은 직렬화 (SQLite 동시 쓰기 잠금 회피)
+        self.totals = {"units": 0, "posts_parsed": 0, "posts_inserted": 0, "records_inserted": 0,
+                       "posts_failed": 0, "posts_recovered": 0}
+        self._totals_lock = threading.Lock()
+
+    def _fetch_post(self, slug, pid):
+        # 요청 실패만 재시도 (없는 게시물 / 진행 중 / 기록 없음은 [] 로 바로 반환)
+        for attempt in range(1, FETCH_RETRIES + 1):
+            self.limiter.wait()
+            try:
+                return parse_post(str(pid), slug, strict=True)
+            except PostFetchError:
+                if attempt == FETCH_RETRIES:
+                    raise
+                time.sleep(RETRY_BACKOFF_SEC * attempt)
+
+    def _fetch_posts(self, job_key, slug, post_ids):
+        # 반환: ({post_id: records}, 받지 못한 게시물 수) — 실패는 crawl_failed_posts 에 기록
+        posts_records = {}
+        failed = 0
+        for pid in post_ids:
+            try:
+                recs = self._fetch_post(slug, pid)
+            except PostFetchError as e:
+                self.storage.record_failed_post(job_key, slug, pid, str(e))
+                emit("post_failed", job=job_key, slug=slug, post_id=int(pid), message=str(e))
+                failed += 1
+                continue
+            if recs:
+                posts_records[str(pid)] = recs
+        return posts_records, failed
+
+    def _save(self, posts_records):
+        result = {"posts": 0, "records": 0}
+        if posts_records:
+            with self._write_lock:
+                result = self.storage.insert_records(posts_records, aggregate=False)
+        return result
+
+    def _run_unit(self, job_key, slug, mode, value, shard_end):
+        # 단위 작업 1개 처리 → 다음 시작 값 반환
+        if mode == "pages":
+            self.limiter.wait()
+            post_ids = parse_list_page(value, slug)
+            next_value = value + 1
+        else:
+            next_value = min(value + self.batch, shard_end + 1)
+            post_ids = range(value, next_value)
+
+        posts_records, failed = self._fetch_posts(job_key, slug, post_ids)
+        result = self._save(posts_records)
+
+        with self._totals_lock:
+            self.totals["units"] += 1
+            self.totals["posts_parsed"] += len(posts_records)
+            self.totals["posts_inserted"] += result["posts"]
+            self.totals["records_inserted"] += result["records"]
+            self.totals["posts_failed"] += failed
+        return next_value
+
+    def retry_failed(self, job_key):
+        """이전 실행에서 받지 못한 게시물 다시 시도 — 성공하면 저장 후 실패 기록 삭제"""
+        failed = self.storage.load_failed_posts(job_key)
+        if not failed:
+            return
+        print(f"[INFO] 백필 {job_key}: 이전 실행 실패 게시물 {len(failed)}개 재시도")
+        for slug, pid, attempts in failed:
+            try:
+                recs = self._fetch_post(slug, pid)
+            except PostFetchError as e:
+                self.storage.record_failed_post(job_key, slug, pid, str(e))
+                print(f"[WARN] 재시도 실패 ({attempts + 1}회째) → {slug} #{pid}: {e}")
+                with self._totals_lock:
+                    self.totals["posts_failed"] += 1
+                continue
+            result = self._save({str(pid): recs} if recs else {})
+            self.storage.clear_failed_post(job_key, slug, pid)
+            with self._totals_lock:
+                self.totals["posts_recovered"] += 1
+                self.totals["posts_parsed"] += 1 if recs else 0
+                self.totals["posts_inserted"] += result["posts"]
+                self.totals["records_inserted"] += result["records"]
+
+    def run_shard(self, job_key, shard_no, slug, mode, start, end, next_value):
+        emit("shard_started", job=job_key, shard=shard_no, start=start, end=end, resume_from=next_value)
+        value = next_value
+        while value <= end:
+            try:
+                value = self._run_unit(job_key, slug, mode, value, end)
+            except Exception as e:
+                print(f"[ERROR] 백필 실패 → {job_key} shard={shard_no} at={value}: {e}")
+                emit("error", job=job_key, shard=shard_no, at=value, message=str(e))
+                raise
+            # 저장(+ 실패 게시물 기록) 후 체크포인트 — 그 사이 중단되면 같은 단위를 다시 처리 (중복 게시물은 건너뜀)
+            self.storage.save_checkpoint(job_key, shard_no, start, end, value, done=value > end)
+        emit("shard_done", job=job_key, shard=shard_no)
+
+
+def run_backfill(specs, shards=4, workers=4, rate=5.0, batch=20, rebuild=True):
+    """
+    specs: [(slug, mode, start, end), ...]
+    샤드 중 하나라도 실패하면 집계 없이 예외 — 재실행 시 체크포인트부터 이어서 처리
+    """
+    storage = get_storage()
+    backfill = Backfill(storage, RateLimiter(rate), batch)
+    started = time.time()
+
+    tasks = []
+    job_keys = []
+    for slug, mode, start, end in specs:
+        # 샤드 구성이 같아야 체크포인트를 이어 쓸 수 있으므로 job_key 에 샤드 수 포함
+        job_key = f"{slug}:{mode}:{start}-{end}/{shards}"
+        job_keys.append(job_key)
+        saved = storage.load_checkpoints(job_key)
+        for shard_no, (lo, hi) in enumerate(split_shards(start, end, shards)):
+            _, _, next_value, done = saved.get(shard_no, (lo, hi, lo, False))
+            if done:
+                continue
+            tasks.append((job_key, shard_no, slug, mode, lo, hi, next_value))
+        print(f"[INFO] 백필 {job_key}: 남은 샤드 {sum(t[0] == job_key for t in tasks)}개")
+
+    # 이전 실행에서 받지 못한 게시물부터 (샤드가 모두 끝난 작업도 포함)
+    for job_key in job_keys:
+        backfill.retry_failed(job_key)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(backfill.run_shard, *task) for task in tasks]
+        errors = [f.exception() for f in futures if f.exception()]
+    if errors:
+        raise RuntimeError(f"{len(errors)}개 샤드 실패 (재실행 시 체크포인트부터 재개): {errors[0]}")
+
+    # 이전 실행에서 저장만 하고 중단된 분량도 있으므로 처리한 샤드(또는 복구한 게시물)가 있으면 재계산
+    if rebuild and (tasks or backfill.totals["posts_recovered"]):
+        print("[INFO] 파생 통계 재계산 중...")
+        storage.rebuild_stats()
+        emit("aggregation_done", rebuild=True)
+
+    elapsed = time.time() - started
+    print(f"[OK] 백필 완료 (총 소요: {elapsed:.2f}초) {backfill.totals}")
+    if backfill.totals["posts_failed"]:
+        print(f"[WARN] 받지 못한 게시물 {backfill.totals['posts_failed']}개 — 같은 명령을 다시 실행하면 재시도")
+    emit("backfill_done", elapsed_sec=round(elapsed, 2), **backfill.totals)
+    return backfill.totals
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m app.crawler.cli backfill",
+                                     description="과거 페이지/게시물 범위 백필 (체크포인트로 재개 가능)")
+    parser.add_argument("specs", nargs="+", type=parse_spec, metavar="slug:pages|posts:start-end")
+    parser.add_argument("--shards", type=int, default=4, help="범위당 샤드 수 (재개 시 동일해야 함)")
+    parser.add_argument("--workers", type=int, default=4, help="동시 처리 샤드 수")
+    parser.add_argument("--rate", type=float, default=5.0, help="전체 초당 요청 수 상한")
+    parser.add_argument("--batch", type=int, default=20, help="posts 모드 체크포인트 단위 (게시물 수)")
+    parser.add_argument("--no-rebuild", action="store_true", help="마지막 통계 재계산 생략")
+    args = parser.parse_args(argv)
+
+    run_backfill(args.specs, args.shards, args.workers, args.rate, args.batch, not args.no_rebuild)
@@ -1,6 +1,10 @@
 import os
+import sys
 import time
-from app.crawler.service import parse_list_page, parse_post, insert_records
+from app.crawler.events import emit
+from app.crawler.service import (parse_list_page, parse_post, insert_records, rebuild_stats, compact_old_months,
+                                 refresh_ranks)
+from app.snapshots import publish_snapshots
 
 def _get_slugs():
     raw = os.getenv("SLUGS", "pan_setkacup")
@@ -8,29 +12,100 @@ def _get_slugs():
 
 def main():
     start_time = time.time()
+    totals = {"pages": 0, "posts_parsed": 0, "posts_inserted": 0, "records_inserted": 0}
+    # 순위는 페이지마다가 아니라 크롤링 끝에 영향받은 기간만 한 번 계산
+    #   페이지별 수집은 바로 커밋되므로 중간에 실패해도 이미 저장된 기간의 순위는 계산
+    rank_dates, rank_months = set(), set()
 
-    for slug in _get_slugs():
-        print(f"[INFO] 게시판 시작: {slug}")
-        for page in range(1, 9):
-            print(f"크롤링 중: 게시판 페이지 {page}")
-            post_ids = parse_list_page(page, slug)
+    try:
+        for slug in _get_slugs():
+            print(f"[INFO] 게시판 시작: {slug}")
+            emit("slug_started", slug=slug)
+            for page in range(1, 9):
+                print(f"크롤링 중: 게시판 페이지 {page}")
+                try:
+                    post_ids = parse_list_page(page, slug)
+                except Exception as e:
+                    emit("error", slug=slug, page=page, message=str(e))
+                    raise
+                totals["pages"] += 1
+                emit("page_fetched", slug=slug, page=page, posts=len(post_ids))
 
-            posts_records = {}
-            for pid in post_ids:
-                recs = parse_post(pid, slug)
-                if recs:
-                    posts_records[pid] = recs
-                print(f"[{slug} #{pid}] 파싱된 레코드 수: {len(recs)}")
-                time.sleep(0.2)
+                posts_records = {}
+                for pid in post_ids:
+                    recs = parse_post(pid, slug)
+                    if recs:
+                        posts_records[pid] = recs
+                    print(f"[{slug} #{pid}] 파싱된 레코드 수: {len(recs)}")
+                    time.sleep(0.2)
+                totals["posts_parsed"] += len(posts_records)
+                emit("posts_parsed", slug=slug, page=page, posts=len(posts_records),
+                     records=sum(len(r) for r in posts_records.values()))
 
-            if posts_records:
-                insert_records(posts_records)
+                if posts_records:
+                    try:
+                        result = insert_records(posts_records, rank=False)
+                    except Exception as e:
+                        emit("error", slug=slug, page=page, message=str(e))
+                        raise
+                    totals["posts_inserted"] += result["posts"]
+                    totals["records_inserted"] += result["records"]
+                    rank_dates |= result["periods"][0]
+                    rank_months |= result["periods"][1]
+                    emit("records_inserted", slug=slug, page=page,
+                         posts=result["posts"], records=result["records"])
+                    emit("aggregation_done", slug=slug, page=page, stat_dates=result["stat_dates"],
+                         stat_months=result["stat_months"], users=result["users"])
 
-            time.sleep(0.8)
-        print(f"[OK] 게시판 완료: {slug}")
+                time.sleep(0.8)
+            print(f"[OK] 게시판 완료: {slug}")
+            emit("slug_done", slug=slug)
+    except BaseException:
+        # 순위 계산 실패가 원래 수집 오류를 가리지 않도록 기록만 하고 원래 오류를 다시 발생
+        try:
+            _refresh_ranks(rank_dates, rank_months)
+        except Exception as e:
+            print(f"[ERROR] 순위 계산 실패: {e}")
+            emit("error", message=f"rank refresh failed: {e}")
+        raise
+    _refresh_ranks(rank_dates, rank_months)
+
+    for r in compact_old_months():
+        print(f"[INFO] 보존 기간 정리: {str(r['month'])[:7]} (게시물 {r['posts']}, 기록 {r['records']})")
+        emit("month_compacted", month=str(r["month"])[:7], posts=r["posts"], records=r["records"])
+
+    _publish_snapshots()
 
     elapsed = time.time() - start_time
     print(f"크롤링 및 DB 저장 완료 (총 소요: {elapsed:.2f}초)")
+    emit("crawl_done", elapsed_sec=round(elapsed, 2), **totals)
+
+def _refresh_ranks(rank_dates, rank_months):
+    if rank_dates or rank_months:
+        refresh_ranks(rank_dates, rank_months)
+        emit("ranks_updated", stat_dates=len(rank_dates), stat_months=len(rank_months))
+
+def _publish_snapshots():
+    # 랭킹 페이지 기본 화면 스냅샷 — 실패해도 수집 결과는 이미 저장됐으므로 크롤링은 성공 처리
+    try:
+        manifest = publish_snapshots()
+    except Exception as e:
+        print(f"[WARN] 랭킹 스냅샷 발행 실패: {e}")
+        emit("error", message=f"snapshot publish failed: {e}")
+        return
+    emit("snapshots_published", scopes=len(manifest["files"]))
 
 if __name__ == "__main__":
-    main()
+    # python -m app.crawler.cli rebuild → 파생 통계 전체 재계산
+    # python -m app.crawler.cli backfill slug:pages|posts:start-end ... → 과거 범위 백필
+    # python -m app.crawler.cli snapshots → 랭킹 스냅샷만 다시 발행
+    if sys.argv[1:] == ["rebuild"]:
+        rebuild_stats()
+        _publish_snapshots()
+    elif sys.argv[1:] == ["snapshots"]:
+        _publish_snapshots()
+    elif sys.argv[1:2] == ["backfill"]:
+        from app.crawler.backfill import main as backfill_main
+        backfill_main(sys.argv[2:])
+    else:
+        main()
@@ -0,0 +1,20 @@
+import json
+
+# 크롤러(자식 프로세스) → 웹 프로세스 진행 이벤트
+#   stdout 에 접두어 + JSON 한 줄로 출력하고, /run-crawler 쪽에서 줄 단위로 읽어 SSE 로 전달
+EVENT_PREFIX = "@@crawl-event "
+
+
+def emit(event, **data):
+    print(EVENT_PREFIX + json.dumps({"event": event, **data}, ensure_ascii=False, default=str), flush=True)
+
+
+def parse_event(line):
+    # 이벤트 줄이 아니면 None
+    if not line.startswith(EVENT_PREFIX):
+        return None
+    try:
+        payload = json.loads(line[len(EVENT_PREFIX):])
+    except ValueError:
+        return None
+    return payload.pop("event", "message"), payload
@@ -3,7 +3,7 @@ from bs4 import BeautifulSoup
 import re
 import calendar
 from datetime import datetime, timedelta
-from app.database import get_connection
+from app.storage import RETENTION_MONTHS, get_storage
 
 BASE_LIST_URL = "https://ygosu.com/board/{slug}/?s_wato=Y&page={page}"
 BASE_POST_URL = "https://ygosu.com/board/{slug}/{post_id}"
@@ -125,13 +125,24 @@ def _collect_apply_rows(soup: BeautifulSoup, anchor_dt: datetime):
     return records, latest_apply_dt
 
 
-def parse_post(post_id: str, slug: str):
+class PostFetchError(Exception):
+    """게시물 요청 실패 (네트워크 오류 / 5xx 등) — 없는 게시물(404)과 구분"""
+
+
+def parse_post(post_id: str, slug: str, strict: bool = False):
+    """
+    게시물 1개의 배팅 기록 파싱 (종료되지 않았거나 기록이 없으면 []).
+    strict=True 면 요청 실패 시 [] 대신 PostFetchError — 백필은 받지 못한 게시물을 건너뛰면 안 됨
+    """
     url = BASE_POST_URL.format(slug=slug, post_id=post_id)
     try:
         res = requests.get(url, timeout=10)
         res.raise_for_status()
     except Exception as e:
         print(f"[에러] 게시물 요청 실패 → slug={slug}, post_id={post_id}, error={e}")
+        missing = isinstance(e, requests.HTTPError) and e.response is not None and e.response.status_code == 404
+        if strict and not missing:
+            raise PostFetchError(str(e)) from e
         return []
 
     soup = BeautifulSoup(res.text, "html.parser")
@@ -196,188 +207,23 @@ def parse_post(post_id: str, slug: str):
     return records_final
 
 
-def get_or_create_user(cur, nickname, cache=None):
-    if cache is not None and nickname in cache:
-        return cache[nickname]
-
-    cur.execute("INSERT INTO users (nickname) VALUES (%s) ON CONFLICT (nickname) DO NOTHING;", (nickname,))
-    cur.execute("SELECT id FROM users WHERE nickname = %s", (nickname,))
-    user_id = cur.fetchone()[0]
-
-    if cache is not None:
-        cache[nickname] = user_id
-    return user_id
-
-
-def get_or_create_board(cur, slug, cache=None):
-    if cache is not None and slug in cache:
-        return cache[slug]
-
-    cur.execute("INSERT INTO boards (slug, name) VALUES (%s, %s) ON CONFLICT (slug) DO NOTHING;", (slug, slug))
-    cur.execute("SELECT id FROM boards WHERE slug = %s", (slug,))
-    board_id = cur.fetchone()[0]
-
-    if cache is not None:
-        cache[slug] = board_id
-    return board_id
-
-
-def update_daily_stats(cur):
-    # deadline_date 기준 05:00 컷오프
-    cur.execute("""
-        WITH per_post_all AS (
-            SELECT
-                CASE
-                    WHEN EXTRACT(HOUR FROM deadline_date) < 5
-                    THEN (deadline_date - INTERVAL '1 day')::DATE
-                    ELSE deadline_date::DATE
-                END AS d,
-                user_id,
-                board_id,
-                SUM(profit) AS net_profit
-            FROM betting_stats
-            GROUP BY d, user_id, board_id
-        ),
-        per_post_single AS (
-            SELECT
-                CASE
-                    WHEN EXTRACT(HOUR FROM deadline_date) < 5
-                    THEN (deadline_date - INTERVAL '1 day')::DATE
-                    ELSE deadline_date::DATE
-                END AS d,
-                user_id,
-                board_id,
-                post_id,
-                MAX(bet_amount) AS amount_one_side,
-                CASE WHEN SUM(profit) > 0 THEN 1 ELSE 0 END AS post_win
-            FROM betting_stats
-            GROUP BY d, user_id, board_id, post_id
-            HAVING COUNT(DISTINCT bet_side) = 1
-        ),
-        per_day AS (
-            SELECT
-                a.d AS stat_date,
-                a.user_id,
-                a.board_id,
-                COUNT(s.post_id) AS total_bets,
-                COALESCE(SUM(s.amount_one_side), 0) AS total_amount,
-                a.net_profit AS total_profit,
-                COALESCE(SUM(s.post_win), 0) AS wins
-            FROM per_post_all a
-            LEFT JOIN per_post_single s
-            ON a.d = s.d AND a.user_id = s.user_id AND a.board_id = s.board_id
-            GROUP BY a.d, a.user_id, a.board_id, a.net_profit
-        )
-        INSERT INTO daily_betting_stats (stat_date, user_id, board_id, total_bets, total_amount, total_profit, wins, created_at)
-        SELECT stat_date, user_id, board_id, total_bets, total_amount, total_profit, wins, NOW()
-        FROM per_day
-        ON CONFLICT (stat_date, user_id, board_id)
-        DO UPDATE SET
-            total_bets   = EXCLUDED.total_bets,
-            total_amount = EXCLUDED.total_amount,
-            total_profit = EXCLUDED.total_profit,
-            wins         = EXCLUDED.wins,
-            created_at   = NOW();
-    """)
-
-
-def update_monthly_stats(cur):
-    # deadline_date 기준 월 집계 (05:00 컷오프 보정 포함)
-    cur.execute("""
-        WITH per_post_all AS (
-            SELECT
-                CASE
-                    WHEN EXTRACT(HOUR FROM deadline_date) < 5
-                    THEN DATE_TRUNC('month', deadline_date - INTERVAL '1 day')::DATE
-                    ELSE DATE_TRUNC('month', deadline_date)::DATE
-                END AS m,
-                user_id,
-                board_id,
-                SUM(profit) AS net_profit
-            FROM betting_stats
-            GROUP BY m, user_id, board_id
-        ),
-        per_post_single AS (
-            SELECT
-                CASE
-                    WHEN EXTRACT(HOUR FROM deadline_date) < 5
-                    THEN DATE_TRUNC('month', deadline_date - INTERVAL '1 day')::DATE
-                    ELSE DATE_TRUNC('month', deadline_date)::DATE
-                END AS m,
-                user_id,
-                board_id,
-                post_id,
-                MAX(bet_amount) AS amount_one_side,
-                CASE WHEN SUM(profit) > 0 THEN 1 ELSE 0 END AS post_win
-            FROM betting_stats
-            GROUP BY m, user_id, board_id, post_id
-            HAVING COUNT(DISTINCT bet_side) = 1
-        ),
-        per_month AS (
-            SELECT
-                a.m AS stat_month,
-                a.user_id,
-                a.board_id,
-                COUNT(s.post_id) AS total_bets,
-                COALESCE(SUM(s.amount_one_side), 0) AS total_amount,
-                a.net_profit AS total_profit,
-                COALESCE(SUM(s.post_win), 0) AS wins
-            FROM per_post_all a
-            LEFT JOIN per_post_single s
-            ON a.m = s.m AND a.user_id = s.user_id AND a.board_id = s.board_id
-            GROUP BY a.m, a.user_id, a.board_id, a.net_profit
-        )
-        INSERT INTO monthly_betting_stats (stat_month, user_id, board_id, total_bets, total_amount, total_profit, wins, created_at)
-        SELECT stat_month, user_id, board_id, total_bets, total_amount, total_profit, wins, NOW()
-        FROM per_month
-        ON CONFLICT (stat_month, user_id, board_id)
-        DO UPDATE SET
-            total_bets   = EXCLUDED.total_bets,
-            total_amount = EXCLUDED.total_amount,
-            total_profit = EXCLUDED.total_profit,
-            wins         = EXCLUDED.wins,
-            created_at   = NOW();
-    """)
-
-
-def insert_records(posts_records):
-    conn = get_connection()
-    cur = conn.cursor()
-
-    user_cache = {}
-    board_cache = {}
-
-    for post_id, records in posts_records.items():
-        if not records:
-            continue
+def insert_records(posts_records, rank=True):
+    # 저장/집계는 저장소 백엔드(STORAGE_BACKEND)에 위임
+    return get_storage().insert_records(posts_records, rank=rank)
 
-        # 게시판별 중복 체크: (board_id, post_id)
-        first_slug = records[0]["slug"]
-        board_id_for_check = get_or_create_board(cur, first_slug, board_cache)
-        cur.execute(
-            "SELECT 1 FROM betting_stats WHERE board_id = %s AND post_id = %s LIMIT 1;",
-            (board_id_for_check, post_id),
-        )
-        if cur.fetchone():
-            continue
 
-        for r in records:
-            user_id = get_or_create_user(cur, r["nickname"], user_cache)
-            board_id = get_or_create_board(cur, r["slug"], board_cache)
-
-            cur.execute("""
-                INSERT INTO betting_stats 
-                (post_id, deadline_date, user_id, board_id, bet_side, bet_amount, payout_amount, created_at)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, NOW())
-                ON CONFLICT (user_id, board_id, post_id, bet_side) DO NOTHING;
-            """, (
-                r["post_id"], r["deadline_at"], user_id, board_id,
-                r["bet_side"], r["bet_amount"], r["payout_amount"]
-            ))
-
-    update_daily_stats(cur)
-    update_monthly_stats(cur)
-
-    conn.commit()
-    cur.close()
-    conn.close()
+def refresh_ranks(stat_dates, stat_months):
+    # insert_records(rank=False) 로 모은 기간의 순위를 한 번에 계산
+    get_storage().refresh_ranks(stat_dates, stat_months)
+
+
+def rebuild_stats():
+    # 파생 통계 전체 재계산 (스키마 추가 직후 기존 데이터 채우기용)
+    get_storage().rebuild_stats()
+
+
+def compact_old_months():
+    # 보존 기간(RETENTION_MONTHS)이 지난 달의 원본 기록 정리, 반환: 정리한 달 목록
+    if RETENTION_MONTHS <= 0:
+        return []
+    return get_storage().compact_old_months(RETENTION_MONTHS)
@@ -1,12 +1,13 @@
-import psycopg2
+import itertools
 import os
-from dotenv import load_dotenv
-from pathlib import Path
+import threading
+import time
+from contextlib import asynccontextmanager
+from config import load_env
 
 
-# .env 파일 불러오기
-env_path = Path(__file__).resolve().parent.parent / ".env"
-load_dotenv(dotenv_path=env_path)
+# .env 파일 불러오기 (config.py 에서 한 번만 로딩)
+load_env()
 
 # 로컬용
 # DB_CONFIG = {
@@ -26,5 +27,270 @@ DB_CONFIG = {
     "port": int(os.getenv("DB_PORT", 5432)),  # 문자열이므로 int로 변환 필요
 }
 
-def get_connection():
-    return psycopg2.connect(**DB_CONFIG)
+# 주 DB 를 DSN 으로 지정할 수도 있음 (DB_CONFIG 대신)
+DB_PRIMARY_DSN = os.getenv("DB_PRIMARY_DSN")
+# 읽기 전용 복제본 (쉼표 구분 DSN). 비어 있으면 모든 조회도 주 DB 로
+DB_REPLICA_DSNS = [d.strip() for d in os.getenv("DB_REPLICA_DSNS", "").split(",") if d.strip()]
+
+DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", 1))
+DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", 10))
+DB_REPLICA_CHECK_SEC = float(os.getenv("DB_REPLICA_CHECK_SEC", 5))   # 복제본 상태/지연 확인 주기
+DB_REPLICA_MAX_LAG = float(os.getenv("DB_REPLICA_MAX_LAG", 30))      # 이보다 뒤처진 복제본은 사용 안 함
+
+# psycopg2 는 첫 연결 시점에 import (웹 앱 콜드 스타트에서 제외)
+_pools = {}
+_pool_lock = threading.Lock()
+
+
+def _connect_args(target):
+    if target == "primary":
+        return {"dsn": DB_PRIMARY_DSN} if DB_PRIMARY_DSN else DB_CONFIG
+    return {"dsn": DB_REPLICA_DSNS[int(target[len("replica"):])]}
+
+
+def _get_pool(target="primary"):
+    pool = _pools.get(target)
+    if pool is None:
+        with _pool_lock:
+            pool = _pools.get(target)
+            if pool is None:
+                from psycopg2.pool import ThreadedConnectionPool
+                pool = _pools[target] = ThreadedConnectionPool(DB_POOL_MIN, DB_POOL_MAX, **_connect_args(target))
+    return pool
+
+
+class _PooledConnection:
+    """
+    psycopg2 커넥션 래퍼.
+    close() 를 호출하면 실제로 끊지 않고 풀에 반납한다 (기존 호출부 그대로 사용 가능).
+    """
+
+    def __init__(self, pool, conn, target="primary"):
+        self._pool = pool
+        self._conn = conn
+        self.target = target
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def close(self):
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            if not conn.closed:
+                conn.rollback()  # 커밋 안 된 트랜잭션은 버리고 반납
+        finally:
+            self._pool.putconn(conn, close=bool(conn.closed))
+
+
+def _connect(target):
+    from psycopg2 import connect
+    from psycopg2.pool import PoolError
+
+    pool = _get_pool(target)
+    try:
+        return _PooledConnection(pool, pool.getconn(), target)
+    except PoolError:
+        # 풀이 가득 찬 경우 단발성 연결로 대체
+        return connect(**_connect_args(target))
+
+
+# ---------------------------------------------------------------------
+# 복제본 상태: 주기적으로 연결 확인 + 복제 지연(초) 측정
+#   조회 요청은 건강하고 지연이 허용치 이내인 복제본으로, 없으면 주 DB 로
+# ---------------------------------------------------------------------
+# 받은 WAL 을 모두 반영했으면 지연 0 (주 DB 에 쓰기가 없을 때 replay 시각만 보면 지연이 계속 늘어남)
+_REPLICA_LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
+_replica_state = {
+    f"replica{i}": {"healthy": False, "lag_sec": None, "checked_at": None, "error": None}
+    for i in range(len(DB_REPLICA_DSNS))
+}
+_replica_rr = itertools.count()
+_monitor_started = False
+
+
+def check_replica(target):
+    state = _replica_state[target]
+    conn = None
+    try:
+        conn = _connect(target)
+        cur = conn.cursor()
+        cur.execute(_REPLICA_LAG_SQL)
+        state.update(healthy=True, lag_sec=float(cur.fetchone()[0]), error=None)
+        cur.close()
+    except Exception as e:
+        state.update(healthy=False, lag_sec=None, error=str(e))
+        print(f"[WARN] 복제본 상태 확인 실패 ({target}): {e}")
+    finally:
+        state["checked_at"] = time.time()
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+
+def _monitor_replicas():
+    while True:
+        for target in _replica_state:
+            check_replica(target)
+        time.sleep(DB_REPLICA_CHECK_SEC)
+
+
+def start_replica_monitor():
+    global _monitor_started
+    if not _replica_state or _monitor_started:
+        return
+    with _pool_lock:
+        if _monitor_started:
+            return
+        _monitor_started = True
+    # 첫 확인 전까지는 모든 복제본을 사용하지 않음 (주 DB 로 조회)
+    threading.Thread(target=_monitor_replicas, name="db-replica-monitor", daemon=True).start()
+
+
+def replica_status():
+    return {target: dict(state) for target, state in _replica_state.items()}
+
+
+def _pick_replica(max_lag):
+    targets = list(_replica_state)
+    offset = next(_replica_rr)
+    for i in range(len(targets)):
+        target = targets[(offset + i) % len(targets)]
+        state = _replica_state[target]
+        if state["healthy"] and state["lag_sec"] is not None and state["lag_sec"] <= max_lag:
+            yield target
+
+
+def get_connection(readonly=False, max_lag=None):
+    """
+    readonly=True: 복제본 우선 (max_lag 초 이내로 따라온 건강한 복제본, 기본 DB_REPLICA_MAX_LAG)
+                   연결 실패 시 해당 복제본을 비정상으로 표시하고 다음 후보 → 최종적으로 주 DB
+    max_lag=0:     반영 지연 없는 데이터가 필요한 경우 → 항상 주 DB
+                   (복제본 지연은 DB_REPLICA_CHECK_SEC 마다만 확인하므로 0 이었던 복제본도 뒤처져 있을 수 있음)
+    쓰기(기본)는 항상 주 DB.
+    """
+    if readonly and max_lag != 0 and _replica_state:
+        start_replica_monitor()
+        for target in _pick_replica(DB_REPLICA_MAX_LAG if max_lag is None else max_lag):
+            try:
+                return _connect(target)
+            except Exception as e:
+                _replica_state[target].update(healthy=False, error=str(e))
+                print(f"[WARN] 복제본 연결 실패 ({target}), 다른 DB 로 전환: {e}")
+    return _connect("primary")
+
+
+def warm_up_pool():
+    try:
+        _get_pool()
+    except Exception as e:
+        print(f"[WARN] DB 풀 워밍업 실패 (첫 요청 시 재시도): {e}")
+    start_replica_monitor()
+
+
+def warm_up_pool_async():
+    # 부팅을 막지 않도록 백그라운드에서 DB 풀을 미리 연결
+    threading.Thread(target=warm_up_pool, name="db-pool-warmup", daemon=True).start()
+
+
+# ---------------------------------------------------------------------
+# 비동기 커넥션 풀 (ASGI 모드, app/asgi.py) — psycopg 3 AsyncConnectionPool
+#   같은 주 DB / 복제본 설정과 복제본 상태(_replica_state)를 그대로 사용
+#   psycopg 3 도 %s / %(name)s 플레이스홀더라 Storage SQL 을 바꾸지 않고 실행
+# ---------------------------------------------------------------------
+DB_ASYNC_POOL_MAX = int(os.getenv("DB_ASYNC_POOL_MAX", DB_POOL_MAX))
+DB_ASYNC_POOL_TIMEOUT = float(os.getenv("DB_ASYNC_POOL_TIMEOUT", 5))  # 빈 커넥션 대기 한도(초)
+
+# asyncio 는 ASGI 모드에서만 필요하므로 첫 비동기 풀 생성 시 import (웹 앱 콜드 스타트에서 제외)
+_async_pools = {}
+_async_pool_lock = None
+
+
+def _conninfo(target):
+    from psycopg.conninfo import make_conninfo
+
+    args = _connect_args(target)
+    if "dsn" in args:
+        return args["dsn"]
+    return make_conninfo(**{k: v for k, v in args.items() if v not in (None, "")})
+
+
+async def _get_async_pool(target="primary"):
+    global _async_pool_lock
+    pool = _async_pools.get(target)
+    if pool is None:
+        if _async_pool_lock is None:
+            import asyncio
+            _async_pool_lock = asyncio.Lock()
+        async with _async_pool_lock:
+            pool = _async_pools.get(target)
+            if pool is None:
+                from psycopg_pool import AsyncConnectionPool
+                pool = AsyncConnectionPool(
+                    _conninfo(target),
+                    min_size=DB_POOL_MIN,
+                    max_size=DB_ASYNC_POOL_MAX,
+                    timeout=DB_ASYNC_POOL_TIMEOUT,
+                    name=f"async-{target}",
+                    # 조회 전용 풀: 문장마다 커밋 (READ COMMITTED 라 동기 모드 트랜잭션과 보이는 데이터 동일)
+                    # client_encoding: SQL_ASCII DB 에서도 psycopg2 처럼 문자열(str)로 받기
+                    kwargs={"autocommit": True, "client_encoding": "utf8"},
+                    open=False,
+                )
+                await pool.open()
+                _async_pools[target] = pool
+    return pool
+
+
+async def _async_connect(target):
+    pool = await _get_async_pool(target)
+    return pool, await pool.getconn()
+
+
+@asynccontextmanager
+async def get_async_connection(readonly=False, max_lag=None):
+    """
+    get_connection 의 비동기 버전 (라우팅 규칙 동일).
+    반납 시 풀이 커밋 안 된 트랜잭션을 롤백
+    """
+    pool = conn = None
+    if readonly and max_lag != 0 and _replica_state:
+        start_replica_monitor()
+        for target in _pick_replica(DB_REPLICA_MAX_LAG if max_lag is None else max_lag):
+            try:
+                pool, conn = await _async_connect(target)
+                break
+            except Exception as e:
+                _replica_state[target].update(healthy=False, error=str(e))
+                print(f"[WARN] 복제본 연결 실패 ({target}), 다른 DB 로 전환: {e}")
+    if conn is None:
+        pool, conn = await _async_connect("primary")
+    try:
+        yield conn
+    finally:
+        await pool.putconn(conn)
+
+
+async def warm_up_async_pool():
+    try:
+        await _get_async_pool()
+    except Exception as e:
+        print(f"[WARN] 비동기 DB 풀 워밍업 실패 (첫 요청 시 재시도): {e}")
+    start_replica_monitor()
+
+
+async def close_async_pools():
+    pools = list(_async_pools.values())
+    _async_pools.clear()
+    for pool in pools:
+        await pool.close()
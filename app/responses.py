@@ -0,0 +1,115 @@
+import gzip
+from datetime import date
+from decimal import Decimal
+
+import orjson
+from flask import request
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import brotli
+except ImportError:  # brotli 미설치 환경은 gzip 만 사용
+    brotli = None
+
+# 이보다 작은 응답은 압축 이득보다 CPU 비용이 큼
+COMPRESS_MIN_BYTES = 512
+COMPRESSIBLE_MIMETYPES = {
+    "application/json",
+    "text/html",
+    "text/css",
+    "text/javascript",
+    "application/javascript",
+}
+
+
+def _json_default(value):
+    # 드라이버에 따라 SUM 결과가 Decimal 로 오는 경우
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(obj):
+    """orjson 직렬화 (bytes) — 응답 본문과 같은 규칙으로 파일에 쓸 때도 사용"""
+    return orjson.dumps(obj, default=_json_default)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """jsonify 를 orjson 으로 직렬화 (키 정렬 없이 삽입 순서 유지)"""
+
+    def dumps(self, obj, **kwargs):
+        return dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            dumps(obj),
+            mimetype=self.mimetype,
+        )
+
+
+def table(fields, rows):
+    """
+    조회 결과(튜플 목록) → 응답 본문.
+    - 기본: [{field: value, ...}, ...]
+    - ?format=columnar: {field: [value, ...], ...} (키 반복 없이 필드별 병렬 배열)
+    """
+    if request.args.get("format") == "columnar":
+        return columnar(fields, rows)
+    return [dict(zip(fields, row)) for row in rows]
+
+
+def columnar(fields, rows):
+    # {field: [value, ...], ...} — 행이 없으면 필드별 빈 배열
+    columns = zip(*rows) if rows else [()] * len(fields)
+    return {field: list(column) for field, column in zip(fields, columns)}
+
+
+def with_key(rows, fmt=None):
+    # 첫 컬럼(날짜/월)만 문자열로 바꾸고 나머지는 그대로
+    return [
+        ((key.strftime(fmt) if fmt else str(key)) if isinstance(key, date) else key, *rest)
+        for key, *rest in rows
+    ]
+
+
+def _negotiate_encoding():
+    accept = request.accept_encodings
+    if brotli is not None and accept["br"]:
+        return "br"
+    if accept["gzip"]:
+        return "gzip"
+    return None
+
+
+def compress_response(response):
+    if (
+        response.status_code != 200
+        or response.direct_passthrough
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    encoding = _negotiate_encoding()
+    data = response.get_data()
+    if encoding is None or len(data) < COMPRESS_MIN_BYTES:
+        return response
+
+    if encoding == "br":
+        body = brotli.compress(data, quality=5)
+    else:
+        body = gzip.compress(data, compresslevel=6)
+    response.set_data(body)
+    response.headers["Content-Encoding"] = encoding
+    return response
+
+
+def init_app(app):
+    app.json = OrjsonProvider(app)
+    app.after_request(compress_response)
@@ -1,7 +1,11 @@
-from flask import Blueprint, render_template, jsonify, request, current_app, abort
-from app.database import get_connection
-import subprocess
-import threading
+from flask import Blueprint, Response, render_template, jsonify, request, current_app, abort, send_from_directory
+from app.storage import RANKING_SORTS, WIN_RATE_MIN_BETS, get_storage
+from app.startup import startup_stats
+from app.database import replica_status
+from app.responses import table, with_key
+from app.crawl_stream import run_status, start_crawl, stream_events
+from app.snapshots import ALL_SCOPE, RANKING_FIELDS, SNAPSHOT_DIR, SNAPSHOT_MAX_AGE, MANIFEST, default_periods, inline_snapshot
+import calendar
 from datetime import date, timedelta
 
 bp = Blueprint("routes", __name__)
@@ -15,11 +19,14 @@ def index():
 
 @bp.route("/ranking")
 def ranking():
-    return render_template("ranking.html")
+    # 크롤링 때 발행된 기본 랭킹 스냅샷을 HTML 에 인라인 (첫 화면 API 요청 없음)
+    return render_template("ranking.html", ranking_snapshot=inline_snapshot())
 
 @bp.route("/healthz")
 def healthz():
-    return jsonify(status="ok"), 200
+    return jsonify(status="ok",
+                   first_response_ms=startup_stats().get("first_response_ms"),
+                   replicas=replica_status()), 200
 
 # ---------------------------------------------------------------------
 # 폴더/파일 구조 전용 페이지
@@ -41,35 +48,105 @@ def board_page(folder, page):
     return render_template(f"{folder}/{page}.html",
                            board_slug=board_slug,
                            folder_name=folder,
-                           page_name=page)
+                           page_name=page,
+                           ranking_snapshot=inline_snapshot(board_slug) if page == "ranking" else None)
+
+# ---------------------------------------------------------------------
+# 랭킹 스냅샷 파일 (app/snapshots.py)
+#   파일명에 내용 해시가 붙어 있어 장기 캐시, manifest.json 만 매번 재검증
+# ---------------------------------------------------------------------
+@bp.route("/snapshots/<name>")
+def snapshot(name):
+    if name == MANIFEST:
+        return send_from_directory(SNAPSHOT_DIR, name, max_age=0)
+    response = send_from_directory(SNAPSHOT_DIR, name, max_age=SNAPSHOT_MAX_AGE)
+    response.cache_control.immutable = True
+    return response
 
 # ---------------------------------------------------------------------
 # 크롤러 트리거
+#   진행 상황은 /api/crawl/status (폴링) 또는 /api/crawl/events (SSE) — 실행 상태는 DB 에 있어 어느 워커에서든 조회
 # ---------------------------------------------------------------------
+def _crawler_authorized():
+    # EventSource 는 헤더를 못 붙이므로 ?key= 도 허용
+    token = request.headers.get("X-API-KEY") or request.args.get("key")
+    return token == current_app.config["CRAWLER_SECRET_KEY"]
+
 @bp.route("/run-crawler", methods=["POST"])
 def run_crawler():
-    token = request.headers.get("X-API-KEY")
-    if token != current_app.config["CRAWLER_SECRET_KEY"]:
+    if not _crawler_authorized():
+        return jsonify({"error": "unauthorized"}), 403
+
+    run_id = start_crawl()
+    if run_id is None:
+        return jsonify({"error": "crawler already running"}), 409
+    return jsonify({"status": "started", "run_id": run_id,
+                    "status_url": f"/api/crawl/status?run_id={run_id}", "events": "/api/crawl/events"}), 202
+
+# ---------------------------------------------------------------------
+# API: 크롤링 실행 상태 (짧은 폴링용)
+#   run_id 미지정 시 가장 최근 실행, after= 이벤트 id 이후 진행 이벤트만 (최대 200개)
+#   status: running | ok | error, 끝나면 summary 포함
+# ---------------------------------------------------------------------
+@bp.route("/api/crawl/status", methods=["GET"])
+def crawl_status():
+    if not _crawler_authorized():
         return jsonify({"error": "unauthorized"}), 403
 
-    def background_job():
-        try:
-            result = subprocess.run(
-                ["python", "-m", "app.crawler.cli"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            print(result.stdout)
-        except subprocess.CalledProcessError as e:
-            print("[ERROR] Crawler 실패:", e.stderr)
+    try:
+        after_id = int(request.args.get("after", 0))
+    except ValueError:
+        return jsonify({"error": "invalid after"}), 400
 
-    threading.Thread(target=background_job, daemon=True).start()
-    return jsonify({"status": "started"}), 202
+    state = run_status(request.args.get("run_id"), after_id)
+    if state is None:
+        return jsonify({"error": "run not found"}), 404
+    return jsonify(state)
+
+# ---------------------------------------------------------------------
+# API: 크롤링 진행 이벤트 스트림 (Server-Sent Events)
+#   slug_started / page_fetched / posts_parsed / records_inserted / aggregation_done
+#   / slug_done / ranks_updated / month_compacted / snapshots_published / crawl_done / error
+#   → 마지막에 summary 이벤트 후 종료
+#   Last-Event-ID (또는 ?lastEventId=) 이후 저장된 이벤트부터 재전송
+#   연결 동안 워커 하나를 잡으므로 브라우저 확인용 — 자동화는 /api/crawl/status 폴링
+# ---------------------------------------------------------------------
+@bp.route("/api/crawl/events", methods=["GET"])
+def crawl_events():
+    if not _crawler_authorized():
+        return jsonify({"error": "unauthorized"}), 403
+
+    last_id = request.headers.get("Last-Event-ID") or request.args.get("lastEventId") or 0
+    try:
+        last_id = int(last_id)
+    except ValueError:
+        return jsonify({"error": "invalid Last-Event-ID"}), 400
+
+    return Response(
+        stream_events(last_id),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+# ---------------------------------------------------------------------
+# 조회 API 공통: 읽기 전용 커서 → 복제본 (DB_REPLICA_DSNS), 없거나 비정상이면 주 DB
+#   ?fresh=1 이면 복제 지연 없는 데이터만 (주 DB)
+# ---------------------------------------------------------------------
+def _read_cursor(storage, max_lag=None):
+    if request.args.get("fresh") == "1":
+        max_lag = 0
+    return storage.cursor(readonly=True, max_lag=max_lag)
 
 # ---------------------------------------------------------------------
 # API: 일간 통계 (boardSlug 미지정 시 전체 게시판 합산)
+#   ?format=columnar 지정 시 필드별 병렬 배열로 응답 (랭킹/통계 API 공통)
+#   rank_* / pct_* / participants: 그날(그달) 같은 게시판(또는 전체) 안에서의 순위, 크롤링 때 계산
+#     pct_* 는 백분위 (100 = 1위)
 # ---------------------------------------------------------------------
+RANK_FIELDS    = ("rank_amount", "rank_profit", "pct_amount", "pct_profit", "participants")
+DAILY_FIELDS   = ("stat_date", "total_bets", "total_amount", "total_profit", "wins", "win_rate") + RANK_FIELDS
+MONTHLY_FIELDS = ("stat_month", "total_bets", "total_amount", "total_profit", "wins", "win_rate") + RANK_FIELDS
+
 @bp.route("/api/daily_stats", methods=["GET"])
 def daily_stats():
     nickname   = request.args.get("nickname")
@@ -87,60 +164,31 @@ def daily_stats():
         start_date = date.fromisoformat(start_date)
         end_date   = date.fromisoformat(end_date)
 
-    conn = get_connection()
-    cur = conn.cursor()
+    storage = get_storage()
+    with _read_cursor(storage) as cur:
+        rows = storage.find_users(cur, nickname)
+        if not rows:
+            return jsonify({"error": "user not found"}), 404
 
-    cur.execute("SELECT id, nickname FROM users WHERE nickname = %s", (nickname,))
-    rows = cur.fetchall()
-    if not rows:
-        cur.close(); conn.close()
-        return jsonify({"error": "user not found"}), 404
+        results = {}
+        for user_id, nick in rows:
+            stats = storage.daily_stats(cur, user_id, start_date, end_date, board_slug)
+            results[nick] = table(DAILY_FIELDS, with_key(stats))
 
-    results = {}
-    for user_id, nick in rows:
-        if board_slug:
-            cur.execute("""
-                SELECT d.stat_date, d.total_bets, d.total_amount, d.total_profit, d.wins
-                FROM daily_betting_stats d
-                JOIN boards b ON d.board_id = b.id
-                WHERE d.user_id = %s
-                  AND b.slug = %s
-                  AND d.stat_date BETWEEN %s AND %s
-                ORDER BY d.stat_date DESC
-            """, (user_id, board_slug, start_date, end_date))
-        else:
-            cur.execute("""
-                SELECT d.stat_date,
-                       SUM(d.total_bets)   AS total_bets,
-                       SUM(d.total_amount) AS total_amount,
-                       SUM(d.total_profit) AS total_profit,
-                       SUM(d.wins)         AS wins
-                FROM daily_betting_stats d
-                WHERE d.user_id = %s
-                  AND d.stat_date BETWEEN %s AND %s
-                GROUP BY d.stat_date
-                ORDER BY d.stat_date DESC
-            """, (user_id, start_date, end_date))
-
-        stats = cur.fetchall()
-        results[nick] = []
-        for stat_date_v, total_bets, total_amount, total_profit, wins in stats:
-            win_rate = round((wins / total_bets * 100), 2) if total_bets else 0.0
-            results[nick].append({
-                "stat_date": str(stat_date_v),
-                "total_bets": total_bets,
-                "total_amount": total_amount,
-                "total_profit": total_profit,
-                "wins": wins,
-                "win_rate": win_rate
-            })
-
-    cur.close(); conn.close()
     return jsonify(results)
 
 # ---------------------------------------------------------------------
 # API: 월간 통계 (boardSlug 미지정 시 전체 게시판 합산)
 # ---------------------------------------------------------------------
+def _month_start(ym):
+    # 'YYYY-MM' → 해당 달 1일
+    return date.fromisoformat(ym + "-01")
+
+def _month_end(ym):
+    # 'YYYY-MM' → 해당 달 말일
+    first = _month_start(ym)
+    return first.replace(day=calendar.monthrange(first.year, first.month)[1])
+
 @bp.route("/api/monthly_stats", methods=["GET"])
 def monthly_stats():
     nickname    = request.args.get("nickname")
@@ -151,71 +199,40 @@ def monthly_stats():
     if not nickname:
         return jsonify({"error": "nickname required"}), 400
 
-    conn = get_connection()
-    cur = conn.cursor()
+    if start_month and end_month:
+        start_month, end_month = _month_start(start_month), _month_end(end_month)
+    else:
+        start_month = end_month = None
 
-    cur.execute("SELECT id, nickname FROM users WHERE nickname = %s", (nickname,))
-    rows = cur.fetchall()
-    if not rows:
-        cur.close(); conn.close()
-        return jsonify({"error": "user not found"}), 404
+    storage = get_storage()
+    with _read_cursor(storage) as cur:
+        rows = storage.find_users(cur, nickname)
+        if not rows:
+            return jsonify({"error": "user not found"}), 404
 
-    results = {}
-    for user_id, nick in rows:
-        params = [user_id]
-        if board_slug:
-            base = """
-                SELECT m.stat_month, m.total_bets, m.total_amount, m.total_profit, m.wins
-                FROM monthly_betting_stats m
-                JOIN boards b ON m.board_id = b.id
-                WHERE m.user_id = %s
-                  AND b.slug = %s
-            """
-            params.append(board_slug)
-        else:
-            base = """
-                SELECT m.stat_month,
-                       SUM(m.total_bets)   AS total_bets,
-                       SUM(m.total_amount) AS total_amount,
-                       SUM(m.total_profit) AS total_profit,
-                       SUM(m.wins)         AS wins
-                FROM monthly_betting_stats m
-                WHERE m.user_id = %s
-            """
-
-        if start_month and end_month:
-            base += " AND m.stat_month BETWEEN %s AND (%s::date + interval '1 month - 1 day')"
-            params.extend([start_month + "-01", end_month + "-01"])
-
-        if board_slug:
-            base += " ORDER BY m.stat_month DESC"
-        else:
-            base += " GROUP BY m.stat_month ORDER BY m.stat_month DESC"
-
-        if not (start_month and end_month):
-            base += " LIMIT 12"
-
-        cur.execute(base, tuple(params))
-        stats = cur.fetchall()
-
-        results[nick] = []
-        for stat_month_v, total_bets, total_amount, total_profit, wins in stats:
-            win_rate = round((wins / total_bets * 100), 2) if total_bets else 0.0
-            results[nick].append({
-                "stat_month": stat_month_v.strftime("%Y-%m"),
-                "total_bets": total_bets,
-                "total_amount": total_amount,
-                "total_profit": total_profit,
-                "wins": wins,
-                "win_rate": win_rate
-            })
+        results = {}
+        for user_id, nick in rows:
+            stats = storage.monthly_stats(cur, user_id, start_month, end_month, board_slug)
+            results[nick] = table(MONTHLY_FIELDS, with_key(stats, "%Y-%m"))
 
-    cur.close(); conn.close()
     return jsonify(results)
 
 # ---------------------------------------------------------------------
 # API: 일간 랭킹 (boardSlug 미지정 시 전체 게시판 합산)
+#   sort: amount(기본, 배팅액) | profit(순수익) | win_rate(승률) | bets(배팅수)
+#   minBets: 배팅수 하한 — 승률 랭킹은 미지정 시 일간 5 / 월간 20 (WIN_RATE_MIN_BETS, 이보다 낮으면 느린 경로)
+#   크롤링 때 정렬 기준별 위치까지 계산해 두므로 어떤 정렬이든 인덱스 순서대로 limit 개만 읽음
 # ---------------------------------------------------------------------
+def _ranking_sort(period):
+    """반환: (sort, min_bets) 또는 잘못된 요청이면 (None, 오류 메시지)"""
+    sort = request.args.get("sort", "amount")
+    if sort not in RANKING_SORTS:
+        return None, f"sort must be one of {', '.join(RANKING_SORTS)}"
+    min_bets = request.args.get("minBets")
+    if min_bets is None:
+        return sort, WIN_RATE_MIN_BETS[period] if sort == "win_rate" else 0
+    return sort, max(int(min_bets), 0)
+
 @bp.route("/api/daily_ranking", methods=["GET"])
 def daily_ranking():
     stat_date  = request.args.get("statDate")  # YYYY-MM-DD
@@ -224,54 +241,18 @@ def daily_ranking():
 
     if not stat_date:
         return jsonify({"error": "statDate required"}), 400
+    sort, min_bets = _ranking_sort("daily")
+    if sort is None:
+        return jsonify({"error": min_bets}), 400
 
-    conn = get_connection()
-    cur = conn.cursor()
-
-    if board_slug:
-        cur.execute("""
-            SELECT u.nickname, d.total_bets, d.total_amount, d.total_profit, d.wins
-            FROM daily_betting_stats d
-            JOIN users  u ON d.user_id = u.id
-            JOIN boards b ON d.board_id = b.id
-            WHERE d.stat_date = %s
-              AND b.slug = %s
-            ORDER BY d.total_amount DESC
-            LIMIT %s
-        """, (stat_date, board_slug, limit))
-    else:
-        cur.execute("""
-            SELECT u.nickname,
-                   SUM(d.total_bets)   AS total_bets,
-                   SUM(d.total_amount) AS total_amount,
-                   SUM(d.total_profit) AS total_profit,
-                   SUM(d.wins)         AS wins
-            FROM daily_betting_stats d
-            JOIN users u ON d.user_id = u.id
-            WHERE d.stat_date = %s
-            GROUP BY u.nickname
-            ORDER BY SUM(d.total_amount) DESC
-            LIMIT %s
-        """, (stat_date, limit))
-
-    rows = cur.fetchall()
-    cur.close(); conn.close()
+    storage = get_storage()
+    with _read_cursor(storage) as cur:
+        rows = storage.daily_ranking(cur, date.fromisoformat(stat_date), limit, board_slug, sort, min_bets)
 
-    results = []
-    for nickname, total_bets, total_amount, total_profit, wins in rows:
-        win_rate = round((wins / total_bets * 100), 2) if total_bets else 0.0
-        results.append({
-            "nickname": nickname,
-            "total_bets": total_bets,
-            "total_amount": total_amount,
-            "total_profit": total_profit,
-            "wins": wins,
-            "win_rate": win_rate
-        })
-    return jsonify(results)
+    return jsonify(table(RANKING_FIELDS, rows))
 
 # ---------------------------------------------------------------------
-# API: 월간 랭킹 (boardSlug 미지정 시 전체 게시판 합산)
+# API: 월간 랭킹 (boardSlug 미지정 시 전체 게시판 합산, sort / minBets 는 일간과 동일)
 # ---------------------------------------------------------------------
 @bp.route("/api/monthly_ranking", methods=["GET"])
 def monthly_ranking():
@@ -281,50 +262,289 @@ def monthly_ranking():
 
     if not stat_month:
         return jsonify({"error": "statMonth required"}), 400
+    sort, min_bets = _ranking_sort("monthly")
+    if sort is None:
+        return jsonify({"error": min_bets}), 400
+
+    storage = get_storage()
+    with _read_cursor(storage) as cur:
+        rows = storage.monthly_ranking(cur, _month_start(stat_month), limit, board_slug, sort, min_bets)
+
+    return jsonify(table(RANKING_FIELDS, rows))
+
+# ---------------------------------------------------------------------
+# API: 유저 누적 요약 (boardSlug 미지정 시 전체 게시판 합산)
+#   크롤링 시 집계된 user_lifetime_stats 단일 행 조회
+# ---------------------------------------------------------------------
+@bp.route("/api/users/<nickname>/summary", methods=["GET"])
+def user_summary(nickname):
+    board_slug = request.args.get("boardSlug")  # 선택
 
-    stat_month = stat_month + "-01"
-
-    conn = get_connection()
-    cur = conn.cursor()
-
-    if board_slug:
-        cur.execute("""
-            SELECT u.nickname, m.total_bets, m.total_amount, m.total_profit, m.wins
-            FROM monthly_betting_stats m
-            JOIN users  u ON m.user_id = u.id
-            JOIN boards b ON m.board_id = b.id
-            WHERE m.stat_month = %s
-              AND b.slug = %s
-            ORDER BY m.total_amount DESC
-            LIMIT %s
-        """, (stat_month, board_slug, limit))
+    storage = get_storage()
+    with _read_cursor(storage) as cur:
+        row = storage.user_summary(cur, nickname, board_slug)
+
+    if not row:
+        return jsonify({"error": "user not found"}), 404
+
+    (total_bets, total_amount, total_profit, wins, win_rate, first_seen, last_seen,
+     best_day, best_day_profit, worst_day, worst_day_profit) = row
+    return jsonify({
+        "nickname": nickname,
+        "board_slug": board_slug,
+        "total_bets": total_bets,
+        "total_amount": total_amount,
+        "total_profit": total_profit,
+        "wins": wins,
+        "win_rate": win_rate,
+        "first_seen": str(first_seen) if first_seen else None,
+        "last_seen": str(last_seen) if last_seen else None,
+        "best_day": {"stat_date": str(best_day), "total_profit": best_day_profit} if best_day else None,
+        "worst_day": {"stat_date": str(worst_day), "total_profit": worst_day_profit} if worst_day else None,
+    })
+
+# ---------------------------------------------------------------------
+# API: 유저 순위 추이 (차트용, boardSlug 미지정 시 전체 게시판 기준 순위)
+#   period=daily(기본, 최근 90일) | monthly(최근 12개월)
+#   startDate/endDate (daily, YYYY-MM-DD) 또는 startMonth/endMonth (monthly, YYYY-MM)
+# ---------------------------------------------------------------------
+RANK_HISTORY_DAYS = 90
+
+def _history_range(period):
+    """
+    rank_history / board_overview 공통 기간 파싱
+    반환: ((start, end, 기간 필드명, with_key 포맷), None) 또는 잘못된 요청이면 (None, 오류 메시지)
+    """
+    try:
+        if period == "daily":
+            end   = request.args.get("endDate")
+            start = request.args.get("startDate")
+            end   = date.fromisoformat(end) if end else date.today()
+            start = date.fromisoformat(start) if start else end - timedelta(days=RANK_HISTORY_DAYS - 1)
+            return (start, end, "stat_date", None), None
+        if period == "monthly":
+            end   = request.args.get("endMonth")
+            start = request.args.get("startMonth")
+            end   = _month_start(end) if end else date.today().replace(day=1)
+            # 기본: end 포함 12개월 (11개월 전 1일)
+            start = _month_start(start) if start else date(end.year - (end.month <= 11), (end.month - 12) % 12 + 1, 1)
+            return (start, end, "stat_month", "%Y-%m"), None
+    except ValueError:
+        return None, "invalid date (startDate/endDate: YYYY-MM-DD, startMonth/endMonth: YYYY-MM)"
+    return None, "period must be daily or monthly"
+
+@bp.route("/api/users/<nickname>/rank_history", methods=["GET"])
+def rank_history(nickname):
+    period     = request.args.get("period", "daily")
+    board_slug = request.args.get("boardSlug")  # 선택
+
+    history_range, error = _history_range(period)
+    if error:
+        return jsonify({"error": error}), 400
+    start, end, key, fmt = history_range
+    fields = (key,) + RANK_FIELDS
+
+    storage = get_storage()
+    with _read_cursor(storage) as cur:
+        rows = storage.find_users(cur, nickname)
+        if not rows:
+            return jsonify({"error": "user not found"}), 404
+        history = storage.rank_history(cur, rows[0][0], period, start, end, board_slug)
+
+    return jsonify({
+        "nickname": nickname,
+        "board_slug": board_slug,
+        "period": period,
+        "history": table(fields, with_key(history, fmt)),
+    })
+
+# ---------------------------------------------------------------------
+# API: 유저 대시보드 (검색 첫 화면, boardSlug 미지정 시 전체 게시판 합산)
+#   daily_stats + monthly_stats + 현재 순위 + 기간 랭킹 상위를 커넥션 하나, SQL 한 번으로
+#   startDate/endDate (기본 최근 30일), startMonth/endMonth (기본 최근 12개월) — 각 통계 API 와 같은 규칙
+#   statDate/statMonth: 순위/랭킹 기준 (기본 어제 / 이번 달, 랭킹 페이지 기본값과 같음), limit: 랭킹 개수
+# ---------------------------------------------------------------------
+CURRENT_RANK_FIELDS = ("total_bets", "total_amount", "total_profit", "wins", "win_rate") + RANK_FIELDS
+DASHBOARD_LIMIT = 10
+
+@bp.route("/api/dashboard", methods=["GET"])
+def dashboard():
+    nickname    = request.args.get("nickname")
+    start_date  = request.args.get("startDate")   # YYYY-MM-DD
+    end_date    = request.args.get("endDate")     # YYYY-MM-DD
+    start_month = request.args.get("startMonth")  # YYYY-MM
+    end_month   = request.args.get("endMonth")    # YYYY-MM
+    stat_date   = request.args.get("statDate")    # YYYY-MM-DD
+    stat_month  = request.args.get("statMonth")   # YYYY-MM
+    limit       = min(int(request.args.get("limit", DASHBOARD_LIMIT)), 100)
+    board_slug  = request.args.get("boardSlug")   # 선택
+
+    if not nickname:
+        return jsonify({"error": "nickname required"}), 400
+
+    if not start_date or not end_date:
+        end_date = date.today()
+        start_date = end_date - timedelta(days=30)
+    else:
+        start_date = date.fromisoformat(start_date)
+        end_date   = date.fromisoformat(end_date)
+
+    if start_month and end_month:
+        start_month, end_month = _month_start(start_month), _month_end(end_month)
     else:
-        cur.execute("""
-            SELECT u.nickname,
-                   SUM(m.total_bets)   AS total_bets,
-                   SUM(m.total_amount) AS total_amount,
-                   SUM(m.total_profit) AS total_profit,
-                   SUM(m.wins)         AS wins
-            FROM monthly_betting_stats m
-            JOIN users u ON m.user_id = u.id
-            WHERE m.stat_month = %s
-            GROUP BY u.nickname
-            ORDER BY SUM(m.total_amount) DESC
-            LIMIT %s
-        """, (stat_month, limit))
-
-    rows = cur.fetchall()
-    cur.close(); conn.close()
+        start_month = end_month = None
+
+    default_month, default_day = default_periods()
+    stat_date  = date.fromisoformat(stat_date) if stat_date else default_day
+    stat_month = _month_start(stat_month) if stat_month else default_month
+
+    storage = get_storage()
+    with _read_cursor(storage) as cur:
+        data = storage.dashboard(cur, nickname, board_slug, start_date, end_date, start_month, end_month,
+                                 stat_date, stat_month, limit)
+
+    if data["nickname"] is None:
+        return jsonify({"error": "user not found"}), 404
+
+    return jsonify({
+        "nickname": data["nickname"],
+        "board_slug": board_slug,
+        "periods": {"daily": stat_date.isoformat(), "monthly": stat_month.strftime("%Y-%m")},
+        "daily": table(DAILY_FIELDS, with_key(data["daily"])),
+        "monthly": table(MONTHLY_FIELDS, with_key(data["monthly"], "%Y-%m")),
+        "ranks": {
+            "daily": dict(zip(CURRENT_RANK_FIELDS, data["rank_daily"])) if data["rank_daily"] else None,
+            "monthly": dict(zip(CURRENT_RANK_FIELDS, data["rank_monthly"])) if data["rank_monthly"] else None,
+        },
+        "top": {
+            "daily": table(RANKING_FIELDS, data["top_daily"]),
+            "monthly": table(RANKING_FIELDS, data["top_monthly"]),
+        },
+    })
+
+# ---------------------------------------------------------------------
+# API: 기간 랭킹 (boardSlug 미지정 시 전체 게시판 합산)
+#   daily_cumulative_stats 누적합 → 유저당 (기간 끝 행 - 시작 직전 행)
+# ---------------------------------------------------------------------
+@bp.route("/api/range_ranking", methods=["GET"])
+def range_ranking():
+    start_date = request.args.get("startDate")  # YYYY-MM-DD
+    end_date   = request.args.get("endDate")    # YYYY-MM-DD
+    limit      = int(request.args.get("limit", 50))
+    board_slug = request.args.get("boardSlug")  # 선택
+
+    if not start_date or not end_date:
+        return jsonify({"error": "startDate and endDate required"}), 400
+
+    start_date = date.fromisoformat(start_date)
+    end_date   = date.fromisoformat(end_date)
+    if start_date > end_date:
+        return jsonify({"error": "startDate must be <= endDate"}), 400
+
+    storage = get_storage()
+    with _read_cursor(storage) as cur:
+        rows = storage.range_ranking(cur, start_date, end_date, limit, board_slug)
+
+    return jsonify(table(RANKING_FIELDS, rows))
+
+# ---------------------------------------------------------------------
+# API: 게시판 개요 추이 (차트용, slug 가 all 이면 전체 게시판 합산)
+#   크롤링 때 집계된 daily_board_stats / monthly_board_stats 범위 조회 — 페이지마다 불러도 되는 비용
+#   period=daily(기본, 최근 90일) | monthly(최근 12개월), 기간 지정은 rank_history 와 같은 규칙
+#   house_profit = 배팅액 - 지급액, player_profit = 참여자 전체 순손익 (= -house_profit)
+# ---------------------------------------------------------------------
+BOARD_OVERVIEW_FIELDS = ("posts", "participants", "total_amount", "total_payout", "house_profit", "player_profit")
+
+@bp.route("/api/boards/<slug>/overview", methods=["GET"])
+def board_overview(slug):
+    period     = request.args.get("period", "daily")
+    board_slug = None if slug == ALL_SCOPE else slug
+
+    history_range, error = _history_range(period)
+    if error:
+        return jsonify({"error": error}), 400
+    start, end, key, fmt = history_range
+    fields = (key,) + BOARD_OVERVIEW_FIELDS
+
+    storage = get_storage()
+    with _read_cursor(storage) as cur:
+        rows = storage.board_overview(cur, board_slug, period, start, end)
+
+    if rows is None:
+        return jsonify({"error": "board not found"}), 404
+
+    return jsonify({
+        "board_slug": board_slug,
+        "period": period,
+        "overview": table(fields, with_key(rows, fmt)),
+    })
+
+# ---------------------------------------------------------------------
+# API: 배팅 풀 what-if 시뮬레이션 (boardSlug 미지정 시 전체 게시판)
+#   strategy: underdog | favorite | follow_top | biggest_bet | all
+# ---------------------------------------------------------------------
+@bp.route("/api/simulate", methods=["GET"])
+def simulate():
+    # numpy 는 시뮬레이션 요청 때만 로딩 (콜드 스타트에서 제외)
+    from app import simulator
+
+    strategy   = request.args.get("strategy", "all")
+    stake      = int(request.args.get("stake", 1000))
+    board_slug = request.args.get("boardSlug")  # 선택
+    start_date = request.args.get("startDate")  # 선택, YYYY-MM-DD
+    end_date   = request.args.get("endDate")    # 선택, YYYY-MM-DD
+
+    if strategy == "all":
+        strategies = simulator.STRATEGIES
+    elif strategy in simulator.STRATEGIES:
+        strategies = (strategy,)
+    else:
+        return jsonify({"error": f"strategy must be one of {', '.join(simulator.STRATEGIES)}, all"}), 400
+    if stake <= 0:
+        return jsonify({"error": "stake must be positive"}), 400
+
+    results = simulator.run_simulation(
+        strategies,
+        stake,
+        board_slug,
+        date.fromisoformat(start_date) if start_date else None,
+        date.fromisoformat(end_date) if end_date else None,
+    )
+    return jsonify(results)
+
+# ---------------------------------------------------------------------
+# API: 최근 게시물 + 사이드별 풀 (boardSlug 미지정 시 전체 게시판)
+#   수집 시점에 계산된 post_summary / post_side_summary 조회
+# ---------------------------------------------------------------------
+@bp.route("/api/posts", methods=["GET"])
+def recent_posts():
+    limit      = min(int(request.args.get("limit", 20)), 100)
+    board_slug = request.args.get("boardSlug")  # 선택
+
+    storage = get_storage()
+    with _read_cursor(storage) as cur:
+        rows = storage.recent_posts(cur, limit, board_slug)
 
     results = []
-    for nickname, total_bets, total_amount, total_profit, wins in rows:
-        win_rate = round((wins / total_bets * 100), 2) if total_bets else 0.0
-        results.append({
-            "nickname": nickname,
-            "total_bets": total_bets,
-            "total_amount": total_amount,
-            "total_profit": total_profit,
-            "wins": wins,
-            "win_rate": win_rate
+    for (slug, post_id, deadline_at, stat_date_v, participants, total_amount, total_payout,
+         winning_side, top_nickname, top_bet_amount, bet_side, bettors, bet_amount, payout_amount) in rows:
+        if not results or results[-1]["post_id"] != post_id or results[-1]["board_slug"] != slug:
+            results.append({
+                "board_slug": slug,
+                "post_id": post_id,
+                "deadline_at": deadline_at.isoformat(),
+                "stat_date": str(stat_date_v),
+                "participants": participants,
+                "total_amount": total_amount,
+                "total_payout": total_payout,
+                "winning_side": winning_side,
+                "top_bettor": {"nickname": top_nickname, "bet_amount": top_bet_amount},
+                "sides": [],
+            })
+        results[-1]["sides"].append({
+            "bet_side": bet_side,
+            "bettors": bettors,
+            "bet_amount": bet_amount,
+            "payout_amount": payout_amount,
         })
     return jsonify(results)
@@ -0,0 +1,168 @@
+import argparse
+import json
+from datetime import date
+
+import numpy as np
+
+from app.storage import get_storage
+
+# 파리뮤추얼(pari-mutuel) 풀 시뮬레이터
+#   게시물 × 사이드 행렬에 풀/반환액을 올려놓고 전략별 what-if 수익을 한 번에 계산
+#   underdog:    풀이 가장 작은 사이드
+#   favorite:    풀이 가장 큰 사이드
+#   follow_top:  참여자 중 상위 유저(마감 전날까지 누적 순수익 1위)가 건 사이드 — 상위 유저가 없는 게시물은 불참
+#   biggest_bet: 최대 단일 배팅이 걸린 사이드
+STRATEGIES = ("underdog", "favorite", "follow_top", "biggest_bet")
+
+
+def load_pools(storage, cur, board_slug=None, start_date=None, end_date=None):
+    """
+    게시물/사이드별 합계를 행렬로 로딩.
+    반환: dict(keys, deadline, pool, payout, top_bet, top_side) — 게시물은 마감 시각 순 (게시판이 섞여도 시간순)
+      - keys:     (n, 2) [board_id, post_id]
+      - deadline: (n,) 마감 시각 (datetime64)
+      - pool:     (n, s) 사이드별 총 배팅액
+      - payout:   (n, s) 사이드별 총 반환액
+      - top_bet:  (n, s) 사이드별 최대 단일 배팅액
+      - top_side: (n,) 상위 유저가 건 사이드 (-1: 대상 유저 없음, Storage.post_top_player_sides)
+    """
+    side_rows = storage.post_side_pools(cur, board_slug, start_date, end_date)
+    rows = np.array([r[:6] for r in side_rows], dtype=np.int64).reshape(-1, 6)
+    deadlines = np.array([r[6] for r in side_rows], dtype="datetime64[s]")
+
+    keys, post_idx = np.unique(rows[:, :2], axis=0, return_inverse=True)
+    post_idx = post_idx.reshape(-1)
+    n_sides = max(int(rows[:, 2].max()) + 1, 2) if len(rows) else 2
+    side_idx = rows[:, 2]
+
+    pool = np.zeros((len(keys), n_sides), dtype=np.float64)
+    payout = np.zeros_like(pool)
+    top_bet = np.zeros_like(pool)
+    pool[post_idx, side_idx] = rows[:, 3]
+    payout[post_idx, side_idx] = rows[:, 4]
+    top_bet[post_idx, side_idx] = rows[:, 5]
+    deadline = np.zeros(len(keys), dtype="datetime64[s]")
+    deadline[post_idx] = deadlines
+
+    top_side = np.full(len(keys), -1, dtype=np.int64)
+    key_idx = {(board_id, post_id): i for i, (board_id, post_id) in enumerate(keys.tolist())}
+    for board_id, post_id, bet_side in storage.post_top_player_sides(cur, board_slug, start_date, end_date):
+        i = key_idx.get((board_id, post_id))
+        if i is not None:
+            top_side[i] = bet_side
+
+    # np.unique 는 (board_id, post_id) 순 → 누적 수익/낙폭 계산을 위해 마감 시각 순으로
+    order = np.lexsort((keys[:, 1], keys[:, 0], deadline))
+    return {
+        "keys": keys[order],
+        "deadline": deadline[order],
+        "pool": pool[order],
+        "payout": payout[order],
+        "top_bet": top_bet[order],
+        "top_side": top_side[order],
+    }
+
+
+def implied_odds(pools):
+    """
+    게시물별 내재 확률/배당.
+    - implied_prob: 사이드 풀 비중
+    - return_ratio: 총 반환액 / 총 풀 (1 - 수수료)
+    - multiplier:   사이드에 1을 걸었을 때 승리 시 돌려받는 배수
+    - winner:       실제 반환이 발생한 사이드 (-1: 판정 불가)
+    """
+    pool, payout = pools["pool"], pools["payout"]
+    total = pool.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        implied_prob = np.where(total[:, None] > 0, pool / total[:, None], 0.0)
+        return_ratio = np.where(total > 0, payout.sum(axis=1) / total, 0.0)
+        multiplier = np.where(pool > 0, (total * return_ratio)[:, None] / pool, 0.0)
+
+    winner = np.where(payout.max(axis=1) > 0, payout.argmax(axis=1), -1)
+    return {
+        "implied_prob": implied_prob,
+        "return_ratio": return_ratio,
+        "multiplier": multiplier,
+        "winner": winner,
+    }
+
+
+def choose_sides(pools, strategy):
+    """게시물별로 전략이 고른 사이드 (-1: 참여하지 않음)"""
+    pool = pools["pool"]
+    if strategy == "underdog":
+        return np.where(pool > 0, pool, np.inf).argmin(axis=1)
+    if strategy == "favorite":
+        return pool.argmax(axis=1)
+    if strategy == "follow_top":
+        return pools["top_side"]
+    if strategy == "biggest_bet":
+        return pools["top_bet"].argmax(axis=1)
+    raise ValueError(f"unknown strategy: {strategy}")
+
+
+def simulate(pools, strategy, stake):
+    """
+    모든 게시물에 stake 만큼 전략이 고른 사이드로 참여했다고 가정한 수익.
+    내 배팅도 풀에 더해지므로 배당은 (총 풀 + stake) * 반환율 / (사이드 풀 + stake).
+    누적 수익 / max_drawdown 은 pools 의 게시물 순서(load_pools: 마감 시각 순) 기준
+    """
+    odds = implied_odds(pools)
+    pool = pools["pool"]
+    chosen = choose_sides(pools, strategy)
+    # 2개 이상 사이드에 배팅이 있고 승자가 판정되며 전략이 사이드를 고른 게시물만 대상
+    valid = ((pool > 0).sum(axis=1) >= 2) & (odds["winner"] >= 0) & (chosen >= 0)
+
+    pool = pool[valid]
+    winner = odds["winner"][valid]
+    return_ratio = odds["return_ratio"][valid]
+    chosen = chosen[valid]
+
+    rows = np.arange(len(pool))
+    side_pool = pool[rows, chosen] + stake
+    total = pool.sum(axis=1) + stake
+    hit = chosen == winner
+    returned = np.where(hit, stake * total * return_ratio / side_pool, 0.0)
+    profit = returned - stake
+
+    n = int(valid.sum())
+    cumulative = np.cumsum(profit)
+    drawdown = np.maximum.accumulate(np.concatenate(([0.0], cumulative)))[1:] - cumulative
+    return {
+        "strategy": strategy,
+        "stake": stake,
+        "posts": n,
+        "hits": int(hit.sum()),
+        "hit_rate": round(float(hit.mean() * 100), 2) if n else 0.0,
+        "total_staked": float(stake * n),
+        "total_returned": round(float(returned.sum()), 2),
+        "total_profit": round(float(profit.sum()), 2),
+        "roi": round(float(profit.sum() / (stake * n) * 100), 2) if n else 0.0,
+        "avg_hit_multiplier": round(float((returned[hit] / stake).mean()), 4) if hit.any() else 0.0,
+        "max_drawdown": round(float(drawdown.max(initial=0.0)), 2),
+    }
+
+
+def run_simulation(strategies, stake, board_slug=None, start_date=None, end_date=None):
+    storage = get_storage()
+    with storage.cursor(readonly=True) as cur:
+        pools = load_pools(storage, cur, board_slug, start_date, end_date)
+    return [simulate(pools, s, stake) for s in strategies]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="배팅 풀 what-if 시뮬레이터")
+    parser.add_argument("--strategy", choices=STRATEGIES + ("all",), default="all")
+    parser.add_argument("--stake", type=int, default=1000)
+    parser.add_argument("--board", help="board slug (미지정 시 전체)")
+    parser.add_argument("--start", type=date.fromisoformat, help="YYYY-MM-DD")
+    parser.add_argument("--end", type=date.fromisoformat, help="YYYY-MM-DD")
+    args = parser.parse_args()
+
+    strategies = STRATEGIES if args.strategy == "all" else (args.strategy,)
+    results = run_simulation(strategies, args.stake, args.board, args.start, args.end)
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import hashlib
+import json
+import os
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from app.responses import columnar, dumps
+from app.storage import get_storage
+
+# 랭킹 스냅샷 (크롤링 완료 시 발행)
+#   기본 화면(이번 달 월간 / 어제 일간, 게시판별 + 전체)을 미리 계산해 JSON 파일로 저장
+#   → /ranking, /<folder>/ranking 페이지가 HTML 에 그대로 넣어 보내므로 첫 화면에 DB 조회/추가 요청 없음
+#   파일명에 내용 해시를 붙여 /snapshots/<file> 은 장기 캐시(immutable), 현재 파일 목록은 manifest.json
+#   python -m app.crawler.cli snapshots   # 수동 발행
+SNAPSHOT_DIR = Path(os.getenv("SNAPSHOT_DIR", Path(__file__).resolve().parent.parent / "snapshots"))
+SNAPSHOT_LIMIT = 50          # ranking.js 기본 요청과 같은 개수
+SNAPSHOT_MAX_AGE = 365 * 24 * 3600
+MANIFEST = "manifest.json"
+ALL_SCOPE = "all"            # 전체 게시판 합산
+
+RANKING_FIELDS = ("nickname", "total_bets", "total_amount", "total_profit", "wins", "win_rate")
+
+
+def default_periods(today=None):
+    """ranking.js 의 기본 조회값: (이번 달 1일, 어제)"""
+    today = today or date.today()
+    return today.replace(day=1), today - timedelta(days=1)
+
+
+def _write_atomic(path, body):
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(body)
+    os.replace(tmp, path)
+
+
+def build_snapshots(storage, today=None):
+    """반환: {scope: 스냅샷 dict} — scope 는 게시판 slug 또는 'all'"""
+    month, day = default_periods(today)
+
+    with storage.cursor(readonly=True, max_lag=0) as cur:
+        storage.execute(cur, "SELECT slug FROM boards ORDER BY slug")
+        scopes = [ALL_SCOPE] + [r[0] for r in cur.fetchall()]
+
+        snapshots = {}
+        for scope in scopes:
+            board_slug = None if scope == ALL_SCOPE else scope
+            monthly = storage.monthly_ranking(cur, month, SNAPSHOT_LIMIT, board_slug)
+            daily = storage.daily_ranking(cur, day, SNAPSHOT_LIMIT, board_slug)
+            snapshots[scope] = {
+                "board_slug": board_slug,
+                "monthly": {
+                    "period": month.strftime("%Y-%m"),
+                    "data": columnar(RANKING_FIELDS, monthly),
+                },
+                "daily": {
+                    "period": day.isoformat(),
+                    "data": columnar(RANKING_FIELDS, daily),
+                },
+            }
+    return snapshots
+
+
+def publish_snapshots(storage=None, today=None):
+    """
+    스냅샷 파일 쓰기 + manifest 교체.
+    이전 발행분은 한 세대만 남기고 정리 (교체 직전에 읽기 시작한 요청 보호)
+    반환: manifest dict
+    """
+    storage = storage or get_storage()
+    snapshots = build_snapshots(storage, today)
+    SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
+
+    files = {}
+    for scope, snapshot in snapshots.items():
+        # ?format=columnar 랭킹 응답과 같은 모양/직렬화, 데이터가 그대로면 파일명(해시)도 그대로
+        body = dumps(snapshot)
+        name = f"{scope}.{hashlib.sha1(body).hexdigest()[:12]}.json"
+        if not (SNAPSHOT_DIR / name).exists():
+            _write_atomic(SNAPSHOT_DIR / name, body)
+        files[scope] = name
+
+    previous = _read_manifest_file() or {"files": {}}
+    manifest = {"generated_at": datetime.now().isoformat(timespec="seconds"), "files": files}
+    _write_atomic(SNAPSHOT_DIR / MANIFEST, json.dumps(manifest, ensure_ascii=False, indent=2).encode())
+
+    keep = set(files.values()) | set(previous["files"].values()) | {MANIFEST}
+    for path in SNAPSHOT_DIR.glob("*.json"):
+        if path.name not in keep:
+            path.unlink(missing_ok=True)
+
+    print(f"[OK] 랭킹 스냅샷 발행: {len(files)}개 ({SNAPSHOT_DIR})")
+    return manifest
+
+
+# ---------------------------------------------------------------------
+# 페이지 인라인용 읽기 (웹 프로세스)
+#   manifest 는 mtime 이 바뀔 때만 다시 읽고, 스냅샷 본문은 파일명(=내용 해시)으로 캐시
+# ---------------------------------------------------------------------
+_manifest_cache = {"mtime": None, "manifest": None}
+_inline_cache = {}
+
+# <script> 안에 넣어도 안전하도록 (JSON 문자열로는 같은 값)
+_SCRIPT_ESCAPES = {ord("<"): "\\u003c", ord(">"): "\\u003e", ord("&"): "\\u0026",
+                   0x2028: "\\u2028", 0x2029: "\\u2029"}
+
+
+def _read_manifest_file():
+    try:
+        return json.loads((SNAPSHOT_DIR / MANIFEST).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _manifest():
+    try:
+        mtime = (SNAPSHOT_DIR / MANIFEST).stat().st_mtime_ns
+    except OSError:
+        return None
+    if mtime != _manifest_cache["mtime"]:
+        _manifest_cache["manifest"] = _read_manifest_file()
+        _manifest_cache["mtime"] = mtime
+    return _manifest_cache["manifest"]
+
+
+def snapshot_file(board_slug=None):
+    """현재 스냅샷 파일명 (없으면 None)"""
+    manifest = _manifest()
+    return manifest["files"].get(board_slug or ALL_SCOPE) if manifest else None
+
+
+def inline_snapshot(board_slug=None):
+    """
+    HTML <script> 에 바로 넣을 수 있는 스냅샷 JSON 문자열 (없으면 None).
+    스냅샷이 없으면 ranking.js 가 기존처럼 API 로 조회
+    """
+    name = snapshot_file(board_slug)
+    if name is None:
+        return None
+    if name not in _inline_cache:
+        try:
+            text = (SNAPSHOT_DIR / name).read_text(encoding="utf-8")
+        except OSError:
+            return None
+        if len(_inline_cache) > 64:
+            _inline_cache.clear()
+        _inline_cache[name] = text.translate(_SCRIPT_ESCAPES)
+    return _inline_cache[name]
+
@@ -0,0 +1,100 @@
+import subprocess
+import sys
+import time
+
+import click
+from flask import current_app
+
+# 패키지 import 시점을 부팅 시작으로 간주 (gunicorn 워커도 동일)
+BOOT_STARTED_AT = time.perf_counter()
+
+# 콜드 스타트 측정용 자식 프로세스: 앱 생성 → /healthz 1회 호출까지
+_COLD_START_SCRIPT = """
+import time
+t0 = time.perf_counter()
+from run import app
+t1 = time.perf_counter()
+app.test_client().get("/healthz")
+t2 = time.perf_counter()
+print(f"{(t1 - t0) * 1000:.1f} {(t2 - t0) * 1000:.1f}")
+"""
+
+
+def init_app(app):
+    app.extensions["startup"] = {"first_response_ms": None}
+
+    @app.after_request
+    def _record_first_response(response):
+        stats = app.extensions["startup"]
+        if stats["first_response_ms"] is None:
+            stats["first_response_ms"] = round((time.perf_counter() - BOOT_STARTED_AT) * 1000, 1)
+            print(f"[INFO] 첫 응답까지 {stats['first_response_ms']}ms (부팅 시작 기준)")
+        return response
+
+    app.cli.add_command(profile_startup)
+
+
+def startup_stats():
+    return current_app.extensions.get("startup", {})
+
+
+def _parse_importtime(stderr: str):
+    """
+    `python -X importtime` 출력 파싱
+    예) 'import time:       512 |       8093 | flask'
+    반환: [(cumulative_us, self_us, module), ...]
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0].strip())
+            cum_us = int(parts[1].strip())
+        except ValueError:
+            continue
+        rows.append((cum_us, self_us, parts[2].rstrip()))
+    return rows
+
+
+def _depth(name: str):
+    return len(name) - len(name.lstrip())
+
+
+@click.command("profile-startup")
+@click.option("--top", default=20, show_default=True, help="출력할 모듈 수")
+@click.option("--target", default="app", show_default=True, help="import 할 모듈")
+def profile_startup(top, target):
+    """import 시간 프로파일과 콜드 스타트 첫 응답 시간 측정"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+    )
+    rows = _parse_importtime(proc.stderr)
+    # 최상위 import(들여쓰기가 가장 얕은 모듈)의 누적 시간 합 = 전체 import 시간
+    top_depth = min((_depth(name) for _, _, name in rows), default=0)
+    total_us = sum(cum for cum, _, name in rows if _depth(name) == top_depth)
+
+    click.echo(f"[import] {target}: 총 {total_us / 1000:.1f}ms")
+    click.echo(f"{'cumulative(ms)':>15} {'self(ms)':>10}  module")
+    for cum, self_us, name in sorted(rows, reverse=True)[:top]:
+        click.echo(f"{cum / 1000:>15.1f} {self_us / 1000:>10.1f}  {name.strip()}")
+
+    # 인터프리터 기동부터 첫 응답까지 (자식 프로세스 벽시계 기준)
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", _COLD_START_SCRIPT],
+        capture_output=True,
+        text=True,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+    if proc.returncode != 0:
+        click.echo(f"[ERROR] 콜드 스타트 측정 실패: {proc.stderr.strip()}")
+        return
+    # 마지막 줄이 측정값 (앞쪽은 앱 로그)
+    import_ms, first_response_ms = proc.stdout.strip().splitlines()[-1].split()
+    click.echo(f"[cold start] app import {import_ms}ms / 첫 응답 {first_response_ms}ms / 프로세스 포함 {wall_ms:.1f}ms")
@@ -2,6 +2,7 @@
 document.addEventListener("DOMContentLoaded", () => {
   const startDateInput = document.getElementById("startDate");
   const select = document.querySelector("select[name=select]");
+  const sortSelect = document.getElementById("sortKey");
   const searchBtn = document.getElementById("searchBtn");
   const resultsDiv = document.getElementById("rankingResults");
 
@@ -44,13 +45,64 @@ document.addEventListener("DOMContentLoaded", () => {
     if (Number.isFinite(num)) return `${num.toFixed(2)}%`;
     return "-";
   };
+  // ?format=columnar 응답({field: [..]}) → 행 객체 배열
+  const fromColumns = (cols) => {
+    const fields = Object.keys(cols || {});
+    const n = fields.length ? cols[fields[0]].length : 0;
+    return Array.from({ length: n }, (_, i) =>
+      Object.fromEntries(fields.map((f) => [f, cols[f][i]])));
+  };
+
+  // ✅ 테이블 렌더링 (기존 컬럼 그대로)
+  function renderRanking(data) {
+    if (data.length === 0) {
+      resultsDiv.innerHTML = "<p>기록이 없습니다.</p>";
+      return;
+    }
+
+    let html = "<table><thead><tr><th>순위</th><th>닉네임</th><th>총 배팅액</th><th>순수익</th><th>베팅수</th><th>승리</th><th>승률(%)</th></tr></thead><tbody>";
+    data.forEach((row, idx) => {
+      html += `<tr>
+        <td>${idx + 1}</td>
+        <td>${row.nickname}</td>
+        <td>${nfmt(row.total_amount)}</td>
+        <td>${nfmt(row.total_profit)}</td>
+        <td>${nfmt(row.total_bets)}</td>
+        <td>${nfmt(row.wins)}</td>
+        <td>${pfmt(row.win_rate)}</td>
+      </tr>`;
+    });
+    html += "</tbody></table>";
+
+    resultsDiv.innerHTML = html;
+  }
+
+  // 정렬 기준: amount(배팅액) | profit(순수익) | win_rate(승률, 최소 배팅수 이상) | bets(배팅수)
+  const sortKey = () => (sortSelect ? sortSelect.value : "amount");
+
+  // 서버가 HTML 에 넣어 준 기본 랭킹 스냅샷 (크롤링 시 발행, 이번 달 월간 / 어제 일간, 배팅액순)
+  //   조회 기간/정렬이 스냅샷과 같으면 API 요청 없이 바로 표시
+  const snapshot = window.RANKING_SNAPSHOT;
+  const fromSnapshot = (type) => {
+    if (sortKey() !== "amount") return null;
+    const entry = snapshot && (type === "월간 배팅" ? snapshot.monthly : snapshot.daily);
+    return entry && entry.period === startDateInput.value ? fromColumns(entry.data) : null;
+  };
 
   async function fetchRanking(type) {
+    const cached = fromSnapshot(type);
+    if (cached) {
+      renderRanking(cached);
+      return;
+    }
+
     resultsDiv.innerHTML = "<p>불러오는 중...</p>";
 
     // slug 파라미터 추가 (폴더별 페이지에서 window.BOARD_SLUG 주입됨)
     const params = new URLSearchParams();
     if (window.BOARD_SLUG) params.set("boardSlug", window.BOARD_SLUG);
+    params.set("format", "columnar");
+    params.set("sort", sortKey());
 
     let url = "";
     if (type === "월간 배팅") {
@@ -68,39 +120,23 @@ document.addEventListener("DOMContentLoaded", () => {
         return;
       }
 
-      const data = await response.json();
-      if (!data || data.length === 0) {
-        resultsDiv.innerHTML = "<p>기록이 없습니다.</p>";
-        return;
-      }
-
-      // ✅ 테이블 렌더링 (기존 컬럼 그대로)
-      let html = "<table><thead><tr><th>순위</th><th>닉네임</th><th>총 배팅액</th><th>순수익</th><th>베팅수</th><th>승리</th><th>승률(%)</th></tr></thead><tbody>";
-      data.forEach((row, idx) => {
-        html += `<tr>
-          <td>${idx + 1}</td>
-          <td>${row.nickname}</td>
-          <td>${nfmt(row.total_amount)}</td>
-          <td>${nfmt(row.total_profit)}</td>
-          <td>${nfmt(row.total_bets)}</td>
-          <td>${nfmt(row.wins)}</td>
-          <td>${pfmt(row.win_rate)}</td>
-        </tr>`;
-      });
-      html += "</tbody></table>";
-
-      resultsDiv.innerHTML = html;
+      renderRanking(fromColumns(await response.json()));
     } catch (err) {
       resultsDiv.innerHTML = `<p>요청 실패: ${err.message}</p>`;
     }
   }
 
+  // ✅ 정렬 변경 시 바로 다시 조회
+  if (sortSelect) {
+    sortSelect.addEventListener("change", () => fetchRanking(select.value));
+  }
+
   // ✅ 검색 버튼 이벤트
   searchBtn.addEventListener("click", (e) => {
     e.preventDefault();
     fetchRanking(select.value);
   });
 
-  // ✅ 페이지 로드 시 자동 실행 → 이번 달 월간 랭킹 표시
+  // ✅ 페이지 로드 시 자동 실행 → 이번 달 월간 랭킹 표시 (스냅샷이 있으면 요청 없음)
   fetchRanking("월간 배팅");
 });
@@ -23,6 +23,15 @@ document.addEventListener("DOMContentLoaded", () => {
     if (Number.isFinite(num)) return `${num.toFixed(2)}%`;
     return "-";
   };
+  // 순위: "37위 / 2,100명" (순위 미계산 행은 -)
+  const rfmt = (rank, total) => (rank ? `${nfmt(rank)}위 / ${nfmt(total)}명` : "-");
+  // ?format=columnar 응답({field: [..]}) → 행 객체 배열
+  const fromColumns = (cols) => {
+    const fields = Object.keys(cols || {});
+    const n = fields.length ? cols[fields[0]].length : 0;
+    return Array.from({ length: n }, (_, i) =>
+      Object.fromEntries(fields.map((f) => [f, cols[f][i]])));
+  };
 
   // 초기 기본값: 월간 배팅(최근 3개월)
   const curY = today.getFullYear();
@@ -54,6 +63,32 @@ document.addEventListener("DOMContentLoaded", () => {
     }
   });
 
+  // 현재 순위 한 줄: "어제(2025-09-05) 배팅액 37위 / 2,100명 · 순이익 ..."
+  const rankLine = (label, period, r) => {
+    if (!r) return `<p>${label}(${period}) 순위: 기록 없음</p>`;
+    return `<p>${label}(${period}) 배팅액 ${rfmt(r.rank_amount, r.participants)} (상위 ${pfmt(100 - r.pct_amount)})`
+      + ` · 순이익 ${rfmt(r.rank_profit, r.participants)} (상위 ${pfmt(100 - r.pct_profit)})</p>`;
+  };
+
+  const topTable = (title, rows) => {
+    if (rows.length === 0) return "";
+    let html = `<h4>${title}</h4><table>
+      <thead><tr><th>순위</th><th>닉네임</th><th>총 배팅액</th><th>순이익</th><th>베팅수</th><th>승률(%)</th></tr></thead>
+      <tbody>`;
+    rows.forEach((row, i) => {
+      html += `<tr>
+        <td>${i + 1}</td>
+        <td>${row.nickname}</td>
+        <td>${nfmt(row.total_amount)}</td>
+        <td>${nfmt(row.total_profit)}</td>
+        <td>${nfmt(row.total_bets)}</td>
+        <td>${pfmt(row.win_rate)}</td>
+      </tr>`;
+    });
+    return html + `</tbody></table>`;
+  };
+
+  // 검색: /api/dashboard 한 번으로 통계 + 현재 순위 + 기간 랭킹 상위
   async function fetchStats(type) {
     const nicknameEl = document.getElementById("nickname");
     const nickname = nicknameEl ? nicknameEl.value.trim() : "";
@@ -62,10 +97,10 @@ document.addEventListener("DOMContentLoaded", () => {
     resultsDiv.innerHTML = "<p>불러오는 중...</p>";
 
     const isMonthly = type === "월간 배팅";
-    const endpoint  = isMonthly ? "/api/monthly_stats" : "/api/daily_stats";
 
     const params = new URLSearchParams();
     params.set("nickname", nickname);
+    params.set("format", "columnar");
 
     // index.html은 전체(파라미터 없음), 폴더별 페이지는 window.BOARD_SLUG로 고정
     if (typeof window !== "undefined" && window.BOARD_SLUG) {
@@ -83,30 +118,27 @@ document.addEventListener("DOMContentLoaded", () => {
     }
 
     try {
-      const res = await fetch(`${endpoint}?${params.toString()}`, {
+      const res = await fetch(`/api/dashboard?${params.toString()}`, {
         headers: { "Accept": "application/json" }
       });
+      if (res.status === 404) {
+        resultsDiv.innerHTML = `<p>결과가 없습니다.</p>`;
+        return;
+      }
       if (!res.ok) {
         resultsDiv.innerHTML = `<p>오류: ${res.status} ${res.statusText}</p>`;
         return;
       }
       const data = await res.json();
-      if (!data || data.error) {
-        resultsDiv.innerHTML = `<p>${data?.error || "결과가 없습니다."}</p>`;
-        return;
-      }
-      if (Object.keys(data).length === 0) {
-        resultsDiv.innerHTML = `<p>기록이 없습니다.</p>`;
-        return;
-      }
 
-      let html = "";
-      for (const [nick, stats] of Object.entries(data)) {
-        html += `<h3>${nick} (${type})</h3>`;
-        if (!Array.isArray(stats) || stats.length === 0) {
-          html += `<p>기록 없음</p>`;
-          continue;
-        }
+      const stats = fromColumns(isMonthly ? data.monthly : data.daily);
+      let html = `<h3>${data.nickname} (${type})</h3>`;
+      html += rankLine("어제", data.periods.daily, data.ranks.daily);
+      html += rankLine("이번 달", data.periods.monthly, data.ranks.monthly);
+
+      if (stats.length === 0) {
+        html += `<p>기록 없음</p>`;
+      } else {
         html += `<table>
           <thead>
             <tr>
@@ -116,6 +148,8 @@ document.addEventListener("DOMContentLoaded", () => {
               <th>베팅수</th>
               <th>승리</th>
               <th>승률(%)</th>
+              <th>배팅액 순위</th>
+              <th>순이익 순위</th>
             </tr>
           </thead>
           <tbody>`;
@@ -129,11 +163,17 @@ document.addEventListener("DOMContentLoaded", () => {
             <td>${nfmt(row.total_bets)}</td>
             <td>${nfmt(row.wins)}</td>
             <td>${pfmt(row.win_rate)}</td>
+            <td>${rfmt(row.rank_amount, row.participants)}</td>
+            <td>${rfmt(row.rank_profit, row.participants)}</td>
           </tr>`;
         });
 
         html += `</tbody></table>`;
       }
+
+      html += isMonthly
+        ? topTable(`${data.periods.monthly} 배팅액 랭킹`, fromColumns(data.top.monthly))
+        : topTable(`${data.periods.daily} 배팅액 랭킹`, fromColumns(data.top.daily));
       resultsDiv.innerHTML = html;
     } catch (err) {
       resultsDiv.innerHTML = `<p>요청 실패: ${err?.message || err}</p>`;
@@ -0,0 +1,36 @@
+import os
+
+from config import load_env
+from app.storage.base import ALL_BOARDS_ID, RANKING_SORTS, WIN_RATE_MIN_BETS, Storage, top_k
+
+load_env()
+
+# STORAGE_BACKEND: postgres(기본) | sqlite
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "postgres")
+SQLITE_PATH = os.getenv("SQLITE_PATH", "ygosu.sqlite3")
+# 원본 betting_stats 보존 개월 수 (이번 달 포함, 0 = 정리 안 함) — 그 이전 달은 요약 테이블만 유지
+RETENTION_MONTHS = int(os.getenv("RETENTION_MONTHS", "0"))
+
+_storage = None
+
+
+def create_storage(backend=None, **options):
+    backend = backend or STORAGE_BACKEND
+    if backend == "postgres":
+        from app.storage.postgres import PostgresStorage
+        return PostgresStorage(options.get("dsn"))
+    if backend == "sqlite":
+        from app.storage.sqlite import SqliteStorage
+        return SqliteStorage(options.get("path", SQLITE_PATH))
+    raise ValueError(f"unknown storage backend: {backend}")
+
+
+def get_storage():
+    global _storage
+    if _storage is None:
+        _storage = create_storage()
+    return _storage
+
+
+__all__ = ["ALL_BOARDS_ID", "RANKING_SORTS", "RETENTION_MONTHS", "STORAGE_BACKEND", "Storage", "WIN_RATE_MIN_BETS",
+           "create_storage", "get_storage", "top_k"]
@@ -0,0 +1,1762 @@
+import heapq
+import json
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+
+from app.storage.bridge import active_bridge
+
+# 파생 통계 테이블에서 전체 게시판 합산 행은 board_id = 0 으로 저장
+ALL_BOARDS_ID = 0
+
+# 집계 날짜 컷오프: 05:00 이전 마감은 전날로 집계
+DAY_CUTOFF = timedelta(hours=5)
+
+# 기본 테이블 (운영 Postgres 에는 이미 존재 — 새 DB/SQLite 를 만들 때 사용)
+BASE_SCHEMA_SQL = [
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id       SERIAL PRIMARY KEY,
+        nickname TEXT NOT NULL UNIQUE
+    );
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS boards (
+        id   SERIAL PRIMARY KEY,
+        slug TEXT NOT NULL UNIQUE,
+        name TEXT
+    );
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS betting_stats (
+        id            SERIAL PRIMARY KEY,
+        post_id       BIGINT    NOT NULL,
+        deadline_date TIMESTAMP NOT NULL,
+        user_id       INTEGER   NOT NULL REFERENCES users (id),
+        board_id      INTEGER   NOT NULL REFERENCES boards (id),
+        bet_side      INTEGER   NOT NULL,
+        bet_amount    INTEGER   NOT NULL,
+        payout_amount INTEGER   NOT NULL,
+        profit        INTEGER GENERATED ALWAYS AS (payout_amount - bet_amount) STORED,
+        created_at    TIMESTAMP,
+        UNIQUE (user_id, board_id, post_id, bet_side)
+    );
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS daily_betting_stats (
+        stat_date    DATE    NOT NULL,
+        user_id      INTEGER NOT NULL,
+        board_id     INTEGER NOT NULL,
+        total_bets   INTEGER NOT NULL DEFAULT 0,
+        total_amount INTEGER NOT NULL DEFAULT 0,
+        total_profit INTEGER NOT NULL DEFAULT 0,
+        wins         INTEGER NOT NULL DEFAULT 0,
+        created_at   TIMESTAMP,
+        UNIQUE (stat_date, user_id, board_id)
+    );
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS monthly_betting_stats (
+        stat_month   DATE    NOT NULL,
+        user_id      INTEGER NOT NULL,
+        board_id     INTEGER NOT NULL,
+        total_bets   INTEGER NOT NULL DEFAULT 0,
+        total_amount INTEGER NOT NULL DEFAULT 0,
+        total_profit INTEGER NOT NULL DEFAULT 0,
+        wins         INTEGER NOT NULL DEFAULT 0,
+        created_at   TIMESTAMP,
+        UNIQUE (stat_month, user_id, board_id)
+    );
+    """,
+]
+
+# 파생 테이블
+SCHEMA_SQL = [
+    # 게시판별 중복 체크 / 게시물 단위 집계용
+    """
+    CREATE INDEX IF NOT EXISTS idx_betting_stats_board_post
+        ON betting_stats (board_id, post_id);
+    """,
+    # 유저별 이력 재계산(누적 요약 / 누적합)용 — 기본 UNIQUE 인덱스는 stat_date 가 앞이라 유저 조건에 못 씀
+    """
+    CREATE INDEX IF NOT EXISTS idx_daily_betting_stats_user_date
+        ON daily_betting_stats (user_id, stat_date);
+    """,
+    # 게시물 단위 요약 (수집 시점에 1회 계산)
+    """
+    CREATE TABLE IF NOT EXISTS post_summary (
+        board_id       INTEGER   NOT NULL,
+        post_id        BIGINT    NOT NULL,
+        deadline_date  TIMESTAMP NOT NULL,
+        stat_date      DATE      NOT NULL,
+        stat_month     DATE      NOT NULL,
+        participants   INTEGER   NOT NULL,
+        side_count     INTEGER   NOT NULL,
+        total_amount   BIGINT    NOT NULL,
+        total_payout   BIGINT    NOT NULL,
+        winning_side   INTEGER,
+        top_user_id    INTEGER,
+        top_bet_amount BIGINT,
+        created_at     TIMESTAMP,
+        PRIMARY KEY (board_id, post_id)
+    );
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_post_summary_stat_date ON post_summary (stat_date);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_post_summary_stat_month ON post_summary (stat_month);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_post_summary_deadline ON post_summary (deadline_date DESC);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_post_summary_board_deadline ON post_summary (board_id, deadline_date DESC);
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS post_side_summary (
+        board_id      INTEGER NOT NULL,
+        post_id       BIGINT  NOT NULL,
+        bet_side      INTEGER NOT NULL,
+        bettors       INTEGER NOT NULL,
+        bet_amount    BIGINT  NOT NULL,
+        payout_amount BIGINT  NOT NULL,
+        max_bet       BIGINT  NOT NULL,
+        PRIMARY KEY (board_id, post_id, bet_side)
+    );
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS user_lifetime_stats (
+        user_id          INTEGER NOT NULL,
+        board_id         INTEGER NOT NULL,
+        total_bets       BIGINT  NOT NULL DEFAULT 0,
+        total_amount     BIGINT  NOT NULL DEFAULT 0,
+        total_profit     BIGINT  NOT NULL DEFAULT 0,
+        wins             BIGINT  NOT NULL DEFAULT 0,
+        first_seen       DATE,
+        last_seen        DATE,
+        best_day         DATE,
+        best_day_profit  BIGINT,
+        worst_day        DATE,
+        worst_day_profit BIGINT,
+        updated_at       TIMESTAMP,
+        PRIMARY KEY (user_id, board_id)
+    );
+    """,
+    # 유저별 일간 누적합 (prefix sum): 기간 합계 = 끝 행 - 시작 직전 행
+    """
+    CREATE TABLE IF NOT EXISTS daily_cumulative_stats (
+        board_id     INTEGER NOT NULL,
+        user_id      INTEGER NOT NULL,
+        stat_date    DATE    NOT NULL,
+        cum_bets     BIGINT  NOT NULL,
+        cum_amount   BIGINT  NOT NULL,
+        cum_profit   BIGINT  NOT NULL,
+        cum_wins     BIGINT  NOT NULL,
+        PRIMARY KEY (board_id, user_id, stat_date)
+    );
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_daily_cumulative_stats_board_date
+        ON daily_cumulative_stats (board_id, stat_date, user_id);
+    """,
+    # 기간별 순위/랭킹 (크롤링 때 기간 단위로 한 번 계산, board_id = 0 은 전체 게시판 합산)
+    #   rank_* / pct_*: 배팅액/순수익 기준 RANK(동률 같은 순위) + 백분위, participants: 참여자 수
+    #   pos_*: 정렬 기준별 랭킹 목록 위치 (동률은 닉네임순), pos_win_rate 는 WIN_RATE_MIN_BETS 이상 참여자만
+    #   랭킹 API 는 (기간, 게시판, pos_*) 커버링 인덱스만 순서대로 읽음 — 정렬/집계 없음
+    #   (SQLite 는 INCLUDE 미지원이라 응답 컬럼을 인덱스 키 뒤쪽에 둠)
+    """
+    CREATE TABLE IF NOT EXISTS daily_rank_stats (
+        user_id      INTEGER NOT NULL,
+        board_id     INTEGER NOT NULL,
+        stat_date    DATE    NOT NULL,
+        total_bets   INTEGER NOT NULL,
+        total_amount BIGINT  NOT NULL,
+        total_profit BIGINT  NOT NULL,
+        wins         INTEGER NOT NULL,
+        win_rate     DOUBLE PRECISION NOT NULL,
+        rank_amount  INTEGER NOT NULL,
+        rank_profit  INTEGER NOT NULL,
+        pct_amount   DOUBLE PRECISION NOT NULL,
+        pct_profit   DOUBLE PRECISION NOT NULL,
+        participants INTEGER NOT NULL,
+        pos_amount   INTEGER NOT NULL,
+        pos_profit   INTEGER NOT NULL,
+        pos_bets     INTEGER NOT NULL,
+        pos_win_rate INTEGER,
+        PRIMARY KEY (user_id, board_id, stat_date)
+    );
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_daily_rank_stats_amount
+        ON daily_rank_stats (stat_date, board_id, pos_amount,
+                             user_id, total_bets, total_amount, total_profit, wins, win_rate);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_daily_rank_stats_profit
+        ON daily_rank_stats (stat_date, board_id, pos_profit,
+                             user_id, total_bets, total_amount, total_profit, wins, win_rate);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_daily_rank_stats_bets
+        ON daily_rank_stats (stat_date, board_id, pos_bets,
+                             user_id, total_bets, total_amount, total_profit, wins, win_rate);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_daily_rank_stats_win_rate
+        ON daily_rank_stats (stat_date, board_id, pos_win_rate,
+                             user_id, total_bets, total_amount, total_profit, wins, win_rate)
+        WHERE pos_win_rate IS NOT NULL;
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS monthly_rank_stats (
+        user_id      INTEGER NOT NULL,
+        board_id     INTEGER NOT NULL,
+        stat_month   DATE    NOT NULL,
+        total_bets   INTEGER NOT NULL,
+        total_amount BIGINT  NOT NULL,
+        total_profit BIGINT  NOT NULL,
+        wins         INTEGER NOT NULL,
+        win_rate     DOUBLE PRECISION NOT NULL,
+        rank_amount  INTEGER NOT NULL,
+        rank_profit  INTEGER NOT NULL,
+        pct_amount   DOUBLE PRECISION NOT NULL,
+        pct_profit   DOUBLE PRECISION NOT NULL,
+        participants INTEGER NOT NULL,
+        pos_amount   INTEGER NOT NULL,
+        pos_profit   INTEGER NOT NULL,
+        pos_bets     INTEGER NOT NULL,
+        pos_win_rate INTEGER,
+        PRIMARY KEY (user_id, board_id, stat_month)
+    );
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_monthly_rank_stats_amount
+        ON monthly_rank_stats (stat_month, board_id, pos_amount,
+                               user_id, total_bets, total_amount, total_profit, wins, win_rate);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_monthly_rank_stats_profit
+        ON monthly_rank_stats (stat_month, board_id, pos_profit,
+                               user_id, total_bets, total_amount, total_profit, wins, win_rate);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_monthly_rank_stats_bets
+        ON monthly_rank_stats (stat_month, board_id, pos_bets,
+                               user_id, total_bets, total_amount, total_profit, wins, win_rate);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_monthly_rank_stats_win_rate
+        ON monthly_rank_stats (stat_month, board_id, pos_win_rate,
+                               user_id, total_bets, total_amount, total_profit, wins, win_rate)
+        WHERE pos_win_rate IS NOT NULL;
+    """,
+    # 게시판 개요: (게시판, 기간)별 게시물 수 / 참여자 수 / 배팅액 / 지급액 (board_id = 0 은 전체 게시판)
+    #   요약 테이블(post_summary, 일간·월간 통계)에서 기간 단위로 계산 — 원본이 정리된 달도 유지
+    #   추이 조회는 PK (board_id, 기간) 범위 스캔
+    """
+    CREATE TABLE IF NOT EXISTS daily_board_stats (
+        board_id     INTEGER NOT NULL,
+        stat_date    DATE    NOT NULL,
+        posts        INTEGER NOT NULL,
+        participants INTEGER NOT NULL,
+        total_amount BIGINT  NOT NULL,
+        total_payout BIGINT  NOT NULL,
+        updated_at   TIMESTAMP,
+        PRIMARY KEY (board_id, stat_date)
+    );
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS monthly_board_stats (
+        board_id     INTEGER NOT NULL,
+        stat_month   DATE    NOT NULL,
+        posts        INTEGER NOT NULL,
+        participants INTEGER NOT NULL,
+        total_amount BIGINT  NOT NULL,
+        total_payout BIGINT  NOT NULL,
+        updated_at   TIMESTAMP,
+        PRIMARY KEY (board_id, stat_month)
+    );
+    """,
+    # 백필 샤드별 진행 위치 (중단 후 재실행 시 이어서 처리)
+    """
+    CREATE TABLE IF NOT EXISTS crawl_checkpoints (
+        job_key     TEXT      NOT NULL,
+        shard_no    INTEGER   NOT NULL,
+        range_start BIGINT    NOT NULL,
+        range_end   BIGINT    NOT NULL,
+        next_value  BIGINT    NOT NULL,
+        done        BOOLEAN   NOT NULL DEFAULT FALSE,
+        updated_at  TIMESTAMP NOT NULL,
+        PRIMARY KEY (job_key, shard_no)
+    );
+    """,
+    # 백필 중 재시도 후에도 받지 못한 게시물 (체크포인트는 넘어가므로 여기 남겨 두고 다음 실행에서 먼저 다시 시도)
+    """
+    CREATE TABLE IF NOT EXISTS crawl_failed_posts (
+        job_key   TEXT      NOT NULL,
+        slug      TEXT      NOT NULL,
+        post_id   BIGINT    NOT NULL,
+        attempts  INTEGER   NOT NULL,
+        error     TEXT,
+        failed_at TIMESTAMP NOT NULL,
+        PRIMARY KEY (job_key, slug, post_id)
+    );
+    """,
+    # 웹에서 띄운 크롤링 실행 기록 / 진행 이벤트 (app/crawl_stream.py)
+    #   여러 워커 프로세스가 같은 상태를 보도록 DB 에 저장, status: running | ok | error
+    #   running 은 한 번에 하나만 (부분 유니크 인덱스)
+    """
+    CREATE TABLE IF NOT EXISTS crawl_runs (
+        run_id       TEXT      PRIMARY KEY,
+        status       TEXT      NOT NULL,
+        started_at   TIMESTAMP NOT NULL,
+        heartbeat_at TIMESTAMP NOT NULL,
+        finished_at  TIMESTAMP,
+        summary      TEXT
+    );
+    """,
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_crawl_runs_running ON crawl_runs (status) WHERE status = 'running';
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_crawl_runs_started ON crawl_runs (started_at DESC);
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS crawl_events (
+        id         SERIAL PRIMARY KEY,
+        run_id     TEXT      NOT NULL,
+        event      TEXT      NOT NULL,
+        data       TEXT      NOT NULL,
+        created_at TIMESTAMP NOT NULL
+    );
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_crawl_events_run ON crawl_events (run_id, id);
+    """,
+    # 보존 기간이 지나 원본(betting_stats)을 요약만 남기고 정리한 달 (마감 월 기준)
+    """
+    CREATE TABLE IF NOT EXISTS compacted_months (
+        month        DATE      PRIMARY KEY,
+        posts        INTEGER   NOT NULL,
+        records      INTEGER   NOT NULL,
+        compacted_at TIMESTAMP NOT NULL
+    );
+    """,
+]
+
+
+def as_date(value):
+    # SQLite 집계 결과(MIN/MAX)는 타입 정보가 없어 문자열로 옴
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    return value
+
+
+def month_start(value):
+    return as_date(value).replace(day=1)
+
+
+def next_month(value):
+    first = month_start(value)
+    return (first + timedelta(days=32)).replace(day=1)
+
+
+def stat_date_of(deadline):
+    return (deadline - DAY_CUTOFF).date()
+
+
+def win_rate_sql(wins, bets):
+    # 승률(%) 소수 둘째 자리 — 파이썬 루프 대신 SQL 에서 계산 (두 백엔드 모두 float 로 반환)
+    return f"CAST(ROUND(CASE WHEN ({bets}) > 0 THEN ({wins}) * 100.0 / ({bets}) ELSE 0 END, 2) AS DOUBLE PRECISION)"
+
+
+# 랭킹 정렬 기준 → 순서 (동률은 닉네임순, *_rank_stats.pos_<key> 로 미리 계산)
+RANKING_SORTS = {
+    "amount":   "total_amount DESC",
+    "profit":   "total_profit DESC",
+    "bets":     "total_bets DESC, total_amount DESC",
+    "win_rate": "win_rate DESC, total_bets DESC",
+}
+
+# 승률 랭킹 배팅수 하한 (API 기본 minBets) — 1~2회 참여자의 100% 승률이 앞을 차지하지 않도록
+#   pos_win_rate 는 이 이상 참여한 유저끼리만 매김 (나머지 NULL) → 승률 랭킹도 인덱스 범위만 읽음
+WIN_RATE_MIN_BETS = {"daily": 5, "monthly": 20}
+
+
+def percentile_sql(order_by, partition_by):
+    # 백분위(100 = 1위, 0 = 꼴찌) 소수 둘째 자리 — 혼자면 100
+    return (f"CAST(ROUND(CAST(100 * (1 - PERCENT_RANK() OVER (PARTITION BY {partition_by} ORDER BY {order_by}))"
+            f" AS NUMERIC), 2) AS DOUBLE PRECISION)")
+
+
+# 일간/월간 통계: (집계 테이블, 순위 테이블, 기간 컬럼)
+STATS_TABLES = {
+    "daily":   ("daily_betting_stats", "daily_rank_stats", "stat_date"),
+    "monthly": ("monthly_betting_stats", "monthly_rank_stats", "stat_month"),
+}
+
+# 게시판 개요 테이블 (기간 컬럼은 STATS_TABLES 와 같음)
+BOARD_STATS_TABLES = {
+    "daily":   "daily_board_stats",
+    "monthly": "monthly_board_stats",
+}
+
+# 일간/월간 통계 조회에 붙는 순위 컬럼 (r = *_rank_stats)
+RANK_COLUMNS = "r.rank_amount, r.rank_profit, r.pct_amount, r.pct_profit, r.participants"
+
+
+def top_k(rows, k, key):
+    # 전체 정렬 없이 정렬 키(오름차순) 기준 앞쪽 k개만 선택 (O(n log k))
+    return heapq.nsmallest(k, rows, key=key)
+
+
+class Storage:
+    """
+    저장소 공통 구현.
+    SQL 은 psycopg2 스타일(%s / %(name)s)로 작성하고,
+    DB 마다 다른 부분(연결, 날짜 버킷, 배열 파라미터, 플레이스홀더)만 백엔드에서 구현한다.
+    """
+
+    name = "base"
+    BASE_SCHEMA_SQL = BASE_SCHEMA_SQL
+    SCHEMA_SQL = SCHEMA_SQL
+    _schema_ready = False
+    _post_summary_ready = False
+
+    # -----------------------------------------------------------------
+    # 백엔드별 구현
+    # -----------------------------------------------------------------
+    def connect(self, readonly=False, max_lag=None):
+        """
+        readonly=True 면 읽기 전용 복제본으로 보낼 수 있음 (지원하는 백엔드만).
+        max_lag: 허용할 복제 지연(초), 0 이면 최신 데이터 필요
+        """
+        raise NotImplementedError
+
+    def day_bucket(self, col):
+        """deadline 기준 05:00 컷오프 날짜 (= deadline - 5시간의 날짜)"""
+        raise NotImplementedError
+
+    def month_bucket(self, col):
+        """day_bucket 이 속한 달의 1일"""
+        raise NotImplementedError
+
+    def in_param(self, col, name):
+        """col 이 배열 파라미터 name 에 포함되는지 검사하는 SQL 조각"""
+        raise NotImplementedError
+
+    def array_param(self, values):
+        """in_param 에 넘길 파라미터 값"""
+        raise NotImplementedError
+
+    def prepare(self, sql):
+        """psycopg2 스타일 SQL → 드라이버 플레이스홀더"""
+        return sql
+
+    def ensure_partitions(self, cur, table, months):
+        """월 파티션 테이블이면 months(각 달 1일)의 파티션을 미리 생성 (미지원 백엔드는 무시)"""
+
+    def drop_raw_month(self, cur, month, drop=False):
+        """
+        보존 기간이 지난 달의 원본 행 정리.
+        기본: 해당 마감 월 행 삭제 (파티션 백엔드는 파티션 분리, drop=True 면 삭제)
+        """
+        self.execute(cur, """
+            DELETE FROM betting_stats WHERE deadline_date >= %s AND deadline_date < %s
+        """, (datetime.combine(month, datetime.min.time()),
+              datetime.combine(next_month(month), datetime.min.time())))
+
+    # -----------------------------------------------------------------
+    # 공통 헬퍼
+    # -----------------------------------------------------------------
+    def execute(self, cur, sql, params=()):
+        cur.execute(self.prepare(sql), params)
+        return cur
+
+    @contextmanager
+    def cursor(self, commit=False, readonly=False, max_lag=None):
+        bridge = active_bridge()
+        if bridge is not None:
+            # ASGI 모드: 쿼리는 이벤트 루프가 비동기 풀에서 실행 (app/storage/bridge.py)
+            if commit:
+                raise RuntimeError("ASGI 조회 경로에서는 쓰기 커서를 열 수 없습니다")
+            yield bridge.cursor(readonly=readonly, max_lag=max_lag)
+            return
+        conn = self.connect(readonly=readonly, max_lag=max_lag)
+        cur = conn.cursor()
+        try:
+            yield cur
+            if commit:
+                conn.commit()
+        except BaseException:
+            # 롤백된 트랜잭션 안의 스키마 생성/요약 계산은 취소됐을 수 있으므로 다음에 다시 확인
+            if commit:
+                self._schema_ready = self._post_summary_ready = False
+            raise
+        finally:
+            cur.close()
+            conn.close()
+
+    def ensure_schema(self, cur, force=False):
+        """
+        테이블/인덱스 생성 — 프로세스당 한 번 (force=True 면 다시 실행).
+        CREATE INDEX IF NOT EXISTS 도 테이블 잠금(ShareLock)을 잡으므로 배치마다 실행하면
+        동시에 쓰는 크롤링/백필끼리 서로 막힘
+        """
+        if self._schema_ready and not force:
+            return
+        for ddl in self.BASE_SCHEMA_SQL + self.SCHEMA_SQL:
+            self.execute(cur, ddl)
+
+        # 순위 테이블 도입 전 DB: 일간 통계는 있는데 순위가 비어 있으면 한 번 전체 계산
+        #   (그대로 두면 이후 수집이 건드린 기간만 채워져 지난 기간 랭킹/순위가 빈 채로 남음)
+        self.execute(cur, "SELECT EXISTS (SELECT 1 FROM daily_rank_stats), EXISTS (SELECT 1 FROM daily_betting_stats)")
+        has_ranks, has_stats = cur.fetchone()
+        if has_stats and not has_ranks:
+            print("[INFO] 순위 테이블이 비어 있음 → 기존 일간/월간 통계로 전체 순위 계산")
+            self.update_rank_stats(cur)
+        self._schema_ready = True
+
+    def prepare_schema(self):
+        """조회만 하는 호출부용 스키마 확인 — 이 프로세스에서 이미 확인했으면 쓰기 트랜잭션을 열지 않음"""
+        if not self._schema_ready:
+            with self.cursor(commit=True) as cur:
+                self.ensure_schema(cur)
+
+    def ensure_post_summary(self, cur):
+        """
+        기간 집계 전에 호출: 원본(betting_stats)은 있는데 post_summary 가 비어 있으면 (요약 테이블 도입 전 DB)
+        전체 게시물 요약부터 계산. 일간/월간 집계는 post_summary 기준이라 빈 채로 증분 집계하면
+        이번 배치 게시물만으로 기존 기간 통계를 덮어씀. 한 번 채워지면 다시 비지 않으므로 프로세스당 한 번만 확인
+        """
+        if self._post_summary_ready:
+            return
+        self.execute(cur, "SELECT EXISTS (SELECT 1 FROM post_summary), EXISTS (SELECT 1 FROM betting_stats)")
+        has_summary, has_raw = cur.fetchone()
+        if has_raw and not has_summary:
+            print("[INFO] post_summary 가 비어 있음 → 기존 원본으로 게시물 요약 계산")
+            self.update_post_summary(cur)
+        self._post_summary_ready = True
+
+    # -----------------------------------------------------------------
+    # 수집 (ingest)
+    # -----------------------------------------------------------------
+    def get_or_create_user(self, cur, nickname, cache=None):
+        if cache is not None and nickname in cache:
+            return cache[nickname]
+
+        self.execute(cur, "INSERT INTO users (nickname) VALUES (%s) ON CONFLICT (nickname) DO NOTHING;", (nickname,))
+        self.execute(cur, "SELECT id FROM users WHERE nickname = %s", (nickname,))
+        user_id = cur.fetchone()[0]
+
+        if cache is not None:
+            cache[nickname] = user_id
+        return user_id
+
+    def get_or_create_board(self, cur, slug, cache=None):
+        if cache is not None and slug in cache:
+            return cache[slug]
+
+        self.execute(cur, "INSERT INTO boards (slug, name) VALUES (%s, %s) ON CONFLICT (slug) DO NOTHING;", (slug, slug))
+        self.execute(cur, "SELECT id FROM boards WHERE slug = %s", (slug,))
+        board_id = cur.fetchone()[0]
+
+        if cache is not None:
+            cache[slug] = board_id
+        return board_id
+
+    def insert_records(self, posts_records, aggregate=True, rank=True):
+        """
+        게시물별 레코드 저장 + 영향받은 기간/유저만 증분 집계.
+        - aggregate=False: 저장만 하고 집계는 건너뜀 (백필 후 rebuild_stats 한 번으로 처리)
+        - rank=False: 기간 순위는 건너뜀 (크롤링 끝에 periods 를 모아 refresh_ranks 한 번으로 처리)
+        반환: dict(posts, records, stat_dates, stat_months, users) — 새로 저장/갱신된 개수
+              + periods: (stat_dates, stat_months) 다시 집계한 기간
+        """
+        with self.cursor(commit=True) as cur:
+            self.ensure_schema(cur)
+            if aggregate:
+                self.ensure_post_summary(cur)
+            compacted_before = self.compacted_before(cur)
+
+            user_cache = {}
+            board_cache = {}
+            new_post_keys = {}  # {board_id: [post_id, ...]} 이번 배치에서 새로 저장한 게시물
+            deadlines = []
+            inserted = 0
+
+            for post_id, records in posts_records.items():
+                if not records:
+                    continue
+
+                # 요약만 남은(정리된) 달의 게시물은 다시 넣지 않음 — 해당 기간 집계가 부분 데이터로 덮어써지는 것 방지
+                if compacted_before and stat_date_of(records[0]["deadline_at"]) < compacted_before:
+                    print(f"[WARN] 보존 기간 지난 게시물 건너뜀 → slug={records[0]['slug']}, post_id={post_id}")
+                    continue
+
+                # 게시판별 중복 체크: (board_id, post_id)
+                #   post_summary(파티션 없음, PK) 먼저, 집계 전(백필) 기록은 betting_stats 로 확인
+                #   betting_stats 는 마감 시각 ±1일로 한정 — 월 파티션 전체가 아니라 해당 파티션만 조회
+                first_slug = records[0]["slug"]
+                board_id_for_check = self.get_or_create_board(cur, first_slug, board_cache)
+                post_deadlines = [r["deadline_at"] for r in records]
+                self.execute(
+                    cur,
+                    """
+                    SELECT 1 FROM post_summary WHERE board_id = %(board_id)s AND post_id = %(post_id)s
+                    UNION ALL
+                    SELECT 1 FROM betting_stats
+                    WHERE board_id = %(board_id)s AND post_id = %(post_id)s
+                      AND deadline_date BETWEEN %(deadline_lo)s AND %(deadline_hi)s
+                    LIMIT 1;
+                    """,
+                    {"board_id": board_id_for_check, "post_id": int(post_id),
+                     "deadline_lo": min(post_deadlines) - timedelta(days=1),
+                     "deadline_hi": max(post_deadlines) + timedelta(days=1)},
+                )
+                if cur.fetchone():
+                    continue
+                new_post_keys.setdefault(board_id_for_check, []).append(int(post_id))
+                deadlines.extend(r["deadline_at"] for r in records)
+
+                # 새 달이면 파티션 생성 (원본: 마감 월, 일간 통계: 집계 날짜 월)
+                self.ensure_partitions(cur, "betting_stats", {month_start(r["deadline_at"]) for r in records})
+                self.ensure_partitions(cur, "daily_betting_stats",
+                                       {month_start(stat_date_of(r["deadline_at"])) for r in records})
+
+                rows = []
+                for r in records:
+                    user_id = self.get_or_create_user(cur, r["nickname"], user_cache)
+                    board_id = self.get_or_create_board(cur, r["slug"], board_cache)
+                    rows.append((
+                        r["post_id"], r["deadline_at"], user_id, board_id,
+                        r["bet_side"], r["bet_amount"], r["payout_amount"]
+                    ))
+
+                cur.executemany(self.prepare("""
+                    INSERT INTO betting_stats
+                    (post_id, deadline_date, user_id, board_id, bet_side, bet_amount, payout_amount, created_at)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
+                    ON CONFLICT DO NOTHING;
+                """), rows)
+                inserted += len(rows)
+
+            if not aggregate:
+                return {
+                    "posts": sum(len(ids) for ids in new_post_keys.values()),
+                    "records": inserted,
+                    "stat_dates": 0,
+                    "stat_months": 0,
+                    "users": 0,
+                    "periods": (set(), set()),
+                }
+
+            # 새 게시물 요약 → 해당 날짜/월만 다시 집계
+            deadline_range = (min(deadlines), max(deadlines)) if deadlines else None
+            stat_dates, stat_months = self.update_post_summary(cur, new_post_keys, deadline_range)
+            if stat_dates:
+                self.update_daily_stats(cur, stat_dates, compacted_before)
+                self.update_monthly_stats(cur, stat_months, compacted_before)
+                self.update_board_stats(cur, stat_dates, stat_months)
+                if rank:
+                    self.update_rank_stats(cur, stat_dates, stat_months)
+            # 이번 배치에 새 기록이 들어온 유저만 누적 요약/누적합 갱신
+            if user_cache:
+                touched_user_ids = set(user_cache.values())
+                self.update_lifetime_stats(cur, touched_user_ids)
+                if stat_dates:
+                    self.update_cumulative_stats(cur, touched_user_ids, since=as_date(min(stat_dates)))
+
+        return {
+            "posts": sum(len(ids) for ids in new_post_keys.values()),
+            "records": inserted,
+            "stat_dates": len(stat_dates),
+            "stat_months": len(stat_months),
+            "users": len(user_cache),
+            "periods": (stat_dates, stat_months),
+        }
+
+    def rebuild_stats(self):
+        # 파생 통계 전체 재계산 (스키마 추가 직후 기존 데이터 채우기용)
+        # 정리된 달은 원본이 없으므로 요약을 그대로 두고 이후 기간만 다시 계산
+        with self.cursor(commit=True) as cur:
+            self.ensure_schema(cur)
+            compacted_before = self.compacted_before(cur)
+            self.update_post_summary(cur)
+            self.update_daily_stats(cur, since=compacted_before)
+            self.update_monthly_stats(cur, since=compacted_before)
+            self.update_lifetime_stats(cur)
+            self.update_cumulative_stats(cur)
+            self.update_board_stats(cur)
+            self.update_rank_stats(cur)
+
+    def refresh_ranks(self, stat_dates, stat_months):
+        # insert_records(rank=False) 로 미룬 기간 순위를 한 번에 계산
+        if not stat_dates and not stat_months:
+            return
+        with self.cursor(commit=True) as cur:
+            self.update_rank_stats(cur, stat_dates, stat_months)
+
+    # -----------------------------------------------------------------
+    # 집계 (aggregation)
+    # -----------------------------------------------------------------
+    def update_post_summary(self, cur, post_keys=None, deadline_range=None):
+        """
+        게시물 단위 요약(post_summary / post_side_summary)을 betting_stats 에서 계산.
+        - post_keys: {board_id: [post_id, ...]} (None 이면 전체 재계산)
+        - deadline_range: (최소, 최대) 마감 시각 — 원본 조회를 해당 파티션으로 한정
+        - 반환: 영향받은 (stat_dates, stat_months) — 일간/월간 집계 대상
+        """
+        if post_keys is None:
+            scopes = [("", {})]
+        else:
+            scopes = [
+                (f"WHERE board_id = %(board_id)s AND {self.in_param('post_id', 'post_ids')}",
+                 {"board_id": board_id, "post_ids": self.array_param(post_ids)})
+                for board_id, post_ids in post_keys.items() if post_ids
+            ]
+
+        stat_dates, stat_months = set(), set()
+        for post_filter, params in scopes:
+            raw_filter = post_filter
+            if deadline_range:
+                raw_filter += " AND deadline_date BETWEEN %(deadline_lo)s AND %(deadline_hi)s"
+                params = {**params, "deadline_lo": deadline_range[0], "deadline_hi": deadline_range[1]}
+            self.execute(cur, f"""
+                INSERT INTO post_side_summary
+                    (board_id, post_id, bet_side, bettors, bet_amount, payout_amount, max_bet)
+                SELECT board_id, post_id, bet_side,
+                       COUNT(*), SUM(bet_amount), SUM(payout_amount), MAX(bet_amount)
+                FROM betting_stats
+                {raw_filter}
+                GROUP BY board_id, post_id, bet_side
+                ON CONFLICT (board_id, post_id, bet_side)
+                DO UPDATE SET
+                    bettors       = EXCLUDED.bettors,
+                    bet_amount    = EXCLUDED.bet_amount,
+                    payout_amount = EXCLUDED.payout_amount,
+                    max_bet       = EXCLUDED.max_bet;
+            """, params)
+
+            self.execute(cur, f"""
+                WITH per_post AS (
+                    SELECT board_id, post_id,
+                           MAX(deadline_date)      AS deadline_date,
+                           COUNT(DISTINCT user_id) AS participants
+                    FROM betting_stats
+                    {raw_filter}
+                    GROUP BY board_id, post_id
+                ),
+                sides AS (
+                    SELECT board_id, post_id,
+                           COUNT(*)           AS side_count,
+                           SUM(bet_amount)    AS total_amount,
+                           SUM(payout_amount) AS total_payout,
+                           MAX(CASE WHEN payout_rn = 1 AND payout_amount > 0 THEN bet_side END) AS winning_side
+                    FROM (
+                        SELECT post_side_summary.*,
+                               ROW_NUMBER() OVER (PARTITION BY board_id, post_id ORDER BY payout_amount DESC, bet_side) AS payout_rn
+                        FROM post_side_summary
+                        {post_filter}
+                    ) s
+                    GROUP BY board_id, post_id
+                ),
+                top_bet AS (
+                    SELECT board_id, post_id, user_id, bet_amount
+                    FROM (
+                        SELECT board_id, post_id, user_id, bet_amount,
+                               ROW_NUMBER() OVER (PARTITION BY board_id, post_id ORDER BY bet_amount DESC, user_id) AS rn
+                        FROM betting_stats
+                        {raw_filter}
+                    ) t
+                    WHERE rn = 1
+                )
+                INSERT INTO post_summary
+                    (board_id, post_id, deadline_date, stat_date, stat_month,
+                     participants, side_count, total_amount, total_payout, winning_side,
+                     top_user_id, top_bet_amount, created_at)
+                SELECT
+                    p.board_id,
+                    p.post_id,
+                    p.deadline_date,
+                    {self.day_bucket("p.deadline_date")},
+                    {self.month_bucket("p.deadline_date")},
+                    p.participants,
+                    s.side_count,
+                    s.total_amount,
+                    s.total_payout,
+                    s.winning_side,
+                    t.user_id,
+                    t.bet_amount,
+                    CURRENT_TIMESTAMP
+                FROM per_post p
+                JOIN sides   s ON s.board_id = p.board_id AND s.post_id = p.post_id
+                JOIN top_bet t ON t.board_id = p.board_id AND t.post_id = p.post_id
+                WHERE true
+                ON CONFLICT (board_id, post_id)
+                DO UPDATE SET
+                    deadline_date  = EXCLUDED.deadline_date,
+                    stat_date      = EXCLUDED.stat_date,
+                    stat_month     = EXCLUDED.stat_month,
+                    participants   = EXCLUDED.participants,
+                    side_count     = EXCLUDED.side_count,
+                    total_amount   = EXCLUDED.total_amount,
+                    total_payout   = EXCLUDED.total_payout,
+                    winning_side   = EXCLUDED.winning_side,
+                    top_user_id    = EXCLUDED.top_user_id,
+                    top_bet_amount = EXCLUDED.top_bet_amount
+                RETURNING stat_date, stat_month;
+            """, params)
+            for stat_date, stat_month in cur.fetchall():
+                stat_dates.add(stat_date)
+                stat_months.add(stat_month)
+
+        return stat_dates, stat_months
+
+    def _update_period_stats(self, cur, table, period_col, periods, since=None):
+        """
+        post_summary 의 기간 버킷(stat_date / stat_month)으로 유저별 기간 통계 집계.
+        - 양방(한 게시물에 2개 이상 사이드) 참여는 순수익만 반영 (배팅수/배팅액/승리 제외)
+        - periods 가 주어지면 해당 기간만 다시 집계 (None 이면 전체)
+        - since: 이 날짜 이전 기간은 건드리지 않음 (원본이 정리된 달)
+        원본 betting_stats 는 기간 버킷에 해당하는 마감 시각 범위로도 거르므로 파티션 프루닝이 적용됨
+        """
+        conditions = []
+        params = {"periods": self.array_param(periods or [])}
+        raw_lo = raw_hi = None
+        if periods is not None:
+            conditions.append(self.in_param("p." + period_col, "periods"))
+            periods = [as_date(v) for v in periods]
+            raw_lo = min(periods)
+            raw_hi = next_month(max(periods)) if period_col == "stat_month" else max(periods) + timedelta(days=1)
+        if since is not None:
+            conditions.append(f"p.{period_col} >= %(since)s")
+            params["since"] = since
+            raw_lo = max(raw_lo, since) if raw_lo else since
+        # 버킷 [lo, hi) ↔ 마감 시각 [lo + 5시간, hi + 5시간)
+        if raw_lo is not None:
+            conditions.append("s.deadline_date >= %(raw_lo)s")
+            params["raw_lo"] = datetime.combine(raw_lo, datetime.min.time()) + DAY_CUTOFF
+        if raw_hi is not None:
+            conditions.append("s.deadline_date < %(raw_hi)s")
+            params["raw_hi"] = datetime.combine(raw_hi, datetime.min.time()) + DAY_CUTOFF
+        period_filter = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        self.execute(cur, f"""
+            WITH per_user_post AS (
+                SELECT
+                    p.{period_col} AS period,
+                    s.user_id,
+                    s.board_id,
+                    SUM(s.profit)              AS net_profit,
+                    MAX(s.bet_amount)          AS amount_one_side,
+                    COUNT(DISTINCT s.bet_side) AS sides
+                FROM betting_stats s
+                JOIN post_summary p ON p.board_id = s.board_id AND p.post_id = s.post_id
+                {period_filter}
+                GROUP BY p.{period_col}, s.user_id, s.board_id, s.post_id
+            )
+            INSERT INTO {table} ({period_col}, user_id, board_id, total_bets, total_amount, total_profit, wins, created_at)
+            SELECT
+                period,
+                user_id,
+                board_id,
+                SUM(CASE WHEN sides = 1 THEN 1 ELSE 0 END),
+                SUM(CASE WHEN sides = 1 THEN amount_one_side ELSE 0 END),
+                SUM(net_profit),
+                SUM(CASE WHEN sides = 1 AND net_profit > 0 THEN 1 ELSE 0 END),
+                CURRENT_TIMESTAMP
+            FROM per_user_post
+            GROUP BY period, user_id, board_id
+            ON CONFLICT ({period_col}, user_id, board_id)
+            DO UPDATE SET
+                total_bets   = EXCLUDED.total_bets,
+                total_amount = EXCLUDED.total_amount,
+                total_profit = EXCLUDED.total_profit,
+                wins         = EXCLUDED.wins,
+                created_at   = CURRENT_TIMESTAMP;
+        """, params)
+
+    def update_daily_stats(self, cur, stat_dates=None, since=None):
+        # deadline_date 기준 05:00 컷오프 (post_summary.stat_date)
+        self._update_period_stats(cur, "daily_betting_stats", "stat_date", stat_dates, since)
+
+    def update_monthly_stats(self, cur, stat_months=None, since=None):
+        # deadline_date 기준 월 집계 (05:00 컷오프 보정 포함, post_summary.stat_month)
+        self._update_period_stats(cur, "monthly_betting_stats", "stat_month", stat_months, since)
+
+    def _user_filter(self, user_ids):
+        return "" if user_ids is None else f"WHERE {self.in_param('user_id', 'user_ids')}"
+
+    def update_lifetime_stats(self, cur, user_ids=None):
+        """
+        일간 통계(daily_betting_stats)로부터 유저별 누적 요약을 갱신.
+        - (user, board) 행 + 전체 게시판 합산(board_id = 0) 행
+        - user_ids 가 주어지면 해당 유저만 다시 계산 (None 이면 전체)
+        """
+        user_filter = self._user_filter(user_ids)
+        self.execute(cur, f"""
+            WITH per_day AS (
+                SELECT user_id, board_id, stat_date, total_bets, total_amount, total_profit, wins
+                FROM daily_betting_stats
+                {user_filter}
+                UNION ALL
+                SELECT user_id, {ALL_BOARDS_ID} AS board_id, stat_date,
+                       SUM(total_bets), SUM(total_amount), SUM(total_profit), SUM(wins)
+                FROM daily_betting_stats
+                {user_filter}
+                GROUP BY user_id, stat_date
+            ),
+            ranked AS (
+                SELECT
+                    per_day.*,
+                    ROW_NUMBER() OVER (PARTITION BY user_id, board_id ORDER BY total_profit DESC, stat_date) AS best_rn,
+                    ROW_NUMBER() OVER (PARTITION BY user_id, board_id ORDER BY total_profit ASC,  stat_date) AS worst_rn
+                FROM per_day
+            )
+            INSERT INTO user_lifetime_stats
+                (user_id, board_id, total_bets, total_amount, total_profit, wins,
+                 first_seen, last_seen, best_day, best_day_profit, worst_day, worst_day_profit, updated_at)
+            SELECT
+                user_id,
+                board_id,
+                SUM(total_bets),
+                SUM(total_amount),
+                SUM(total_profit),
+                SUM(wins),
+                MIN(stat_date),
+                MAX(stat_date),
+                MAX(CASE WHEN best_rn  = 1 THEN stat_date END),
+                MAX(CASE WHEN best_rn  = 1 THEN total_profit END),
+                MAX(CASE WHEN worst_rn = 1 THEN stat_date END),
+                MAX(CASE WHEN worst_rn = 1 THEN total_profit END),
+                CURRENT_TIMESTAMP
+            FROM ranked
+            GROUP BY user_id, board_id
+            ON CONFLICT (user_id, board_id)
+            DO UPDATE SET
+                total_bets       = EXCLUDED.total_bets,
+                total_amount     = EXCLUDED.total_amount,
+                total_profit     = EXCLUDED.total_profit,
+                wins             = EXCLUDED.wins,
+                first_seen       = EXCLUDED.first_seen,
+                last_seen        = EXCLUDED.last_seen,
+                best_day         = EXCLUDED.best_day,
+                best_day_profit  = EXCLUDED.best_day_profit,
+                worst_day        = EXCLUDED.worst_day,
+                worst_day_profit = EXCLUDED.worst_day_profit,
+                updated_at       = CURRENT_TIMESTAMP;
+        """, {"user_ids": self.array_param(user_ids or [])})
+
+    def update_cumulative_stats(self, cur, user_ids=None, since=None):
+        """
+        daily_betting_stats 의 유저별 누적합(running total)을 날짜마다 저장.
+        - (user, board) 행 + 전체 게시판 합산(board_id = 0) 행
+        - since 가 주어지면 그 날짜부터만 다시 계산 (이전 누적값은 그대로이므로 직전 누적 행에 이어서 더함)
+          since 이전 일간 통계는 바뀌지 않은 경우에만 사용 (증분 수집: 이번 배치의 가장 이른 집계 날짜)
+        """
+        conditions = []
+        if user_ids is not None:
+            conditions.append(self.in_param("user_id", "user_ids"))
+        if since is not None:
+            conditions.append("stat_date >= %(since)s")
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        if since is None:
+            base = "SELECT board_id, user_id, 0 AS cum_bets, 0 AS cum_amount, 0 AS cum_profit, 0 AS cum_wins FROM pairs"
+        else:
+            # (게시판, 유저)별 since 직전 누적 행 — PK (board_id, user_id, stat_date) 역순 한 번
+            base = """
+                SELECT p.board_id, p.user_id,
+                       COALESCE(c.cum_bets, 0) AS cum_bets, COALESCE(c.cum_amount, 0) AS cum_amount,
+                       COALESCE(c.cum_profit, 0) AS cum_profit, COALESCE(c.cum_wins, 0) AS cum_wins
+                FROM (
+                    SELECT board_id, user_id,
+                           (SELECT MAX(stat_date) FROM daily_cumulative_stats c
+                            WHERE c.board_id = pairs.board_id AND c.user_id = pairs.user_id
+                              AND c.stat_date < %(since)s) AS prev_date
+                    FROM pairs
+                ) p
+                LEFT JOIN daily_cumulative_stats c
+                       ON c.board_id = p.board_id AND c.user_id = p.user_id AND c.stat_date = p.prev_date
+            """
+        self.execute(cur, f"""
+            WITH per_day AS (
+                SELECT board_id, user_id, stat_date, total_bets, total_amount, total_profit, wins
+                FROM daily_betting_stats
+                {where}
+                UNION ALL
+                SELECT {ALL_BOARDS_ID} AS board_id, user_id, stat_date,
+                       SUM(total_bets), SUM(total_amount), SUM(total_profit), SUM(wins)
+                FROM daily_betting_stats
+                {where}
+                GROUP BY user_id, stat_date
+            ),
+            pairs AS (
+                SELECT DISTINCT board_id, user_id FROM per_day
+            ),
+            base AS (
+                {base}
+            )
+            INSERT INTO daily_cumulative_stats
+                (board_id, user_id, stat_date, cum_bets, cum_amount, cum_profit, cum_wins)
+            SELECT
+                d.board_id,
+                d.user_id,
+                d.stat_date,
+                b.cum_bets   + SUM(d.total_bets)   OVER w,
+                b.cum_amount + SUM(d.total_amount) OVER w,
+                b.cum_profit + SUM(d.total_profit) OVER w,
+                b.cum_wins   + SUM(d.wins)         OVER w
+            FROM per_day d
+            JOIN base b ON b.board_id = d.board_id AND b.user_id = d.user_id
+            WHERE true
+            WINDOW w AS (PARTITION BY d.board_id, d.user_id ORDER BY d.stat_date)
+            ON CONFLICT (board_id, user_id, stat_date)
+            DO UPDATE SET
+                cum_bets   = EXCLUDED.cum_bets,
+                cum_amount = EXCLUDED.cum_amount,
+                cum_profit = EXCLUDED.cum_profit,
+                cum_wins   = EXCLUDED.cum_wins;
+        """, {"user_ids": self.array_param(user_ids or []), "since": since})
+
+    def update_board_stats(self, cur, stat_dates=None, stat_months=None):
+        """
+        게시판 개요(daily_board_stats / monthly_board_stats) 계산 (stat_dates / stat_months 가 None 이면 전체).
+        게시물 요약과 일간/월간 통계가 갱신된 뒤에 호출 — 기간 단위로 통째로 다시 계산
+        """
+        if stat_dates is None or stat_dates:
+            self._update_board_period_stats(cur, "daily", stat_dates)
+        if stat_months is None or stat_months:
+            self._update_board_period_stats(cur, "monthly", stat_months)
+
+    def _update_board_period_stats(self, cur, period, periods=None):
+        """
+        게시물 수 / 배팅액 / 지급액: post_summary 의 기간 버킷 합계
+        참여자 수: 일간/월간 통계의 (기간, 게시판) 유저 수, 전체 게시판은 중복 없는 유저 수
+        """
+        source, _, col = STATS_TABLES[period]
+        table = BOARD_STATS_TABLES[period]
+        period_filter = "" if periods is None else f"WHERE {self.in_param(col, 'periods')}"
+        params = {"periods": self.array_param(periods or [])}
+        self.execute(cur, f"DELETE FROM {table} {period_filter}", params)
+
+        self.execute(cur, f"""
+            WITH per_board AS (
+                SELECT {col}, board_id,
+                       COUNT(*) AS posts, SUM(total_amount) AS total_amount, SUM(total_payout) AS total_payout
+                FROM post_summary
+                {period_filter}
+                GROUP BY {col}, board_id
+                UNION ALL
+                SELECT {col}, {ALL_BOARDS_ID},
+                       COUNT(*), SUM(total_amount), SUM(total_payout)
+                FROM post_summary
+                {period_filter}
+                GROUP BY {col}
+            ),
+            users AS (
+                SELECT {col}, board_id, COUNT(*) AS participants
+                FROM {source}
+                {period_filter}
+                GROUP BY {col}, board_id
+                UNION ALL
+                SELECT {col}, {ALL_BOARDS_ID}, COUNT(DISTINCT user_id)
+                FROM {source}
+                {period_filter}
+                GROUP BY {col}
+            )
+            INSERT INTO {table} (board_id, {col}, posts, participants, total_amount, total_payout, updated_at)
+            SELECT p.board_id, p.{col}, p.posts, COALESCE(u.participants, 0), p.total_amount, p.total_payout,
+                   CURRENT_TIMESTAMP
+            FROM per_board p
+            LEFT JOIN users u ON u.{col} = p.{col} AND u.board_id = p.board_id;
+        """, params)
+
+    def update_rank_stats(self, cur, stat_dates=None, stat_months=None):
+        """
+        일간/월간 통계로부터 기간별 순위 계산 (stat_dates / stat_months 가 None 이면 전체).
+        한 유저의 기록이 바뀌어도 같은 기간 모든 유저의 순위가 바뀌므로 기간 단위로 통째로 다시 계산
+        """
+        if stat_dates is None or stat_dates:
+            self._update_period_ranks(cur, "daily", stat_dates)
+        if stat_months is None or stat_months:
+            self._update_period_ranks(cur, "monthly", stat_months)
+
+    def _update_period_ranks(self, cur, period, periods=None):
+        """
+        (기간, 게시판) 안에서 배팅액/순수익 내림차순 RANK (동률은 같은 순위) + 백분위 + 참여자 수,
+        정렬 기준(RANKING_SORTS)별 랭킹 목록 위치, 승률 컬럼.
+        승률 위치는 WIN_RATE_MIN_BETS 이상 참여한 유저끼리만 (나머지 NULL).
+        게시판별 행 + 전체 게시판 합산(board_id = 0) 행
+        """
+        source, table, period_col = STATS_TABLES[period]
+        period_filter = "" if periods is None else f"WHERE {self.in_param(period_col, 'periods')}"
+        params = {"periods": self.array_param(periods or [])}
+        self.execute(cur, f"DELETE FROM {table} {period_filter}", params)
+
+        window = f"{period_col}, board_id"
+        min_bets = WIN_RATE_MIN_BETS[period]
+        positions = ",\n".join(
+            f"CASE WHEN total_bets >= {min_bets} THEN ROW_NUMBER() OVER "
+            f"(PARTITION BY {window}, total_bets >= {min_bets} ORDER BY {order}, nickname) END"
+            if key == "win_rate" else
+            f"ROW_NUMBER() OVER (PARTITION BY {window} ORDER BY {order}, nickname)"
+            for key, order in RANKING_SORTS.items()
+        )
+        self.execute(cur, f"""
+            WITH per_user AS (
+                SELECT {period_col}, board_id, user_id, total_bets, total_amount, total_profit, wins
+                FROM {source}
+                {period_filter}
+                UNION ALL
+                SELECT {period_col}, {ALL_BOARDS_ID} AS board_id, user_id,
+                       SUM(total_bets), SUM(total_amount), SUM(total_profit), SUM(wins)
+                FROM {source}
+                {period_filter}
+                GROUP BY {period_col}, user_id
+            ),
+            scored AS (
+                SELECT per_user.*, u.nickname,
+                       {win_rate_sql("per_user.wins", "per_user.total_bets")} AS win_rate
+                FROM per_user
+                JOIN users u ON u.id = per_user.user_id
+            )
+            INSERT INTO {table}
+                (user_id, board_id, {period_col}, total_bets, total_amount, total_profit, wins, win_rate,
+                 rank_amount, rank_profit, pct_amount, pct_profit, participants,
+                 {", ".join(f"pos_{key}" for key in RANKING_SORTS)})
+            SELECT
+                user_id,
+                board_id,
+                {period_col},
+                total_bets,
+                total_amount,
+                total_profit,
+                wins,
+                win_rate,
+                RANK() OVER (PARTITION BY {window} ORDER BY total_amount DESC),
+                RANK() OVER (PARTITION BY {window} ORDER BY total_profit DESC),
+                {percentile_sql("total_amount DESC", window)},
+                {percentile_sql("total_profit DESC", window)},
+                COUNT(*) OVER (PARTITION BY {window}),
+                {positions}
+            FROM scored;
+        """, params)
+
+    # -----------------------------------------------------------------
+    # 백필 체크포인트
+    # -----------------------------------------------------------------
+    def load_checkpoints(self, job_key):
+        """반환: {shard_no: (range_start, range_end, next_value, done)}"""
+        with self.cursor(commit=True) as cur:
+            self.ensure_schema(cur)
+            self.execute(cur, """
+                SELECT shard_no, range_start, range_end, next_value, done
+                FROM crawl_checkpoints
+                WHERE job_key = %s
+            """, (job_key,))
+            return {shard_no: (start, end, next_value, bool(done))
+                    for shard_no, start, end, next_value, done in cur.fetchall()}
+
+    def save_checkpoint(self, job_key, shard_no, range_start, range_end, next_value, done=False):
+        with self.cursor(commit=True) as cur:
+            self.execute(cur, """
+                INSERT INTO crawl_checkpoints
+                (job_key, shard_no, range_start, range_end, next_value, done, updated_at)
+                VALUES (%s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
+                ON CONFLICT (job_key, shard_no)
+                DO UPDATE SET
+                    next_value = EXCLUDED.next_value,
+                    done       = EXCLUDED.done,
+                    updated_at = EXCLUDED.updated_at;
+            """, (job_key, shard_no, range_start, range_end, next_value, done))
+
+    def record_failed_post(self, job_key, slug, post_id, error):
+        with self.cursor(commit=True) as cur:
+            self.execute(cur, """
+                INSERT INTO crawl_failed_posts (job_key, slug, post_id, attempts, error, failed_at)
+                VALUES (%s, %s, %s, 1, %s, CURRENT_TIMESTAMP)
+                ON CONFLICT (job_key, slug, post_id)
+                DO UPDATE SET
+                    attempts  = crawl_failed_posts.attempts + 1,
+                    error     = EXCLUDED.error,
+                    failed_at = EXCLUDED.failed_at;
+            """, (job_key, slug, int(post_id), error))
+
+    def load_failed_posts(self, job_key):
+        """반환: [(slug, post_id, attempts), ...]"""
+        with self.cursor(commit=True) as cur:
+            self.ensure_schema(cur)
+            self.execute(cur, """
+                SELECT slug, post_id, attempts FROM crawl_failed_posts WHERE job_key = %s ORDER BY slug, post_id
+            """, (job_key,))
+            return cur.fetchall()
+
+    def clear_failed_post(self, job_key, slug, post_id):
+        with self.cursor(commit=True) as cur:
+            self.execute(cur, """
+                DELETE FROM crawl_failed_posts WHERE job_key = %s AND slug = %s AND post_id = %s
+            """, (job_key, slug, int(post_id)))
+
+    # -----------------------------------------------------------------
+    # 보존 기간 (retention)
+    #   오래된 달은 요약(post_summary / post_side_summary / 일간·월간 통계)만 남기고 원본 정리
+    #   정리는 가장 오래된 달부터 순서대로 — compacted_before 이전 기간은 다시 집계하지 않음
+    # -----------------------------------------------------------------
+    def compacted_before(self, cur):
+        """원본이 정리된 마지막 달의 다음 달 1일 (없으면 None)"""
+        self.execute(cur, "SELECT MAX(month) FROM compacted_months")
+        month = cur.fetchone()[0]
+        return next_month(month) if month else None
+
+    def compact_month(self, month, drop=False):
+        """
+        마감 월 month 의 원본을 요약으로 압축 후 정리.
+        반환: dict(month, posts, records)
+        """
+        lo = datetime.combine(month, datetime.min.time())
+        hi = datetime.combine(next_month(month), datetime.min.time())
+        with self.cursor(commit=True) as cur:
+            self.ensure_schema(cur)
+            compacted_before = self.compacted_before(cur)
+            if compacted_before and month != compacted_before:
+                raise ValueError(f"{compacted_before} 부터 순서대로 정리해야 합니다 (요청: {month})")
+
+            self.execute(cur, """
+                SELECT board_id, post_id, COUNT(*)
+                FROM betting_stats
+                WHERE deadline_date >= %s AND deadline_date < %s
+                GROUP BY board_id, post_id
+            """, (lo, hi))
+            post_keys = {}
+            records = 0
+            for board_id, post_id, count in cur.fetchall():
+                post_keys.setdefault(board_id, []).append(post_id)
+                records += count
+
+            # 정리 직전 원본으로 요약을 한 번 더 계산 (요약이 유일한 기록이 됨)
+            if post_keys:
+                self.ensure_post_summary(cur)
+                stat_dates, stat_months = self.update_post_summary(cur, post_keys, (lo, hi))
+                self.update_daily_stats(cur, stat_dates, compacted_before)
+                self.update_monthly_stats(cur, stat_months, compacted_before)
+                self.update_board_stats(cur, stat_dates, stat_months)
+
+            self.drop_raw_month(cur, month, drop)
+            posts = sum(len(ids) for ids in post_keys.values())
+            self.execute(cur, """
+                INSERT INTO compacted_months (month, posts, records, compacted_at)
+                VALUES (%s, %s, %s, CURRENT_TIMESTAMP)
+            """, (month, posts, records))
+        return {"month": month, "posts": posts, "records": records}
+
+    def compact_old_months(self, keep_months, drop=False, today=None):
+        """최근 keep_months 개월(이번 달 포함)만 원본으로 남기고 그 이전 달을 차례로 정리"""
+        cutoff = month_start(today or date.today())
+        for _ in range(keep_months - 1):
+            cutoff = month_start(cutoff - timedelta(days=1))
+
+        with self.cursor(commit=True) as cur:
+            self.ensure_schema(cur)
+            self.execute(cur, "SELECT MIN(deadline_date) FROM betting_stats")
+            oldest = cur.fetchone()[0]
+            compacted_before = self.compacted_before(cur)
+        if oldest is None:
+            return []
+
+        month = max(month_start(oldest), compacted_before) if compacted_before else month_start(oldest)
+        results = []
+        while month < cutoff:
+            results.append(self.compact_month(month, drop))
+            month = next_month(month)
+        return results
+
+    # -----------------------------------------------------------------
+    # 크롤링 실행 기록 (웹에서 띄운 크롤링 — 모든 워커가 같은 상태를 봄)
+    # -----------------------------------------------------------------
+    def start_crawl_run(self, run_id, now, stale_before, keep_runs):
+        """
+        실행 기록 추가. 이미 실행 중이면 False.
+        heartbeat 가 stale_before 이전인 running 기록은 (웹 프로세스가 죽은 것으로 보고) error 로 정리,
+        최근 keep_runs 개 실행의 이벤트만 남김
+        """
+        with self.cursor(commit=True) as cur:
+            self.ensure_schema(cur)
+            self.expire_crawl_runs(cur, now, stale_before)
+            self.execute(cur, """
+                INSERT INTO crawl_runs (run_id, status, started_at, heartbeat_at)
+                VALUES (%s, 'running', %s, %s)
+                ON CONFLICT DO NOTHING
+            """, (run_id, now, now))
+            if cur.rowcount != 1:
+                return False
+            self.execute(cur, """
+                DELETE FROM crawl_events
+                WHERE run_id NOT IN (SELECT run_id FROM crawl_runs ORDER BY started_at DESC LIMIT %s)
+            """, (keep_runs,))
+        return True
+
+    def expire_crawl_runs(self, cur, now, stale_before):
+        # 조회 쪽은 쓰지 않고 heartbeat 로 판단 (app/crawl_stream.py) — 기록 정리는 새 실행 시작 때만
+        summary = json.dumps({"status": "error", "error": "heartbeat lost"})
+        self.execute(cur, """
+            UPDATE crawl_runs SET status = 'error', finished_at = %s, summary = %s
+            WHERE status = 'running' AND heartbeat_at < %s
+        """, (now, summary, stale_before))
+
+    def add_crawl_event(self, run_id, event, data, now):
+        with self.cursor(commit=True) as cur:
+            self.execute(cur, """
+                INSERT INTO crawl_events (run_id, event, data, created_at) VALUES (%s, %s, %s, %s)
+            """, (run_id, event, json.dumps(data, ensure_ascii=False, default=str), now))
+            self.execute(cur, "UPDATE crawl_runs SET heartbeat_at = %s WHERE run_id = %s", (now, run_id))
+
+    def finish_crawl_run(self, run_id, summary, now):
+        with self.cursor(commit=True) as cur:
+            self.execute(cur, """
+                UPDATE crawl_runs SET status = %s, finished_at = %s, heartbeat_at = %s, summary = %s
+                WHERE run_id = %s
+            """, (summary["status"], now, now, json.dumps(summary, ensure_ascii=False, default=str), run_id))
+
+    def crawl_run(self, cur, run_id=None):
+        """
+        실행 기록 하나 (run_id 미지정 시 가장 최근)
+        반환: (run_id, status, started_at, heartbeat_at, finished_at, summary dict | None) 또는 None
+        """
+        where = "WHERE run_id = %(run_id)s" if run_id else ""
+        self.execute(cur, f"""
+            SELECT run_id, status, started_at, heartbeat_at, finished_at, summary
+            FROM crawl_runs
+            {where}
+            ORDER BY started_at DESC
+            LIMIT 1
+        """, {"run_id": run_id})
+        row = cur.fetchone()
+        if row is None:
+            return None
+        return (*row[:5], json.loads(row[5]) if row[5] else None)
+
+    def crawl_events(self, cur, run_id, after_id=0, limit=None):
+        # 반환: [(id, event, data dict), ...] — after_id 이후, 오래된 순
+        self.execute(cur, f"""
+            SELECT id, event, data FROM crawl_events
+            WHERE run_id = %s AND id > %s
+            ORDER BY id
+            {"LIMIT %s" if limit else ""}
+        """, (run_id, after_id, limit) if limit else (run_id, after_id))
+        return [(event_id, event, json.loads(data)) for event_id, event, data in cur.fetchall()]
+
+    # -----------------------------------------------------------------
+    # 조회 (API)
+    # -----------------------------------------------------------------
+    def find_users(self, cur, nickname):
+        self.execute(cur, "SELECT id, nickname FROM users WHERE nickname = %s", (nickname,))
+        return cur.fetchall()
+
+    def find_board_id(self, cur, board_slug):
+        if not board_slug:
+            return ALL_BOARDS_ID
+        self.execute(cur, "SELECT id FROM boards WHERE slug = %s", (board_slug,))
+        row = cur.fetchone()
+        return row[0] if row else None
+
+    def _user_stats_sql(self, period, user, board_slug, conditions=()):
+        """
+        유저의 기간별 합계 + 순위 컬럼 SELECT (daily_stats / monthly_stats / dashboard 공통, 정렬은 호출부).
+        user: 유저 id SQL 조각, conditions: 추가 WHERE 조건 (s = 집계 테이블), 게시판은 %(board_slug)s
+        반환 컬럼: (기간, total_bets, total_amount, total_profit, wins, win_rate, RANK_COLUMNS)
+        """
+        table, rank_table, col = STATS_TABLES[period]
+        where = [f"s.user_id = {user}", *conditions]
+        if board_slug:
+            where.append("b.slug = %(board_slug)s")
+            return f"""
+                SELECT s.{col}, s.total_bets, s.total_amount, s.total_profit, s.wins,
+                       {win_rate_sql("s.wins", "s.total_bets")} AS win_rate,
+                       {RANK_COLUMNS}
+                FROM {table} s
+                JOIN boards b ON s.board_id = b.id
+                LEFT JOIN {rank_table} r
+                  ON r.user_id = s.user_id AND r.board_id = s.board_id AND r.{col} = s.{col}
+                WHERE {" AND ".join(where)}
+            """
+        return f"""
+            SELECT s.{col},
+                   SUM(s.total_bets)   AS total_bets,
+                   SUM(s.total_amount) AS total_amount,
+                   SUM(s.total_profit) AS total_profit,
+                   SUM(s.wins)         AS wins,
+                   {win_rate_sql("SUM(s.wins)", "SUM(s.total_bets)")} AS win_rate,
+                   {RANK_COLUMNS}
+            FROM {table} s
+            LEFT JOIN {rank_table} r
+              ON r.user_id = s.user_id AND r.board_id = {ALL_BOARDS_ID} AND r.{col} = s.{col}
+            WHERE {" AND ".join(where)}
+            GROUP BY s.{col}, {RANK_COLUMNS}
+        """
+
+    def daily_stats(self, cur, user_id, start_date, end_date, board_slug=None):
+        """
+        반환: [(stat_date, total_bets, total_amount, total_profit, wins, win_rate,
+                rank_amount, rank_profit, pct_amount, pct_profit, participants), ...] 최신순
+        순위 컬럼은 daily_rank_stats (미계산이면 None)
+        """
+        sql = self._user_stats_sql("daily", "%(user_id)s", board_slug,
+                                   ["s.stat_date BETWEEN %(start)s AND %(end)s"])
+        self.execute(cur, sql + " ORDER BY s.stat_date DESC",
+                     {"user_id": user_id, "board_slug": board_slug, "start": start_date, "end": end_date})
+        return cur.fetchall()
+
+    def monthly_stats(self, cur, user_id, start_month=None, end_month=None, board_slug=None):
+        """
+        반환: [(stat_month, total_bets, total_amount, total_profit, wins, win_rate,
+                rank_amount, rank_profit, pct_amount, pct_profit, participants), ...] 최신순
+        start_month / end_month 는 각 달의 1일(date). 미지정 시 최근 12개월.
+        """
+        period_range = ("start", "end") if start_month and end_month else None
+        self.execute(cur, self._monthly_stats_sql("%(user_id)s", board_slug, period_range),
+                     {"user_id": user_id, "board_slug": board_slug, "start": start_month, "end": end_month})
+        return cur.fetchall()
+
+    def _monthly_stats_sql(self, user, board_slug, period_range=None):
+        # period_range: (시작 달, 끝 달) 파라미터 이름, None 이면 최근 12개월
+        if period_range is None:
+            return self._user_stats_sql("monthly", user, board_slug) + " ORDER BY s.stat_month DESC LIMIT 12"
+        start, end = period_range
+        return self._user_stats_sql("monthly", user, board_slug,
+                                    [f"s.stat_month BETWEEN %({start})s AND %({end})s"]) + " ORDER BY s.stat_month DESC"
+
+    def dashboard(self, cur, nickname, board_slug, start_date, end_date, start_month, end_month,
+                  rank_date, rank_month, limit):
+        """
+        유저 대시보드 — 닉네임 조회부터 전부 SQL 한 번 (UNION ALL, part 컬럼으로 구분).
+        start_month / end_month 미지정 시 최근 12개월 (monthly_stats 와 동일)
+        반환: {"nickname": 닉네임 | None(없는 유저),
+               "daily" / "monthly": daily_stats / monthly_stats 와 같은 행,
+               "rank_daily" / "rank_monthly": rank_date / rank_month 의
+                   (total_bets, total_amount, total_profit, wins, win_rate, RANK_COLUMNS) | None,
+               "top_daily" / "top_monthly": daily_ranking / monthly_ranking(배팅액순) 상위 limit 과 같은 행}
+        """
+        user = "(SELECT id FROM users WHERE nickname = %(nickname)s)"
+        month_range = ("start_month", "end_month") if start_month and end_month else None
+        board = "(SELECT id FROM boards WHERE slug = %(board_slug)s)" if board_slug else str(ALL_BOARDS_ID)
+        totals = "x.total_bets, x.total_amount, x.total_profit, x.wins, x.win_rate"
+        ranks = "x.rank_amount, x.rank_profit, x.pct_amount, x.pct_profit, x.participants"
+
+        # 컬럼: (part, ord, 기간, 닉네임, 합계 5개, 순위 5개)
+        # SQLite 는 첫 SELECT 의 컬럼 선언 타입으로 DATE 를 변환하므로 기간 컬럼이 있는 통계를 맨 앞에
+        branches = [
+            f"""
+            SELECT 1 AS part, ROW_NUMBER() OVER (ORDER BY x.stat_date DESC) AS ord,
+                   x.stat_date AS period, NULL AS nickname, {totals}, {ranks}
+            FROM ({self._user_stats_sql("daily", user, board_slug,
+                                        ["s.stat_date BETWEEN %(start_date)s AND %(end_date)s"])}) x
+            """,
+            f"""
+            SELECT 2, ROW_NUMBER() OVER (ORDER BY x.stat_month DESC),
+                   x.stat_month, NULL, {totals}, {ranks}
+            FROM ({self._monthly_stats_sql(user, board_slug, month_range)}) x
+            """,
+        ]
+        for part, (period, (_, rank_table, col)) in enumerate(STATS_TABLES.items()):
+            param = "rank_date" if period == "daily" else "rank_month"
+            branches.append(f"""
+            SELECT {3 + part}, 1, x.{col}, NULL, {totals}, {ranks}
+            FROM {rank_table} x
+            WHERE x.user_id = {user} AND x.board_id = {board} AND x.{col} = %({param})s
+            """)
+            branches.append(f"""
+            SELECT {5 + part}, x.pos_amount, NULL, u.nickname, {totals}, NULL, NULL, NULL, NULL, NULL
+            FROM {rank_table} x
+            JOIN users u ON u.id = x.user_id
+            WHERE x.{col} = %({param})s AND x.board_id = {board} AND x.pos_amount <= %(limit)s
+            """)
+        branches.append("""
+            SELECT 0, 0, NULL, nickname, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL
+            FROM users WHERE nickname = %(nickname)s
+        """)
+
+        self.execute(cur, " UNION ALL ".join(branches) + " ORDER BY part, ord", {
+            "nickname": nickname, "board_slug": board_slug,
+            "start_date": start_date, "end_date": end_date,
+            "start_month": start_month, "end_month": end_month,
+            "rank_date": rank_date, "rank_month": rank_month, "limit": limit,
+        })
+
+        result = {"nickname": None, "daily": [], "monthly": [], "rank_daily": None, "rank_monthly": None,
+                  "top_daily": [], "top_monthly": []}
+        for part, _, period, nick, *values in cur.fetchall():
+            if part == 0:
+                result["nickname"] = nick
+            elif part in (1, 2):
+                result["daily" if part == 1 else "monthly"].append((period, *values))
+            elif part in (3, 4):
+                result["rank_daily" if part == 3 else "rank_monthly"] = tuple(values)
+            else:
+                result["top_daily" if part == 5 else "top_monthly"].append((nick, *values[:5]))
+        return result
+
+    def daily_ranking(self, cur, stat_date, limit, board_slug=None, sort="amount", min_bets=0):
+        # 반환: [(nickname, total_bets, total_amount, total_profit, wins, win_rate), ...] sort 기준순
+        return self._period_ranking(cur, "daily", stat_date, limit, board_slug, sort, min_bets)
+
+    def monthly_ranking(self, cur, stat_month, limit, board_slug=None, sort="amount", min_bets=0):
+        # stat_month 는 달의 1일(date)
+        return self._period_ranking(cur, "monthly", stat_month, limit, board_slug, sort, min_bets)
+
+    def _period_ranking(self, cur, period, value, limit, board_slug, sort, min_bets):
+        """
+        미리 계산된 랭킹 목록(*_rank_stats)에서 pos_<sort> 순으로 limit 개.
+        min_bets: 배팅수 하한 — 인덱스 안의 total_bets 로 거름.
+          승률은 min_bets >= WIN_RATE_MIN_BETS 면 pos_win_rate 부분 인덱스 범위만 읽고,
+          그보다 낮은 하한은 미리 계산된 위치가 없으므로 기간 전체를 정렬 (느린 경로)
+        """
+        if sort not in RANKING_SORTS:
+            raise ValueError(f"unknown ranking sort: {sort}")
+        board_id = self.find_board_id(cur, board_slug)
+        if board_id is None:
+            return []
+        _, table, period_col = STATS_TABLES[period]
+        conditions = [f"r.{period_col} = %(period)s", "r.board_id = %(board_id)s", "r.total_bets >= %(min_bets)s"]
+        order = f"r.pos_{sort}"
+        if sort == "win_rate":
+            if min_bets >= WIN_RATE_MIN_BETS[period]:
+                conditions.append("r.pos_win_rate IS NOT NULL")
+            else:
+                order = "r.win_rate DESC, r.total_bets DESC, u.nickname"
+        self.execute(cur, f"""
+            SELECT u.nickname, r.total_bets, r.total_amount, r.total_profit, r.wins, r.win_rate
+            FROM {table} r
+            JOIN users u ON u.id = r.user_id
+            WHERE {" AND ".join(conditions)}
+            ORDER BY {order}
+            LIMIT %(limit)s
+        """, {"period": value, "board_id": board_id, "min_bets": min_bets, "limit": limit})
+        return cur.fetchall()
+
+    def user_summary(self, cur, nickname, board_slug=None):
+        """
+        user_lifetime_stats 단일 행.
+        반환: (total_bets, total_amount, total_profit, wins, win_rate, first_seen, last_seen,
+               best_day, best_day_profit, worst_day, worst_day_profit) 또는 None
+        """
+        if board_slug:
+            self.execute(cur, f"""
+                SELECT s.total_bets, s.total_amount, s.total_profit, s.wins,
+                       {win_rate_sql("s.wins", "s.total_bets")} AS win_rate,
+                       s.first_seen, s.last_seen,
+                       s.best_day, s.best_day_profit, s.worst_day, s.worst_day_profit
+                FROM user_lifetime_stats s
+                JOIN users  u ON s.user_id = u.id
+                JOIN boards b ON s.board_id = b.id
+                WHERE u.nickname = %s
+                  AND b.slug = %s
+            """, (nickname, board_slug))
+        else:
+            self.execute(cur, f"""
+                SELECT s.total_bets, s.total_amount, s.total_profit, s.wins,
+                       {win_rate_sql("s.wins", "s.total_bets")} AS win_rate,
+                       s.first_seen, s.last_seen,
+                       s.best_day, s.best_day_profit, s.worst_day, s.worst_day_profit
+                FROM user_lifetime_stats s
+                JOIN users u ON s.user_id = u.id
+                WHERE u.nickname = %s
+                  AND s.board_id = %s
+            """, (nickname, ALL_BOARDS_ID))
+        return cur.fetchone()
+
+    def rank_history(self, cur, user_id, period, start=None, end=None, board_slug=None):
+        """
+        기간별 순위 추이 (차트용, 오래된 순).
+        period: "daily" | "monthly", start / end 는 날짜(월간은 각 달 1일) — 미지정 시 전체
+        반환: [(stat_date | stat_month, rank_amount, rank_profit, pct_amount, pct_profit, participants), ...]
+        """
+        board_id = self.find_board_id(cur, board_slug)
+        if board_id is None:
+            return []
+        table, period_col = (("daily_rank_stats", "stat_date") if period == "daily"
+                             else ("monthly_rank_stats", "stat_month"))
+        conditions = ["r.user_id = %(user_id)s", "r.board_id = %(board_id)s"]
+        if start:
+            conditions.append(f"r.{period_col} >= %(start)s")
+        if end:
+            conditions.append(f"r.{period_col} <= %(end)s")
+        self.execute(cur, f"""
+            SELECT r.{period_col}, {RANK_COLUMNS}
+            FROM {table} r
+            WHERE {" AND ".join(conditions)}
+            ORDER BY r.{period_col}
+        """, {"user_id": user_id, "board_id": board_id, "start": start, "end": end})
+        return cur.fetchall()
+
+    def board_overview(self, cur, board_slug, period, start, end):
+        """
+        게시판 개요 추이 (차트용, 오래된 순) — board_slug 미지정 시 전체 게시판 합산.
+        period: "daily" | "monthly", start / end 는 날짜(월간은 각 달 1일)
+        반환: [(stat_date | stat_month, posts, participants, total_amount, total_payout,
+                house_profit, player_profit), ...] 또는 None (없는 게시판)
+          house_profit = 배팅액 - 지급액, player_profit = 지급액 - 배팅액 (참여자 전체 순손익)
+        """
+        board_id = self.find_board_id(cur, board_slug)
+        if board_id is None:
+            return None
+        col = STATS_TABLES[period][2]
+        self.execute(cur, f"""
+            SELECT {col}, posts, participants, total_amount, total_payout,
+                   total_amount - total_payout AS house_profit,
+                   total_payout - total_amount AS player_profit
+            FROM {BOARD_STATS_TABLES[period]}
+            WHERE board_id = %(board_id)s
+              AND {col} BETWEEN %(start)s AND %(end)s
+            ORDER BY {col}
+        """, {"board_id": board_id, "start": start, "end": end})
+        return cur.fetchall()
+
+    def range_ranking(self, cur, start_date, end_date, limit, board_slug=None):
+        """
+        daily_cumulative_stats 누적합 → 유저당 (기간 끝 행 - 시작 직전 행).
+        반환: [(nickname, total_bets, total_amount, total_profit, wins, win_rate), ...] 배팅액 상위 limit
+        """
+        board_id = self.find_board_id(cur, board_slug)
+        if board_id is None:
+            return []
+
+        # 기간 내 활동 유저마다 누적합 2행(기간 끝 / 시작 직전)을 PK 로 조회
+        self.execute(cur, f"""
+            WITH active AS (
+                SELECT
+                    a.user_id,
+                    MAX(a.stat_date) AS end_d,
+                    (SELECT MAX(p.stat_date)
+                       FROM daily_cumulative_stats p
+                      WHERE p.board_id = %(board_id)s
+                        AND p.user_id = a.user_id
+                        AND p.stat_date < %(start)s) AS prev_d
+                FROM daily_cumulative_stats a
+                WHERE a.board_id = %(board_id)s
+                  AND a.stat_date BETWEEN %(start)s AND %(end)s
+                GROUP BY a.user_id
+            )
+            SELECT u.nickname,
+                   e.cum_bets   - COALESCE(p.cum_bets, 0)   AS total_bets,
+                   e.cum_amount - COALESCE(p.cum_amount, 0) AS total_amount,
+                   e.cum_profit - COALESCE(p.cum_profit, 0) AS total_profit,
+                   e.cum_wins   - COALESCE(p.cum_wins, 0)   AS wins,
+                   {win_rate_sql("e.cum_wins - COALESCE(p.cum_wins, 0)", "e.cum_bets - COALESCE(p.cum_bets, 0)")} AS win_rate
+            FROM active
+            JOIN daily_cumulative_stats e
+              ON e.board_id = %(board_id)s AND e.user_id = active.user_id AND e.stat_date = active.end_d
+            LEFT JOIN daily_cumulative_stats p
+              ON p.board_id = %(board_id)s AND p.user_id = active.user_id AND p.stat_date = active.prev_d
+            JOIN users u ON u.id = active.user_id
+        """, {"board_id": board_id, "start": start_date, "end": end_date})
+
+        # 배팅액 내림차순, 동률은 닉네임순
+        return top_k(cur.fetchall(), limit, key=lambda r: (-r[2], r[0]))
+
+    def recent_posts(self, cur, limit, board_slug=None):
+        """
+        최근 게시물 + 사이드별 풀 (게시물당 사이드 수만큼 행).
+        반환: [(slug, post_id, deadline_date, stat_date, participants, total_amount, total_payout,
+                winning_side, top_nickname, top_bet_amount, bet_side, bettors, bet_amount, payout_amount), ...]
+        """
+        board_filter = "WHERE b.slug = %(board_slug)s" if board_slug else ""
+        self.execute(cur, f"""
+            WITH recent AS (
+                SELECT p.*, b.slug
+                FROM post_summary p
+                JOIN boards b ON p.board_id = b.id
+                {board_filter}
+                ORDER BY p.deadline_date DESC, p.post_id DESC
+                LIMIT %(limit)s
+            )
+            SELECT r.slug, r.post_id, r.deadline_date, r.stat_date,
+                   r.participants, r.total_amount, r.total_payout, r.winning_side,
+                   u.nickname, r.top_bet_amount,
+                   s.bet_side, s.bettors, s.bet_amount, s.payout_amount
+            FROM recent r
+            JOIN post_side_summary s ON s.board_id = r.board_id AND s.post_id = r.post_id
+            LEFT JOIN users u ON u.id = r.top_user_id
+            ORDER BY r.deadline_date DESC, r.post_id DESC, s.bet_side
+        """, {"board_slug": board_slug, "limit": limit})
+        return cur.fetchall()
+
+    def post_side_pools(self, cur, board_slug=None, start_date=None, end_date=None):
+        # 반환: [(board_id, post_id, bet_side, bet_amount, payout_amount, max_bet, deadline_date), ...]
+        where, params = [], []
+        if board_slug:
+            where.append("b.slug = %s")
+            params.append(board_slug)
+        if start_date:
+            where.append("p.stat_date >= %s")
+            params.append(start_date)
+        if end_date:
+            where.append("p.stat_date <= %s")
+            params.append(end_date)
+
+        # 사이드별 합계는 수집 시점에 post_side_summary 로 계산되어 있음
+        self.execute(cur, f"""
+            SELECT s.board_id, s.post_id, s.bet_side, s.bet_amount, s.payout_amount, s.max_bet, p.deadline_date
+            FROM post_side_summary s
+            JOIN post_summary p ON p.board_id = s.board_id AND p.post_id = s.post_id
+            JOIN boards b ON s.board_id = b.id
+            {"WHERE " + " AND ".join(where) if where else ""}
+        """, tuple(params))
+        return cur.fetchall()
+
+    def post_top_player_sides(self, cur, board_slug=None, start_date=None, end_date=None):
+        """
+        게시물마다 참여자 중 상위 유저(마감 전날까지 그 게시판 누적 순수익 1위, 동률은 user_id 순)가 건 사이드.
+        누적 기록이 없는 유저 / 양방 참여 유저는 제외, 대상 유저가 없는 게시물은 행 없음.
+        원본(betting_stats)이 정리된 달의 게시물은 유저별 기록이 없어 제외됨
+        반환: [(board_id, post_id, bet_side), ...]
+        """
+        where, params = [], {}
+        if board_slug:
+            where.append("b.slug = %(board_slug)s")
+            params["board_slug"] = board_slug
+        if start_date:
+            where.append("p.stat_date >= %(start)s")
+            # 버킷 [start, ...) ↔ 마감 시각 [start + 5시간, ...) — 원본 파티션 프루닝
+            where.append("s.deadline_date >= %(raw_lo)s")
+            params["start"] = start_date
+            params["raw_lo"] = datetime.combine(start_date, datetime.min.time()) + DAY_CUTOFF
+        if end_date:
+            where.append("p.stat_date <= %(end)s")
+            where.append("s.deadline_date < %(raw_hi)s")
+            params["end"] = end_date
+            params["raw_hi"] = datetime.combine(end_date + timedelta(days=1), datetime.min.time()) + DAY_CUTOFF
+
+        # 마감 전날까지 누적 순수익: 누적합 PK (board_id, user_id, stat_date) 역순으로 한 행
+        self.execute(cur, f"""
+            WITH bettors AS (
+                SELECT s.board_id, s.post_id, s.user_id, p.stat_date,
+                       MIN(s.bet_side) AS bet_side, COUNT(DISTINCT s.bet_side) AS sides
+                FROM betting_stats s
+                JOIN post_summary p ON p.board_id = s.board_id AND p.post_id = s.post_id
+                JOIN boards b ON b.id = s.board_id
+                {"WHERE " + " AND ".join(where) if where else ""}
+                GROUP BY s.board_id, s.post_id, s.user_id, p.stat_date
+            ),
+            scored AS (
+                SELECT bettors.*,
+                       (SELECT c.cum_profit FROM daily_cumulative_stats c
+                        WHERE c.board_id = bettors.board_id AND c.user_id = bettors.user_id
+                          AND c.stat_date < bettors.stat_date
+                        ORDER BY c.stat_date DESC
+                        LIMIT 1) AS prior_profit
+                FROM bettors
+                WHERE sides = 1
+            )
+            SELECT board_id, post_id, bet_side
+            FROM (
+                SELECT board_id, post_id, bet_side,
+                       ROW_NUMBER() OVER (PARTITION BY board_id, post_id ORDER BY prior_profit DESC, user_id) AS rn
+                FROM scored
+                WHERE prior_profit IS NOT NULL
+            ) t
+            WHERE rn = 1
+        """, params)
+        return cur.fetchall()
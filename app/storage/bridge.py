@@ -0,0 +1,75 @@
+import asyncio
+import contextvars
+from contextlib import contextmanager
+
+# 비동기 풀 커서 — ASGI 모드(app/asgi.py)에서 기존 조회 뷰 / Storage 조회 메서드를 그대로 쓰기 위한 장치
+#   뷰는 스레드 풀에서 한 번만 실행, 쿼리만 이벤트 루프에 넘겨 비동기 풀에서 실행하고 결과를 받아 계속 진행
+#   → 뷰 안의 date.today() 같은 값도 한 번만 계산되므로 동기 모드와 SQL / 결과 / JSON 동일
+#   DB 오류는 동기 모드처럼 뷰 안의 execute() 에서 발생 (Flask 오류 처리 그대로)
+_active = contextvars.ContextVar("storage_bridge", default=None)
+
+
+class PoolBridge:
+    """
+    요청 하나의 쿼리 통로.
+    fetch: 이벤트 루프에서 실행할 코루틴 함수 (sql, params, readonly, max_lag) → 결과 행 목록
+    """
+
+    def __init__(self, loop, fetch):
+        self.loop = loop
+        self.fetch = fetch
+        self.queries = 0
+
+    def run(self, sql, params, readonly, max_lag):
+        # 스레드 풀에서 호출 — 이벤트 루프가 쿼리를 실행하는 동안 이 스레드만 대기
+        self.queries += 1
+        future = asyncio.run_coroutine_threadsafe(self.fetch(sql, params, readonly, max_lag), self.loop)
+        return future.result()
+
+    def cursor(self, readonly=False, max_lag=None):
+        return BridgeCursor(self, readonly, max_lag)
+
+
+class BridgeCursor:
+    """psycopg2 커서 중 조회 뷰가 쓰는 부분만 (execute / fetchone / fetchall)"""
+
+    def __init__(self, bridge, readonly, max_lag):
+        self._bridge = bridge
+        self.readonly = readonly
+        self.max_lag = max_lag
+        self._rows = iter(())
+        self.rowcount = -1
+
+    def execute(self, sql, params=()):
+        rows = self._bridge.run(sql, params, self.readonly, self.max_lag)
+        self._rows = iter(rows)
+        self.rowcount = len(rows)
+
+    def executemany(self, sql, seq_of_params):
+        raise RuntimeError("비동기 풀 커서는 조회 전용입니다 (executemany)")
+
+    def fetchone(self):
+        return next(self._rows, None)
+
+    def fetchall(self):
+        return list(self._rows)
+
+    def close(self):
+        pass
+
+    def __iter__(self):
+        return self._rows
+
+
+def active_bridge():
+    return _active.get()
+
+
+@contextmanager
+def bridging(bridge):
+    """이 안에서 Storage.cursor() 는 실제 연결 대신 비동기 풀 커서를 돌려줌"""
+    token = _active.set(bridge)
+    try:
+        yield bridge
+    finally:
+        _active.reset(token)
@@ -0,0 +1,149 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from app.storage import create_storage
+
+# 백엔드 간 결과 비교 (SQLite ↔ Postgres)
+#   같은 합성 데이터를 두 저장소에 넣고 수집/집계/조회 결과가 동일한지 확인
+#   python -m app.storage.parity --postgres-dsn postgresql://localhost/ygosu_parity
+SLUGS = ("pan_setkacup", "pan_ccy")
+
+
+def synthetic_posts(n_posts=120, n_users=40, seed=7):
+    """
+    게시물 {post_id: [record, ...]} 생성 (parse_post 결과와 같은 형태).
+    - 00:00~05:00 마감(전일 집계), 월 경계, 양방 참여를 포함
+    """
+    rnd = random.Random(seed)
+    names = [f"user{i:03d}" for i in range(n_users)]
+    start = datetime(2025, 8, 25, 1, 30)
+    posts = {}
+    for i in range(n_posts):
+        post_id = 100000 + i
+        slug = SLUGS[i % len(SLUGS)]
+        deadline = start + timedelta(hours=5 * i + rnd.randint(0, 3))
+        winner = rnd.randint(0, 1)
+        records = []
+        for nickname in rnd.sample(names, rnd.randint(2, 10)):
+            sides = [rnd.randint(0, 1)]
+            if rnd.random() < 0.1:
+                sides = [0, 1]  # 양방
+            for side in sides:
+                bet = rnd.randint(1, 100) * 100
+                records.append({
+                    "post_id": post_id,
+                    "slug": slug,
+                    "bet_side": side,
+                    "nickname": nickname,
+                    "bet_amount": bet,
+                    "payout_amount": int(bet * 1.9) if side == winner else 0,
+                    "deadline_at": deadline,
+                })
+        posts[str(post_id)] = records
+    return posts
+
+
+def _normalize(value):
+    # 드라이버별 타입 차이(Decimal/date) 제거
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _queries(storage, cur):
+    # user id 는 백엔드마다 시퀀스 소비가 달라 닉네임으로 조회
+    (user_a, _), = storage.find_users(cur, "user001")
+    (user_b, _), = storage.find_users(cur, "user017")
+    yield "daily_stats", storage.daily_stats(cur, user_a, date(2025, 8, 1), date(2025, 9, 30))
+    yield "daily_stats(board)", storage.daily_stats(cur, user_a, date(2025, 8, 1), date(2025, 9, 30), SLUGS[0])
+    yield "monthly_stats", storage.monthly_stats(cur, user_b)
+    yield "monthly_stats(range)", storage.monthly_stats(cur, user_b, date(2025, 8, 1), date(2025, 9, 30), SLUGS[1])
+    yield "rank_history(daily)", storage.rank_history(cur, user_a, "daily")
+    yield "rank_history(monthly,board)", storage.rank_history(cur, user_b, "monthly", board_slug=SLUGS[1])
+    for d in (date(2025, 8, 31), date(2025, 9, 5)):
+        yield f"daily_ranking {d}", storage.daily_ranking(cur, d, 100)
+        yield f"daily_ranking {d} (board)", storage.daily_ranking(cur, d, 100, SLUGS[0])
+    yield "monthly_ranking", storage.monthly_ranking(cur, date(2025, 9, 1), 100)
+    yield "monthly_ranking(board)", storage.monthly_ranking(cur, date(2025, 8, 1), 100, SLUGS[1])
+    for sort in ("profit", "bets", "win_rate"):
+        yield f"daily_ranking {sort}", storage.daily_ranking(cur, date(2025, 9, 5), 100, sort=sort)
+        yield f"monthly_ranking(board) {sort}", storage.monthly_ranking(cur, date(2025, 9, 1), 100, SLUGS[0], sort, 2)
+    for nickname in ("user001", "user017"):
+        yield f"user_summary {nickname}", storage.user_summary(cur, nickname)
+        yield f"user_summary {nickname} (board)", storage.user_summary(cur, nickname, SLUGS[0])
+    yield "dashboard", storage.dashboard(cur, "user001", None, date(2025, 8, 1), date(2025, 9, 30),
+                                         None, None, date(2025, 9, 5), date(2025, 9, 1), 10)
+    yield "dashboard(board,range)", storage.dashboard(cur, "user017", SLUGS[1], date(2025, 8, 25), date(2025, 9, 10),
+                                                      date(2025, 8, 1), date(2025, 9, 30), date(2025, 8, 31),
+                                                      date(2025, 8, 1), 5)
+    yield "dashboard(unknown)", storage.dashboard(cur, "nobody", None, date(2025, 8, 1), date(2025, 9, 30),
+                                                  None, None, date(2025, 9, 5), date(2025, 9, 1), 10)
+    yield "board_overview(daily)", storage.board_overview(cur, None, "daily", date(2025, 8, 1), date(2025, 9, 30))
+    yield "board_overview(monthly,board)", storage.board_overview(cur, SLUGS[0], "monthly",
+                                                                   date(2025, 1, 1), date(2025, 12, 1))
+    yield "range_ranking", storage.range_ranking(cur, date(2025, 8, 28), date(2025, 9, 10), 100)
+    yield "range_ranking(board)", storage.range_ranking(cur, date(2025, 9, 1), date(2025, 9, 3), 100, SLUGS[1])
+    yield "recent_posts", storage.recent_posts(cur, 30)
+    yield "post_side_pools", sorted(storage.post_side_pools(cur, SLUGS[0], date(2025, 8, 30), date(2025, 9, 8)))
+
+
+def collect(storage, posts):
+    storage.rebuild_stats()  # 스키마 생성
+    items = list(posts.items())
+    half = len(items) // 2
+    # 두 번에 나눠 넣어 증분 집계 경로도 비교
+    storage.insert_records(dict(items[:half]))
+    storage.insert_records(dict(items[half:]))
+    storage.insert_records(dict(items[:10]))  # 중복 게시물은 무시되어야 함
+
+    with storage.cursor() as cur:
+        return {name: _normalize(rows) for name, rows in _queries(storage, cur)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="저장소 백엔드 결과 비교 (SQLite ↔ Postgres)")
+    parser.add_argument("--postgres-dsn", required=True, help="비어 있는 검증용 Postgres DB")
+    parser.add_argument("--posts", type=int, default=120)
+    args = parser.parse_args()
+
+    postgres = create_storage("postgres", dsn=args.postgres_dsn)
+    with postgres.cursor() as cur:
+        postgres.execute(cur, "SELECT to_regclass('betting_stats') IS NOT NULL")
+        if cur.fetchone()[0]:
+            postgres.execute(cur, "SELECT EXISTS (SELECT 1 FROM betting_stats)")
+            if cur.fetchone()[0]:
+                sys.exit("[ERROR] 검증용 Postgres DB 가 비어 있지 않습니다")
+
+    posts = synthetic_posts(args.posts)
+    with tempfile.TemporaryDirectory() as tmp:
+        sqlite = create_storage("sqlite", path=os.path.join(tmp, "parity.sqlite3"))
+        expected = collect(sqlite, posts)
+    actual = collect(postgres, posts)
+
+    failed = 0
+    for name, rows in expected.items():
+        ok = rows == actual[name]
+        failed += not ok
+        print(f"[{'OK' if ok else 'DIFF'}] {name} ({len(rows) if isinstance(rows, list) else 1} rows)")
+        if not ok:
+            print(f"  sqlite:   {rows}")
+            print(f"  postgres: {actual[name]}")
+
+    if failed:
+        sys.exit(f"[ERROR] {failed}개 조회 결과가 다릅니다")
+    print("[OK] 백엔드 결과 일치")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+import argparse
+import sys
+
+from app.storage import RETENTION_MONTHS, create_storage, get_storage
+from app.storage.base import next_month
+from app.storage.postgres import PARTITIONED_SCHEMA_SQL, PARTITIONED_TABLES, partition_name
+
+# 월 파티션 / 보존 기간 관리
+#   python -m app.storage.partitions status                       # 파티션별 행 수/크기, 정리된 달
+#   python -m app.storage.partitions migrate                      # 기존 단일 테이블 → 월 파티션 (Postgres)
+#   python -m app.storage.partitions compact --keep-months 24     # 오래된 달 원본 정리 (요약만 유지)
+
+
+def _storage(dsn):
+    return create_storage("postgres", dsn=dsn) if dsn else get_storage()
+
+
+def status(storage):
+    with storage.cursor(commit=True) as cur:
+        storage.ensure_schema(cur)
+        if storage.name == "postgres":
+            for table in PARTITIONED_TABLES:
+                partitioned = storage.is_partitioned(cur, table)
+                print(f"{table}: {'월 파티션' if partitioned else '단일 테이블'}")
+                if not partitioned:
+                    continue
+                storage.execute(cur, """
+                    SELECT c.relname, c.reltuples::BIGINT, pg_total_relation_size(c.oid)
+                    FROM pg_inherits i
+                    JOIN pg_class c ON c.oid = i.inhrelid
+                    WHERE i.inhparent = to_regclass(%s)
+                    ORDER BY c.relname
+                """, (table,))
+                for name, rows, size in cur.fetchall():
+                    print(f"  {name:<36}{max(rows, 0):>12} rows{size / 1024 / 1024:>10.1f} MB")
+
+        storage.execute(cur, "SELECT month, posts, records, compacted_at FROM compacted_months ORDER BY month")
+        rows = cur.fetchall()
+        print(f"정리된 달: {len(rows)}개")
+        for month, posts, records, compacted_at in rows:
+            print(f"  {str(month)[:7]}  게시물 {posts}, 기록 {records} ({compacted_at})")
+
+
+def _migrate_table(storage, cur, table, key):
+    if storage.is_partitioned(cur, table):
+        print(f"[INFO] {table}: 이미 파티션 테이블")
+        return
+
+    new = f"{table}_new"
+    ddl = next(d for d in PARTITIONED_SCHEMA_SQL if f"EXISTS {table} (" in d)
+    storage.execute(cur, f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE")
+    storage.execute(cur, ddl.replace(f"EXISTS {table} (", f"EXISTS {new} ("))
+
+    storage.execute(cur, f"SELECT DISTINCT DATE_TRUNC('month', {key})::DATE FROM {table}")
+    for (month,) in cur.fetchall():
+        storage.execute(cur, f"""
+            CREATE TABLE {partition_name(table, month)}
+            PARTITION OF {new} FOR VALUES FROM (%s) TO (%s)
+        """, (month, next_month(month)))
+
+    # generated 컬럼(profit)은 제외하고 복사
+    storage.execute(cur, """
+        SELECT column_name FROM information_schema.columns
+        WHERE table_name = %s AND is_generated = 'NEVER'
+        ORDER BY ordinal_position
+    """, (new,))
+    names = [r[0] for r in cur.fetchall()]
+    columns = ", ".join(names)
+    storage.execute(cur, f"INSERT INTO {new} ({columns}) SELECT {columns} FROM {table}")
+    copied = cur.rowcount
+
+    if "id" in names:
+        storage.execute(cur, f"""
+            SELECT setval(pg_get_serial_sequence('{new}', 'id'), COALESCE((SELECT MAX(id) FROM {new}), 0) + 1, false)
+        """)
+    storage.execute(cur, f"DROP TABLE {table}")
+    storage.execute(cur, f"ALTER TABLE {new} RENAME TO {table}")
+
+    # 자동 생성된 제약/시퀀스 이름의 _new 제거
+    storage.execute(cur, "SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(%s)", (table,))
+    for (name,) in cur.fetchall():
+        if name.startswith(new):
+            storage.execute(cur, f"ALTER TABLE {table} RENAME CONSTRAINT {name} TO {table}{name[len(new):]}")
+    if "id" in names:
+        storage.execute(cur, "SELECT pg_get_serial_sequence(%s, 'id')", (table,))
+        seq = cur.fetchone()[0]
+        storage.execute(cur, f"ALTER SEQUENCE {seq} RENAME TO {table}_id_seq")
+
+    storage._partitioned[table] = True
+    print(f"[OK] {table}: 월 파티션으로 전환 ({copied}행)")
+
+
+def migrate(storage):
+    if storage.name != "postgres":
+        sys.exit("[ERROR] 파티션 전환은 Postgres 저장소만 지원합니다")
+    # 한 트랜잭션 — 실패하면 기존 테이블 그대로
+    with storage.cursor(commit=True) as cur:
+        storage.ensure_schema(cur)
+        for table, key in PARTITIONED_TABLES.items():
+            _migrate_table(storage, cur, table, key)
+        storage.ensure_schema(cur, force=True)  # 기존 테이블과 함께 삭제된 보조 인덱스 재생성
+        for table in PARTITIONED_TABLES:
+            storage.execute(cur, f"ANALYZE {table}")
+
+
+def compact(storage, keep_months, drop):
+    if keep_months < 1:
+        sys.exit("[ERROR] --keep-months 는 1 이상이어야 합니다")
+    results = storage.compact_old_months(keep_months, drop)
+    for r in results:
+        print(f"[OK] {str(r['month'])[:7]} 정리: 게시물 {r['posts']}, 기록 {r['records']}")
+    if not results:
+        print("[INFO] 정리할 달이 없습니다")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="betting_stats 월 파티션 / 보존 기간 관리")
+    parser.add_argument("command", choices=("status", "migrate", "compact"))
+    parser.add_argument("--postgres-dsn", help="대상 Postgres (미지정 시 STORAGE_BACKEND 저장소)")
+    parser.add_argument("--keep-months", type=int, default=RETENTION_MONTHS,
+                        help="원본을 남길 최근 개월 수 (기본: RETENTION_MONTHS)")
+    parser.add_argument("--drop", action="store_true", help="분리한 파티션을 보관하지 않고 삭제")
+    args = parser.parse_args()
+
+    storage = _storage(args.postgres_dsn)
+    if args.command == "status":
+        status(storage)
+    elif args.command == "migrate":
+        migrate(storage)
+    else:
+        compact(storage, args.keep_months, args.drop)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+from app.database import get_connection
+from app.storage.base import BASE_SCHEMA_SQL, Storage, next_month
+
+# 월 단위 RANGE 파티션 테이블 → 파티션 키
+#   betting_stats: 마감 시각 (원본 보존 기간 정리 = 파티션 분리)
+#   daily_betting_stats: 집계 날짜
+PARTITIONED_TABLES = {
+    "betting_stats": "deadline_date",
+    "daily_betting_stats": "stat_date",
+}
+
+# 파티션 테이블의 PK/UNIQUE 는 파티션 키를 포함해야 함
+#   (게시물 하나의 기록은 모두 같은 마감 시각이므로 중복 방지 의미는 기존과 동일)
+PARTITIONED_SCHEMA_SQL = [
+    """
+    CREATE TABLE IF NOT EXISTS betting_stats (
+        id            SERIAL,
+        post_id       BIGINT    NOT NULL,
+        deadline_date TIMESTAMP NOT NULL,
+        user_id       INTEGER   NOT NULL REFERENCES users (id),
+        board_id      INTEGER   NOT NULL REFERENCES boards (id),
+        bet_side      INTEGER   NOT NULL,
+        bet_amount    INTEGER   NOT NULL,
+        payout_amount INTEGER   NOT NULL,
+        profit        INTEGER GENERATED ALWAYS AS (payout_amount - bet_amount) STORED,
+        created_at    TIMESTAMP,
+        PRIMARY KEY (id, deadline_date),
+        UNIQUE (user_id, board_id, post_id, bet_side, deadline_date)
+    ) PARTITION BY RANGE (deadline_date);
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS daily_betting_stats (
+        stat_date    DATE    NOT NULL,
+        user_id      INTEGER NOT NULL,
+        board_id     INTEGER NOT NULL,
+        total_bets   INTEGER NOT NULL DEFAULT 0,
+        total_amount INTEGER NOT NULL DEFAULT 0,
+        total_profit INTEGER NOT NULL DEFAULT 0,
+        wins         INTEGER NOT NULL DEFAULT 0,
+        created_at   TIMESTAMP,
+        UNIQUE (stat_date, user_id, board_id)
+    ) PARTITION BY RANGE (stat_date);
+    """,
+]
+
+
+def partition_name(table, month):
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+class PostgresStorage(Storage):
+    """
+    운영용 Postgres 저장소.
+    dsn 미지정 시 app.database 커넥션 풀(.env 설정)을 사용하고,
+    읽기 전용 커서는 복제본(DB_REPLICA_DSNS)으로 라우팅.
+    새 DB 는 betting_stats / daily_betting_stats 를 월 파티션으로 생성
+    (기존 단일 테이블은 python -m app.storage.partitions migrate 로 전환).
+    """
+
+    name = "postgres"
+
+    BASE_SCHEMA_SQL = [
+        ddl for ddl in BASE_SCHEMA_SQL
+        if not any(f"EXISTS {table} (" in ddl for table in PARTITIONED_TABLES)
+    ] + PARTITIONED_SCHEMA_SQL
+
+    def __init__(self, dsn=None):
+        self.dsn = dsn
+        self._partitioned = {}
+
+    def connect(self, readonly=False, max_lag=None):
+        if self.dsn:
+            import psycopg2
+            return psycopg2.connect(self.dsn)
+        return get_connection(readonly=readonly, max_lag=max_lag)
+
+    def day_bucket(self, col):
+        return f"({col} - INTERVAL '5 hours')::DATE"
+
+    def month_bucket(self, col):
+        return f"DATE_TRUNC('month', {col} - INTERVAL '5 hours')::DATE"
+
+    def in_param(self, col, name):
+        return f"{col} = ANY(%({name})s)"
+
+    def array_param(self, values):
+        return list(values)
+
+    # -----------------------------------------------------------------
+    # 월 파티션
+    # -----------------------------------------------------------------
+    def is_partitioned(self, cur, table):
+        # 마이그레이션 전 운영 DB 는 단일 테이블일 수 있음
+        if table not in self._partitioned:
+            self.execute(cur, """
+                SELECT EXISTS (
+                    SELECT 1 FROM pg_partitioned_table pt
+                    JOIN pg_class c ON c.oid = pt.partrelid
+                    WHERE c.oid = to_regclass(%s)
+                )
+            """, (table,))
+            self._partitioned[table] = cur.fetchone()[0]
+        return self._partitioned[table]
+
+    def ensure_partitions(self, cur, table, months):
+        if not months or not self.is_partitioned(cur, table):
+            return
+        for month in sorted(months):
+            name = partition_name(table, month)
+            self.execute(cur, "SELECT to_regclass(%s) IS NOT NULL", (name,))
+            if cur.fetchone()[0]:
+                continue
+            self.execute(cur, f"""
+                CREATE TABLE IF NOT EXISTS {name}
+                PARTITION OF {table} FOR VALUES FROM (%s) TO (%s)
+            """, (month, next_month(month)))
+            print(f"[INFO] 파티션 생성: {name}")
+
+    def drop_raw_month(self, cur, month, drop=False):
+        # 파티션이면 통째로 분리 (삭제/VACUUM 비용 없음), 분리된 테이블은 보관용으로 남김
+        name = partition_name("betting_stats", month)
+        self.execute(cur, "SELECT to_regclass(%s) IS NOT NULL", (name,))
+        exists = cur.fetchone()[0]
+        if not exists or not self.is_partitioned(cur, "betting_stats"):
+            super().drop_raw_month(cur, month, drop)
+            return
+        self.execute(cur, f"ALTER TABLE betting_stats DETACH PARTITION {name}")
+        if drop:
+            self.execute(cur, f"DROP TABLE {name}")
+            print(f"[INFO] 파티션 삭제: {name}")
+        else:
+            print(f"[INFO] 파티션 분리 (보관용 테이블로 유지): {name}")
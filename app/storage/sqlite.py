@@ -0,0 +1,59 @@
+import json
+import re
+import sqlite3
+from datetime import date, datetime
+
+from app.storage.base import BASE_SCHEMA_SQL, SCHEMA_SQL, Storage
+
+# DATE / TIMESTAMP 컬럼 ↔ datetime 변환 (Postgres 드라이버와 같은 타입으로 돌려받기)
+sqlite3.register_adapter(date, lambda d: d.isoformat())
+sqlite3.register_adapter(datetime, lambda d: d.isoformat(" "))
+sqlite3.register_converter("DATE", lambda b: date.fromisoformat(b.decode()))
+sqlite3.register_converter("TIMESTAMP", lambda b: datetime.fromisoformat(b.decode()))
+
+_NAMED_PARAM = re.compile(r"%\((\w+)\)s")
+
+
+class SqliteStorage(Storage):
+    """
+    내장 SQLite(WAL) 저장소.
+    로컬 실행/드라이런 크롤링/벤치마크용 — Postgres 서버 없이 같은 인터페이스로 동작.
+    """
+
+    name = "sqlite"
+
+    BASE_SCHEMA_SQL = [
+        ddl.replace("SERIAL PRIMARY KEY", "INTEGER PRIMARY KEY AUTOINCREMENT")
+        for ddl in BASE_SCHEMA_SQL
+    ]
+    SCHEMA_SQL = [
+        ddl.replace("SERIAL PRIMARY KEY", "INTEGER PRIMARY KEY AUTOINCREMENT")
+        for ddl in SCHEMA_SQL
+    ]
+
+    def __init__(self, path):
+        self.path = path
+
+    def connect(self, readonly=False, max_lag=None):
+        # 단일 파일 DB 라 복제본 구분 없음
+        conn = sqlite3.connect(self.path, detect_types=sqlite3.PARSE_DECLTYPES, timeout=30)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def day_bucket(self, col):
+        return f"date({col}, '-5 hours')"
+
+    def month_bucket(self, col):
+        return f"date({col}, '-5 hours', 'start of month')"
+
+    def in_param(self, col, name):
+        # 배열 파라미터는 JSON 문자열로 넘기고 json_each 로 펼침
+        return f"{col} IN (SELECT value FROM json_each(%({name})s))"
+
+    def array_param(self, values):
+        return json.dumps(list(values), default=str)
+
+    def prepare(self, sql):
+        return _NAMED_PARAM.sub(r":\1", sql).replace("%s", "?")
@@ -1,7 +1,20 @@
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 
-load_dotenv()
+# .env 로딩은 여기 한 곳에서만 (app.database 도 이 모듈을 통해 로딩)
+ENV_PATH = Path(__file__).resolve().parent / ".env"
+_env_loaded = False
+
+def load_env():
+    global _env_loaded
+    if not _env_loaded:
+        load_dotenv(dotenv_path=ENV_PATH)
+        _env_loaded = True
+
+load_env()
 
 class Config:
-    CRAWLER_SECRET_KEY = os.getenv("CRAWLER_SECRET_KEY", "default_secret")
\ No newline at end of file
+    CRAWLER_SECRET_KEY = os.getenv("CRAWLER_SECRET_KEY", "default_secret")
+    # 콜드 스타트 최적화 모드: DB 풀 워밍업을 백그라운드 스레드로 미룸 (0이면 부팅 시 동기 워밍업)
+    FAST_STARTUP = os.getenv("FAST_STARTUP", "1") == "1"
@@ -0,0 +1,52 @@
+import os
+
+import pytest
+
+from app.storage import create_storage
+
+# 저장소 픽스처: 같은 테스트를 SQLite / Postgres 두 백엔드에서 실행
+#   python -m pytest -q                                                          # SQLite 만 (Postgres 는 skip)
+#   TEST_POSTGRES_DSN=postgresql://postgres@localhost/ygosu_test python -m pytest -q
+#   Postgres 는 테스트마다 public 스키마를 지우고 새로 만듦 — 반드시 테스트 전용 DB 를 지정할 것
+TEST_POSTGRES_DSN = os.getenv("TEST_POSTGRES_DSN")
+BACKENDS = ("sqlite", "postgres")
+
+
+def _reset_postgres(dsn):
+    import psycopg2
+
+    conn = psycopg2.connect(dsn)
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cur:
+            cur.execute("DROP SCHEMA IF EXISTS public CASCADE")
+            cur.execute("CREATE SCHEMA public")
+    finally:
+        conn.close()
+
+
+def make_storage(backend, tmp_path):
+    if backend == "postgres":
+        if not TEST_POSTGRES_DSN:
+            pytest.skip("TEST_POSTGRES_DSN 미설정")
+        _reset_postgres(TEST_POSTGRES_DSN)
+        storage = create_storage("postgres", dsn=TEST_POSTGRES_DSN)
+    else:
+        storage = create_storage("sqlite", path=str(tmp_path / "test.sqlite3"))
+    storage.rebuild_stats()  # 스키마 생성
+    return storage
+
+
+@pytest.fixture(params=BACKENDS)
+def storage(request, tmp_path):
+    return make_storage(request.param, tmp_path)
+
+
+@pytest.fixture
+def sqlite_storage(tmp_path):
+    return make_storage("sqlite", tmp_path)
+
+
+@pytest.fixture
+def postgres_storage(tmp_path):
+    return make_storage("postgres", tmp_path)
@@ -0,0 +1,58 @@
+from app.storage.parity import _normalize
+
+# 테스트 공용 헬퍼
+
+# 수집 때 증분으로 갱신되는 파생 테이블
+DERIVED_TABLES = (
+    "post_summary",
+    "post_side_summary",
+    "daily_betting_stats",
+    "monthly_betting_stats",
+    "user_lifetime_stats",
+    "daily_cumulative_stats",
+    "daily_rank_stats",
+    "monthly_rank_stats",
+    "daily_board_stats",
+    "monthly_board_stats",
+)
+# id 는 백엔드마다 시퀀스 소비가 달라 닉네임 / slug 로 바꿔 비교
+USER_COLUMNS = ("user_id", "top_user_id")
+
+
+def dump(storage, tables=DERIVED_TABLES):
+    # 테이블별 전체 행 (시각 컬럼 제외, 순서 무관)
+    result = {}
+    with storage.cursor() as cur:
+        storage.execute(cur, "SELECT id, nickname FROM users")
+        nicknames = dict(cur.fetchall())
+        storage.execute(cur, "SELECT id, slug FROM boards")
+        slugs = dict(cur.fetchall())
+        for table in tables:
+            storage.execute(cur, f"SELECT * FROM {table}")
+            columns = [d[0] for d in cur.description]
+            keep = [i for i, c in enumerate(columns) if c not in ("created_at", "updated_at")]
+            rows = []
+            for row in cur.fetchall():
+                values = []
+                for i in keep:
+                    value = row[i]
+                    if columns[i] in USER_COLUMNS:
+                        value = nicknames.get(value, value)
+                    elif columns[i] == "board_id":
+                        value = slugs.get(value, value)
+                    values.append(value)
+                rows.append(values)
+            result[table] = sorted(_normalize(rows), key=str)
+    return result
+
+
+def record(post_id, nickname, side, amount, payout, deadline, slug="pan_ccy"):
+    return {
+        "post_id": post_id,
+        "slug": slug,
+        "bet_side": side,
+        "nickname": nickname,
+        "bet_amount": amount,
+        "payout_amount": payout,
+        "deadline_at": deadline,
+    }
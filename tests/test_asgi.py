@@ -0,0 +1,75 @@
+import asyncio
+import json
+
+import pytest
+
+from app.storage.parity import synthetic_posts
+from conftest import TEST_POSTGRES_DSN
+
+# ASGI 모드 조회 경로 (app/asgi.py): 같은 요청을 WSGI 앱과 ASGI 앱에 보내 응답 비교 — Postgres 전용
+
+
+@pytest.fixture
+def asgi(postgres_storage, monkeypatch):
+    from app import asgi, database
+    import app.storage
+
+    postgres_storage.insert_records(synthetic_posts(60))
+    monkeypatch.setattr(database, "DB_PRIMARY_DSN", TEST_POSTGRES_DSN)
+    monkeypatch.setattr(database, "_replica_state", {})
+    monkeypatch.setattr(app.storage, "_storage", postgres_storage)
+    monkeypatch.setattr(asgi, "STORAGE_BACKEND", "postgres")
+    return asgi
+
+
+def asgi_get(asgi, path, query=""):
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    async def run():
+        try:
+            await asgi.app({
+                "type": "http", "http_version": "1.1", "method": "GET", "scheme": "http",
+                "path": path, "root_path": "", "query_string": query.encode(), "headers": [],
+                "server": ("testserver", 80), "client": ("127.0.0.1", 50000),
+            }, receive, send)
+        finally:
+            # 풀은 이벤트 루프에 묶이므로 루프마다 닫음
+            await asgi.close_async_pools()
+
+    asyncio.run(run())
+    return messages[0]["status"], b"".join(m.get("body", b"") for m in messages[1:])
+
+
+def test_multi_query_view_runs_once(asgi, monkeypatch):
+    # /api/daily_stats: 사용자 조회 → 일별 통계 (쿼리 2번) — 뷰는 한 번만 실행되어야 함
+    runs = []
+    dispatch = asgi._dispatch_view
+
+    def counting_dispatch(environ, bridge):
+        runs.append(bridge)
+        return dispatch(environ, bridge)
+
+    monkeypatch.setattr(asgi, "_dispatch_view", counting_dispatch)
+    path, query = "/api/daily_stats", "nickname=user001&startDate=2025-08-01&endDate=2025-09-30"
+    status, body = asgi_get(asgi, path, query)
+
+    expected = asgi.flask_app.test_client().get(f"{path}?{query}")
+    assert status == expected.status_code == 200
+    assert json.loads(body) == expected.get_json()
+    assert json.loads(body)
+    assert len(runs) == 1
+    assert runs[0].queries >= 2
+
+
+def test_unknown_user_matches_wsgi(asgi):
+    path, query = "/api/daily_stats", "nickname=nobody&startDate=2025-08-01&endDate=2025-09-30"
+    status, body = asgi_get(asgi, path, query)
+    expected = asgi.flask_app.test_client().get(f"{path}?{query}")
+    assert status == expected.status_code
+    assert body == expected.data
@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.crawler import backfill
+from app.crawler.service import PostFetchError
+from helpers import record
+
+SLUG = "pan_ccy"
+JOB_KEY = f"{SLUG}:posts:1-40/2"
+
+
+class FakeSite:
+    """parse_post 대체: 요청한 게시물을 기록하고, 지정한 게시물은 요청 실패(fail) / 크래시(crash)"""
+
+    def __init__(self, fail=(), crash=()):
+        self.fail = set(fail)
+        self.crash = set(crash)
+        self.requested = []
+
+    def parse_post(self, post_id, slug, strict=False):
+        pid = int(post_id)
+        self.requested.append(pid)
+        if pid in self.fail:
+            raise PostFetchError(f"HTTP 503 #{pid}")
+        if pid in self.crash:
+            raise RuntimeError(f"crash #{pid}")
+        if pid % 10 == 0:
+            return []  # 기록 없는 게시물
+        deadline = datetime(2025, 9, 1, 12) + timedelta(hours=pid)
+        return [record(pid, "alice", 0, 1000, 1900, deadline, SLUG),
+                record(pid, "bob", 1, 1000, 0, deadline, SLUG)]
+
+
+@pytest.fixture
+def run(storage, monkeypatch):
+    monkeypatch.setattr(backfill, "get_storage", lambda: storage)
+    monkeypatch.setattr(backfill, "RETRY_BACKOFF_SEC", 0)
+
+    def run(site):
+        monkeypatch.setattr(backfill, "parse_post", site.parse_post)
+        return backfill.run_backfill([(SLUG, "posts", 1, 40)], shards=2, workers=1, rate=10000, batch=5)
+    return run
+
+
+def stored_posts(storage):
+    with storage.cursor() as cur:
+        storage.execute(cur, "SELECT post_id FROM post_summary")
+        return sorted(pid for pid, in cur.fetchall())
+
+
+def test_backfill_resumes_from_checkpoint(storage, run):
+    # 1차: 7번은 계속 요청 실패(재시도 후 기록), 28번에서 크래시 → 두 번째 샤드는 26번부터 다시
+    first = FakeSite(fail={7}, crash={28})
+    with pytest.raises(RuntimeError):
+        run(first)
+    assert first.requested.count(7) == backfill.FETCH_RETRIES
+    assert storage.load_failed_posts(JOB_KEY) == [(SLUG, 7, 1)]
+    assert storage.load_checkpoints(JOB_KEY) == {0: (1, 20, 21, True), 1: (21, 40, 26, False)}
+
+    # 2차: 실패 게시물 + 남은 샤드만 요청, 끝나면 통계 재계산
+    second = FakeSite()
+    totals = run(second)
+    assert sorted(set(second.requested)) == [7] + list(range(26, 41))
+    assert totals["posts_recovered"] == 1
+    assert storage.load_failed_posts(JOB_KEY) == []
+    assert storage.load_checkpoints(JOB_KEY)[1] == (21, 40, 41, True)
+    assert stored_posts(storage) == [pid for pid in range(1, 41) if pid % 10]
+    with storage.cursor() as cur:
+        assert [r[0] for r in storage.daily_ranking(cur, datetime(2025, 9, 2).date(), 10)] == ["alice", "bob"]
+
+    # 3차: 할 일 없음
+    third = FakeSite()
+    run(third)
+    assert third.requested == []
+
+
+def test_backfill_keeps_failed_posts_for_next_run(storage, run):
+    run(FakeSite(fail={3, 35}))
+    assert storage.load_failed_posts(JOB_KEY) == [(SLUG, 3, 1), (SLUG, 35, 1)]
+
+    # 다시 실패하면 시도 횟수 증가, 체크포인트가 끝났어도 유실 없음
+    again = FakeSite(fail={35})
+    run(again)
+    assert sorted(set(again.requested)) == [3, 35]
+    assert storage.load_failed_posts(JOB_KEY) == [(SLUG, 35, 2)]
+    assert 3 in stored_posts(storage) and 35 not in stored_posts(storage)
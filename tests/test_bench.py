@@ -0,0 +1,31 @@
+from datetime import date
+
+import app as app_package
+import app.storage
+from app.bench import datagen, loadtest
+
+
+def test_loadtest_endpoints_on_generated_data(storage, monkeypatch):
+    # 합성 데이터 생성 → 부하 테스트 시나리오의 모든 엔드포인트가 정상 응답
+    monkeypatch.setattr(datagen, "get_storage", lambda: storage)
+    totals = datagen.run_datagen(days=40, n_users=60, n_boards=2, posts_per_day=3, mean_bettors=6,
+                                 end_date=date(2025, 9, 30), seed=1)
+    assert totals["posts"] and totals["records"]
+
+    scenario = loadtest.load_scenario(storage, seed=3, n_nicknames=20)
+    assert (scenario["first_day"], scenario["last_day"]) == (date(2025, 8, 22), date(2025, 9, 30))
+    assert scenario["slugs"] == sorted(datagen.BOARD_SLUGS[:2])
+    assert len(scenario["nicknames"]) == 20
+
+    monkeypatch.setattr(app.storage, "_storage", storage)
+    monkeypatch.setattr(app_package, "STORAGE_BACKEND", storage.name)
+    client = app_package.create_app().test_client()
+
+    def get(path):
+        response = client.get(path, headers={"Accept-Encoding": "gzip"})
+        return response.status_code, len(response.get_data())
+
+    for name, make_url in loadtest.build_endpoints(scenario):
+        stats = loadtest.run_endpoint(get, make_url, n_requests=4, concurrency=1, warmup=0)
+        assert stats["errors"] == 0, name
+        assert stats["avg_bytes"] > 0, name
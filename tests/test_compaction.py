@@ -0,0 +1,50 @@
+from datetime import date
+
+import pytest
+
+from app.storage import create_storage
+from app.storage.parity import synthetic_posts
+from helpers import dump
+
+AUGUST = date(2025, 8, 1)
+
+
+def raw_months(storage):
+    with storage.cursor() as cur:
+        storage.execute(cur, "SELECT deadline_date FROM betting_stats")
+        return {(d.year, d.month) for d, in cur.fetchall()}
+
+
+def test_compact_month_keeps_summaries(storage):
+    items = list(synthetic_posts(150).items())
+    storage.insert_records(dict(items[:120]))
+    before = dump(storage)
+
+    result = storage.compact_month(AUGUST)
+    assert result["posts"] and result["records"]
+    assert (2025, 8) not in raw_months(storage)
+    assert dump(storage) == before
+
+    # 정리한 달은 원본 없이 요약만으로 다시 계산 — 전체 재계산에도 그대로
+    storage.rebuild_stats()
+    assert dump(storage) == before
+
+    # 이미 넣은 게시물(정리한 달 포함)은 건너뜀
+    assert storage.insert_records(dict(items[:120]))["posts"] == 0
+    assert dump(storage) == before
+
+    with pytest.raises(ValueError):
+        storage.compact_month(date(2025, 10, 1))  # 정리는 오래된 달부터 순서대로
+
+
+def test_compacted_storage_matches_uncompacted(storage, tmp_path):
+    # 정리 후 이어서 수집해도 (월 경계 05:00 이전 마감 포함) 정리하지 않은 저장소와 같은 요약
+    items = list(synthetic_posts(150).items())
+    reference = create_storage("sqlite", path=str(tmp_path / "reference.sqlite3"))
+    for target in (storage, reference):
+        target.insert_records(dict(items[:100]))
+
+    storage.compact_month(AUGUST)
+    for target in (storage, reference):
+        target.insert_records(dict(items[100:]))
+    assert dump(storage) == dump(reference)
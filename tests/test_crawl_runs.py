@@ -0,0 +1,67 @@
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import crawl_stream
+
+NOW = datetime(2025, 9, 1, 12, 0)
+STALE = timedelta(seconds=crawl_stream.CRAWL_STALE_SEC)
+
+
+@pytest.fixture
+def runs(storage, monkeypatch):
+    # 크롤러 자식 프로세스는 띄우지 않음 (실행 기록만)
+    monkeypatch.setattr(crawl_stream, "get_storage", lambda: storage)
+    monkeypatch.setattr(crawl_stream, "_run_crawler", lambda run_id: None)
+    return storage
+
+
+def test_second_run_is_rejected_while_running(runs):
+    first = crawl_stream.start_crawl()
+    assert first is not None
+    assert crawl_stream.start_crawl() is None
+    assert crawl_stream.run_status()["run_id"] == first
+
+    runs.finish_crawl_run(first, {"status": "ok"}, datetime.now())
+    second = crawl_stream.start_crawl()
+    assert second not in (None, first)
+
+
+def test_concurrent_starts_admit_one_run(runs):
+    runs.prepare_schema()
+    barrier = threading.Barrier(6)
+    results = []
+
+    def start(i):
+        barrier.wait()
+        try:
+            results.append(runs.start_crawl_run(f"run{i}", NOW, NOW - STALE, 10))
+        except Exception as e:  # SQLite 쓰기 잠금 대기 초과도 "시작 못 함"
+            results.append(e)
+
+    threads = [threading.Thread(target=start, args=(i,)) for i in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results.count(True) == 1, results
+    with runs.cursor() as cur:
+        runs.execute(cur, "SELECT COUNT(*) FROM crawl_runs WHERE status = 'running'")
+        assert cur.fetchone()[0] == 1
+
+
+def test_stale_run_is_reported_without_writes_and_expired_by_next_start(runs):
+    assert runs.start_crawl_run("old", NOW, NOW - STALE, 10)
+
+    # 폴링은 heartbeat 가 끊긴 실행을 error 로 보여 주기만 함 (DB 는 그대로)
+    state = crawl_stream.run_status()
+    assert (state["run_id"], state["status"]) == ("old", "error")
+    with runs.cursor() as cur:
+        assert runs.crawl_run(cur, "old")[1] == "running"
+
+    later = NOW + STALE + timedelta(seconds=1)
+    assert runs.start_crawl_run("new", later, later - STALE, 10)
+    with runs.cursor() as cur:
+        assert runs.crawl_run(cur, "old")[1] == "error"
+        assert runs.crawl_run(cur, "new")[1] == "running"
@@ -0,0 +1,60 @@
+import pytest
+
+from app import database
+
+
+def replica(healthy=True, lag_sec=0.0):
+    return {"healthy": healthy, "lag_sec": lag_sec if healthy else None, "checked_at": 0, "error": None}
+
+
+@pytest.fixture
+def replicas(monkeypatch):
+    # 복제본 2개 (상태는 테스트에서 지정), 실제 연결 대신 대상 이름 반환
+    state = {"replica0": replica(), "replica1": replica()}
+    down = set()
+
+    def connect(target):
+        if target in down:
+            raise ConnectionError(f"{target} down")
+        return target
+
+    monkeypatch.setattr(database, "_replica_state", state)
+    monkeypatch.setattr(database, "_monitor_started", True)
+    monkeypatch.setattr(database, "_connect", connect)
+    monkeypatch.setattr(database, "DB_REPLICA_MAX_LAG", 30)
+    return state, down
+
+
+def test_writes_and_fresh_reads_go_to_primary(replicas):
+    assert database.get_connection() == "primary"
+    assert database.get_connection(readonly=False, max_lag=None) == "primary"
+    assert database.get_connection(readonly=True, max_lag=0) == "primary"
+
+
+def test_reads_rotate_over_healthy_replicas(replicas):
+    targets = {database.get_connection(readonly=True) for _ in range(4)}
+    assert targets == {"replica0", "replica1"}
+
+
+def test_lagging_and_unhealthy_replicas_are_skipped(replicas):
+    state, _ = replicas
+    state["replica0"].update(replica(lag_sec=45.0))
+    assert {database.get_connection(readonly=True) for _ in range(4)} == {"replica1"}
+    # 요청별 허용 지연
+    assert database.get_connection(readonly=True, max_lag=60) in ("replica0", "replica1")
+    assert {database.get_connection(readonly=True, max_lag=5) for _ in range(4)} == {"replica1"}
+
+    state["replica1"].update(replica(healthy=False))
+    assert database.get_connection(readonly=True) == "primary"
+
+
+def test_failed_replica_is_marked_and_next_target_used(replicas, capsys):
+    state, down = replicas
+    down.add("replica0")
+    assert {database.get_connection(readonly=True) for _ in range(4)} == {"replica1"}
+    assert state["replica0"]["healthy"] is False
+    assert "replica0 down" in state["replica0"]["error"]
+
+    down.add("replica1")
+    assert database.get_connection(readonly=True) == "primary"
+    assert "[WARN] 복제본 연결 실패 (replica1)" in capsys.readouterr().out
@@ -0,0 +1,100 @@
+from datetime import date
+
+import pytest
+
+from app.storage import WIN_RATE_MIN_BETS
+from app.storage.base import STATS_TABLES
+from app.storage.parity import SLUGS, synthetic_posts
+
+
+@pytest.fixture
+def loaded(storage):
+    storage.insert_records(synthetic_posts(150))
+    return storage
+
+
+def naive_range_totals(storage, cur, start, end, board_slug=None):
+    # 기간 내 일별 통계를 그대로 GROUP BY (누적합 차분과 같은 결과여야 함)
+    board_filter = "AND b.slug = %(board_slug)s" if board_slug else ""
+    storage.execute(cur, f"""
+        SELECT u.nickname, SUM(d.total_bets), SUM(d.total_amount), SUM(d.total_profit), SUM(d.wins)
+        FROM daily_betting_stats d
+        JOIN users u ON u.id = d.user_id
+        JOIN boards b ON b.id = d.board_id
+        WHERE d.stat_date BETWEEN %(start)s AND %(end)s {board_filter}
+        GROUP BY u.nickname
+    """, {"start": start, "end": end, "board_slug": board_slug})
+    return {nickname: tuple(int(v) for v in totals) for nickname, *totals in cur.fetchall()}
+
+
+@pytest.mark.parametrize("start, end, board_slug", [
+    (date(2025, 8, 28), date(2025, 9, 10), None),
+    (date(2025, 9, 1), date(2025, 9, 3), SLUGS[1]),
+    (date(2025, 8, 25), date(2025, 8, 25), SLUGS[0]),
+    (date(2025, 9, 20), date(2025, 9, 30), None),
+])
+def test_range_ranking_matches_group_by(loaded, start, end, board_slug):
+    with loaded.cursor() as cur:
+        rows = loaded.range_ranking(cur, start, end, 1000, board_slug)
+        expected = naive_range_totals(loaded, cur, start, end, board_slug)
+
+    assert {r[0]: tuple(r[1:5]) for r in rows} == expected
+    assert [r[0] for r in rows] == sorted(expected, key=lambda n: (-expected[n][1], n))
+    # 양방만 한 유저는 배팅수 0 → 승률 0
+    for nickname, bets, _, _, wins, win_rate in rows:
+        assert win_rate == (round(wins * 100 / bets, 2) if bets else 0.0)
+
+    with loaded.cursor() as cur:
+        top = loaded.range_ranking(cur, start, end, 3, board_slug)
+    assert top == rows[:3]
+
+
+SORT_KEYS = {
+    # RANKING_SORTS 와 같은 순서 (동률은 닉네임순)
+    "amount":   lambda r: (-r[2], r[0]),
+    "profit":   lambda r: (-r[3], r[0]),
+    "bets":     lambda r: (-r[1], -r[2], r[0]),
+    "win_rate": lambda r: (-r[5], -r[1], r[0]),
+}
+
+
+@pytest.mark.parametrize("period", ["daily", "monthly"])
+@pytest.mark.parametrize("board_slug", [None, SLUGS[0]])
+def test_ranking_sort_orders(storage, period, board_slug):
+    # 참여자를 줄여 일간에도 승률 랭킹 하한(WIN_RATE_MIN_BETS) 이상 참여한 유저가 생기도록
+    storage.insert_records(synthetic_posts(300, n_users=10))
+    table, col = ("daily_rank_stats", "stat_date") if period == "daily" else ("monthly_rank_stats", "stat_month")
+    ranking = storage.daily_ranking if period == "daily" else storage.monthly_ranking
+    threshold = WIN_RATE_MIN_BETS[period]
+
+    with storage.cursor() as cur:
+        board_id = storage.find_board_id(cur, board_slug)
+        storage.execute(cur, f"SELECT DISTINCT {col} FROM {table} ORDER BY {col}")
+        values = [v for v, in cur.fetchall()]
+        for value in values:
+            storage.execute(cur, f"""
+                SELECT u.nickname, r.total_bets, r.total_amount, r.total_profit, r.wins, r.win_rate
+                FROM {table} r JOIN users u ON u.id = r.user_id
+                WHERE r.{col} = %s AND r.board_id = %s
+            """, (value, board_id))
+            rows = [tuple(r) for r in cur.fetchall()]
+            for sort, key in SORT_KEYS.items():
+                for min_bets in (0, 2, threshold, threshold + 2):
+                    expected = sorted((r for r in rows if r[1] >= min_bets), key=key)
+                    actual = [tuple(r) for r in ranking(cur, value, 1000, board_slug, sort, min_bets)]
+                    assert actual == expected, (value, sort, min_bets)
+                    assert [tuple(r) for r in ranking(cur, value, 3, board_slug, sort, min_bets)] == expected[:3]
+    assert values
+
+
+def test_win_rate_position_only_above_min_bets(storage):
+    storage.insert_records(synthetic_posts(300, n_users=10))
+    with storage.cursor() as cur:
+        for period, (_, table, _) in STATS_TABLES.items():
+            # 하한 이상 참여한 유저만 위치가 있음 (데이터에 양쪽 모두 있어야 의미 있는 검사)
+            storage.execute(cur, f"""
+                SELECT total_bets >= %s, pos_win_rate IS NOT NULL, COUNT(*) FROM {table}
+                GROUP BY total_bets >= %s, pos_win_rate IS NOT NULL
+            """, (WIN_RATE_MIN_BETS[period], WIN_RATE_MIN_BETS[period]))
+            counts = {(bool(qualified), bool(ranked)): n for qualified, ranked, n in cur.fetchall()}
+            assert set(counts) == {(True, True), (False, False)}, (period, counts)
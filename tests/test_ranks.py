@@ -0,0 +1,87 @@
+from datetime import date, datetime
+
+import pytest
+
+import app as app_package
+import app.storage
+from app import routes
+from app.crawler import cli
+from app.storage.parity import synthetic_posts
+from helpers import dump, record
+
+RANK_TABLES = ("daily_rank_stats", "monthly_rank_stats")
+
+
+def test_rank_tables_backfilled_on_existing_database(storage):
+    # 순위 테이블 도입 전 DB: 통계는 있고 순위는 비어 있음 → 프로세스 첫 스키마 확인 때 한 번 계산
+    storage.insert_records(synthetic_posts(80))
+    before = dump(storage, RANK_TABLES)
+    with storage.cursor(commit=True) as cur:
+        for table in RANK_TABLES:
+            storage.execute(cur, f"DELETE FROM {table}")
+
+    storage._schema_ready = False  # 새 프로세스
+    storage.prepare_schema()
+    assert dump(storage, RANK_TABLES) == before
+    assert before["daily_rank_stats"] and before["monthly_rank_stats"]
+
+
+@pytest.mark.parametrize("end_month, start", [
+    ("2025-12", date(2025, 1, 1)),
+    ("2025-11", date(2024, 12, 1)),
+    ("2025-03", date(2024, 4, 1)),
+    ("2025-01", date(2024, 2, 1)),
+])
+def test_monthly_history_defaults_to_twelve_months(end_month, start, monkeypatch):
+    monkeypatch.setattr(app_package, "STORAGE_BACKEND", "sqlite")  # DB 풀 워밍업 없이
+    flask_app = app_package.create_app()
+    with flask_app.test_request_context(query_string={"endMonth": end_month}):
+        (actual_start, end, key, _), error = routes._history_range("monthly")
+    assert error is None
+    assert (actual_start, end.strftime("%Y-%m"), key) == (start, end_month, "stat_month")
+
+
+class Crawl:
+    """cli.main 의 네트워크 호출 대체: 1페이지는 게시물 2개, 2페이지에서 요청 실패"""
+
+    def parse_list_page(self, page, slug):
+        if page == 2:
+            raise ConnectionError("list page 2 unreachable")
+        return ["1", "2"]
+
+    def parse_post(self, pid, slug):
+        deadline = datetime(2025, 9, int(pid), 12)
+        return [record(int(pid), "alice", 0, 1000, 1900, deadline, slug),
+                record(int(pid), "bob", 1, 1000, 0, deadline, slug)]
+
+
+@pytest.fixture
+def crawl(storage, monkeypatch):
+    site = Crawl()
+    monkeypatch.setattr(app.storage, "_storage", storage)
+    monkeypatch.setattr(cli, "parse_list_page", site.parse_list_page)
+    monkeypatch.setattr(cli, "parse_post", site.parse_post)
+    monkeypatch.setattr(cli, "_get_slugs", lambda: ["pan_ccy"])
+    monkeypatch.setattr(cli.time, "sleep", lambda sec: None)
+    return storage
+
+
+def test_failed_crawl_still_ranks_saved_pages(crawl, capsys):
+    with pytest.raises(ConnectionError):
+        cli.main()
+    with crawl.cursor() as cur:
+        ranking = crawl.daily_ranking(cur, date(2025, 9, 1), 10)
+    assert [r[0] for r in ranking] == ["alice", "bob"]
+    assert '"ranks_updated"' in capsys.readouterr().out
+
+
+def test_rank_failure_does_not_mask_crawl_error(crawl, monkeypatch, capsys):
+    def broken_refresh(stat_dates, stat_months):
+        raise RuntimeError("rank table locked")
+
+    monkeypatch.setattr(cli, "refresh_ranks", broken_refresh)
+    with pytest.raises(ConnectionError):
+        cli.main()
+    out = capsys.readouterr().out
+    assert "rank refresh failed: rank table locked" in out
+    assert "[ERROR] 순위 계산 실패" in out
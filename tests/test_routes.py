@@ -0,0 +1,83 @@
+import pytest
+
+import app as app_package
+import app.storage
+from app.storage.parity import SLUGS, synthetic_posts
+
+
+@pytest.fixture
+def client(storage, monkeypatch):
+    # 라우트는 get_storage() 로 저장소를 받으므로 픽스처 저장소로 교체 (DB 풀 워밍업 없이)
+    storage.insert_records(synthetic_posts(150))
+    monkeypatch.setattr(app.storage, "_storage", storage)
+    monkeypatch.setattr(app_package, "STORAGE_BACKEND", storage.name)
+    return app_package.create_app().test_client()
+
+
+def get_json(client, path, **params):
+    response = client.get(path, query_string=params)
+    assert response.status_code == 200, response.data
+    return response.get_json()
+
+
+def rows_from_columnar(columns):
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+
+TABLE_ENDPOINTS = [
+    ("/api/daily_ranking", {"statDate": "2025-09-05"}),
+    ("/api/daily_ranking", {"statDate": "2025-09-05", "boardSlug": SLUGS[0], "limit": 5}),
+    ("/api/daily_ranking", {"statDate": "1999-01-01"}),  # 빈 결과
+    ("/api/monthly_ranking", {"statMonth": "2025-09"}),
+    ("/api/range_ranking", {"startDate": "2025-08-28", "endDate": "2025-09-10"}),
+]
+
+
+@pytest.mark.parametrize("path, params", TABLE_ENDPOINTS)
+def test_columnar_round_trip(client, path, params):
+    rows = get_json(client, path, **params)
+    columns = get_json(client, path, format="columnar", **params)
+    assert all(len(values) == len(rows) for values in columns.values())
+    assert rows_from_columnar(columns) == rows
+
+
+@pytest.mark.parametrize("path", ["/api/daily_stats", "/api/monthly_stats"])
+def test_columnar_round_trip_per_user(client, path):
+    params = {"nickname": "user001", "startDate": "2025-08-01", "endDate": "2025-09-30"}
+    rows = get_json(client, path, **params)
+    columns = get_json(client, path, format="columnar", **params)
+    assert rows["user001"]
+    assert {nick: rows_from_columnar(table) for nick, table in columns.items()} == rows
+
+
+@pytest.mark.parametrize("nickname, board_slug", [("user001", None), ("user017", SLUGS[1])])
+def test_dashboard_matches_separate_endpoints(client, nickname, board_slug):
+    params = {"nickname": nickname, "startDate": "2025-08-01", "endDate": "2025-09-30",
+              "startMonth": "2025-08", "endMonth": "2025-10", "statDate": "2025-09-05", "statMonth": "2025-09",
+              "limit": 7}
+    if board_slug:
+        params["boardSlug"] = board_slug
+    board = {"boardSlug": board_slug} if board_slug else {}
+    data = get_json(client, "/api/dashboard", **params)
+
+    daily = get_json(client, "/api/daily_stats", nickname=nickname, startDate="2025-08-01", endDate="2025-09-30",
+                     **board)[nickname]
+    monthly = get_json(client, "/api/monthly_stats", nickname=nickname, startMonth="2025-08", endMonth="2025-10",
+                       **board)[nickname]
+    assert daily and monthly
+    assert data["daily"] == daily
+    assert data["monthly"] == monthly
+    assert data["top"]["daily"] == get_json(client, "/api/daily_ranking", statDate="2025-09-05", limit=7, **board)
+    assert data["top"]["monthly"] == get_json(client, "/api/monthly_ranking", statMonth="2025-09", limit=7, **board)
+
+    # 현재 순위 = 기준 날짜/달의 통계 행 (없으면 None)
+    assert data["periods"] == {"daily": "2025-09-05", "monthly": "2025-09"}
+    for key, rows, field in (("daily", daily, "stat_date"), ("monthly", monthly, "stat_month")):
+        current = next((row for row in rows if row[field] == data["periods"][key]), None)
+        expected = {k: v for k, v in current.items() if k != field} if current else None
+        assert data["ranks"][key] == expected
+    assert data["ranks"]["monthly"]
+
+def test_dashboard_unknown_user(client):
+    response = client.get("/api/dashboard", query_string={"nickname": "nobody"})
+    assert response.status_code == 404
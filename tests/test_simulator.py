@@ -0,0 +1,50 @@
+from datetime import datetime
+
+import numpy as np
+
+from app import simulator
+from helpers import record
+
+D1, D2 = datetime(2025, 9, 1, 12), datetime(2025, 9, 2, 12)
+
+
+def test_follow_top_uses_leader_before_deadline(storage):
+    # 9/1: alice +900, bob -1000 → 9/2 게시물에서는 참여자 중 누적 수익 1위의 사이드
+    storage.insert_records({
+        "1": [record(1, "alice", 0, 1000, 1900, D1), record(1, "bob", 1, 1000, 0, D1)],
+        "2": [record(2, "alice", 1, 500, 950, D2), record(2, "bob", 0, 500, 0, D2)],
+        "3": [record(3, "bob", 1, 500, 0, D2), record(3, "carol", 0, 500, 950, D2)],
+        "4": [record(4, "dave", 0, 500, 950, D2), record(4, "erin", 1, 500, 0, D2)],
+        "5": [record(5, "alice", 0, 300, 0, D2), record(5, "alice", 1, 300, 570, D2),
+              record(5, "bob", 0, 500, 0, D2)],
+    })
+    with storage.cursor() as cur:
+        pools = simulator.load_pools(storage, cur)
+
+    top_side = dict(zip(pools["keys"][:, 1].tolist(), pools["top_side"].tolist()))
+    # 1: 마감 전 기록 없음 / 3: 기록 있는 bob 이 1위 / 4: 둘 다 기록 없음 / 5: 양방 alice 제외 → bob
+    assert top_side == {1: -1, 2: 1, 3: 1, 4: -1, 5: 0}
+
+    result = simulator.simulate(pools, "follow_top", 100)
+    assert result["posts"] == 3
+    assert result["hits"] == 1
+
+
+def test_simulate_hand_built_pools():
+    pools = {
+        "pool": np.array([[100.0, 300.0], [200.0, 200.0], [500.0, 0.0]]),
+        "payout": np.array([[380.0, 0.0], [0.0, 380.0], [475.0, 0.0]]),
+        "top_bet": np.array([[100.0, 50.0], [20.0, 150.0], [500.0, 0.0]]),
+        "top_side": np.array([0, -1, 0]),
+    }
+    assert simulator.choose_sides(pools, "underdog").tolist() == [0, 0, 0]
+    assert simulator.choose_sides(pools, "favorite").tolist() == [1, 0, 0]
+    assert simulator.choose_sides(pools, "biggest_bet").tolist() == [0, 1, 0]
+
+    # 게시물 3 은 한쪽 사이드만 있어 제외, follow_top 은 상위 유저 없는 게시물 2 도 제외
+    underdog = simulator.simulate(pools, "underdog", 100)
+    assert (underdog["posts"], underdog["hits"]) == (2, 1)
+    # 게시물 1: (400 + 100) * 0.95 / (100 + 100) 배 → 100 걸어 237.5 반환
+    assert underdog["total_returned"] == 237.5
+    follow = simulator.simulate(pools, "follow_top", 100)
+    assert (follow["posts"], follow["hits"], follow["total_profit"]) == (1, 1, 137.5)
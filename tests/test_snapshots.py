@@ -0,0 +1,96 @@
+import json
+from datetime import date, datetime
+
+import pytest
+
+import app as app_package
+import app.storage
+from app import routes, snapshots
+from app.storage.parity import synthetic_posts
+from helpers import record
+
+TODAY = date(2025, 9, 6)  # 기본 기간: 2025-09 월간 / 2025-09-05 일간
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "snapshots"
+    monkeypatch.setattr(snapshots, "SNAPSHOT_DIR", directory)
+    monkeypatch.setattr(routes, "SNAPSHOT_DIR", directory)
+    monkeypatch.setattr(snapshots, "_manifest_cache", {"mtime": None, "manifest": None})
+    monkeypatch.setattr(snapshots, "_inline_cache", {})
+    return directory
+
+
+def read(directory, name):
+    return json.loads((directory / name).read_text(encoding="utf-8"))
+
+
+def test_publish_snapshots_matches_rankings(storage, snapshot_dir):
+    storage.insert_records(synthetic_posts(150))
+    manifest = snapshots.publish_snapshots(storage, TODAY)
+
+    with storage.cursor() as cur:
+        storage.execute(cur, "SELECT slug FROM boards")
+        slugs = [slug for slug, in cur.fetchall()]
+        assert set(manifest["files"]) == {snapshots.ALL_SCOPE, *slugs}
+        for scope, name in manifest["files"].items():
+            board_slug = None if scope == snapshots.ALL_SCOPE else scope
+            monthly = storage.monthly_ranking(cur, date(2025, 9, 1), snapshots.SNAPSHOT_LIMIT, board_slug)
+            daily = storage.daily_ranking(cur, date(2025, 9, 5), snapshots.SNAPSHOT_LIMIT, board_slug)
+            expected = {
+                "board_slug": board_slug,
+                "monthly": {"period": "2025-09", "data": snapshots.columnar(snapshots.RANKING_FIELDS, monthly)},
+                "daily": {"period": "2025-09-05", "data": snapshots.columnar(snapshots.RANKING_FIELDS, daily)},
+            }
+            assert read(snapshot_dir, name) == json.loads(json.dumps(expected))
+            assert expected["monthly"]["data"]["nickname"]
+    assert read(snapshot_dir, snapshots.MANIFEST) == manifest
+
+
+def test_publish_keeps_one_previous_generation(sqlite_storage, snapshot_dir):
+    storage = sqlite_storage
+    storage.insert_records(synthetic_posts(60))
+    first = snapshots.publish_snapshots(storage, TODAY)
+    assert snapshots.publish_snapshots(storage, TODAY)["files"] == first["files"]  # 내용이 같으면 파일명도 같음
+
+    def add_post(post_id, day):
+        storage.insert_records({str(post_id): [
+            record(post_id, "newcomer", 0, 90000, 171000, datetime(2025, 9, day, 12)),
+            record(post_id, "user001", 1, 100, 0, datetime(2025, 9, day, 12)),
+        ]})
+
+    add_post(900001, 5)
+    second = snapshots.publish_snapshots(storage, TODAY)
+    add_post(900002, 5)
+    third = snapshots.publish_snapshots(storage, TODAY)
+
+    names = {path.name for path in snapshot_dir.glob("*.json")}
+    all_scope = snapshots.ALL_SCOPE
+    assert len({first["files"][all_scope], second["files"][all_scope], third["files"][all_scope]}) == 3
+    # 현재 + 직전 세대만 남음
+    assert names == {snapshots.MANIFEST} | set(second["files"].values()) | set(third["files"].values())
+
+
+def test_inline_snapshot_is_safe_inside_script(sqlite_storage, snapshot_dir, monkeypatch):
+    nickname = "</script><img src=x onerror=alert(1)>&\u2028\u2029"
+    sqlite_storage.insert_records({"1": [
+        record(1, nickname, 0, 5000, 9500, datetime(2025, 9, 5, 12)),
+        record(1, "bob", 1, 5000, 0, datetime(2025, 9, 5, 12)),
+    ]})
+    manifest = snapshots.publish_snapshots(sqlite_storage, TODAY)
+
+    inline = snapshots.inline_snapshot()
+    for raw in ("<", ">", "&", "\u2028", "\u2029"):
+        assert raw not in inline
+    # JSON 값은 그대로
+    assert json.loads(inline) == read(snapshot_dir, manifest["files"][snapshots.ALL_SCOPE])
+    assert json.loads(inline)["daily"]["data"]["nickname"] == [nickname, "bob"]
+
+    # 랭킹 페이지에 그대로 인라인, 스냅샷이 없는 게시판은 인라인 없음
+    monkeypatch.setattr(app.storage, "_storage", sqlite_storage)
+    monkeypatch.setattr(app_package, "STORAGE_BACKEND", sqlite_storage.name)
+    client = app_package.create_app().test_client()
+    page = client.get("/ranking").get_data(as_text=True)
+    assert f"window.RANKING_SNAPSHOT = {inline};" in page
+    assert "window.RANKING_SNAPSHOT" not in client.get("/starbbs/ranking").get_data(as_text=True)
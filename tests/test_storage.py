@@ -0,0 +1,97 @@
+import random
+from datetime import date, datetime
+
+import pytest
+
+from app.storage.parity import synthetic_posts
+from helpers import DERIVED_TABLES, dump, record
+
+# 합성 데이터로 수집/집계 경로 검증 (storage 픽스처는 SQLite / Postgres 두 백엔드 — tests/conftest.py)
+#   python -m pytest -q
+
+
+def test_incremental_ingest_matches_rebuild(storage):
+    # 날짜 순서가 섞인 배치로 나눠 넣어도 전체 재계산과 같아야 함
+    items = list(synthetic_posts(150).items())
+    random.Random(3).shuffle(items)
+    for start in range(0, len(items), 17):
+        storage.insert_records(dict(items[start:start + 17]))
+    incremental = dump(storage)
+
+    storage.rebuild_stats()
+    rebuilt = dump(storage)
+
+    for table in DERIVED_TABLES:
+        assert incremental[table], table
+        assert incremental[table] == rebuilt[table], table
+
+
+def test_duplicate_batch_is_skipped(storage):
+    posts = synthetic_posts(40)
+    first = storage.insert_records(posts)
+    assert first["posts"] == 40
+    before = dump(storage)
+
+    again = storage.insert_records(dict(list(posts.items())[:10]))
+    assert again["posts"] == 0
+    assert again["records"] == 0
+    assert dump(storage) == before
+
+
+def test_day_cutoff_at_five(storage):
+    # 05:00 이전 마감은 전날 (월 첫날 새벽이면 전달) 로 집계
+    storage.insert_records({
+        "1": [record(1, "alice", 0, 1000, 1900, datetime(2025, 9, 2, 4, 59)),
+              record(1, "bob", 1, 1000, 0, datetime(2025, 9, 2, 4, 59))],
+        "2": [record(2, "alice", 0, 2000, 0, datetime(2025, 9, 2, 5, 0)),
+              record(2, "bob", 1, 2000, 3800, datetime(2025, 9, 2, 5, 0))],
+        "3": [record(3, "alice", 1, 3000, 5700, datetime(2025, 9, 1, 3, 0)),
+              record(3, "bob", 0, 3000, 0, datetime(2025, 9, 1, 3, 0))],
+    })
+
+    with storage.cursor() as cur:
+        (alice, _), = storage.find_users(cur, "alice")
+        daily = storage.daily_stats(cur, alice, date(2025, 8, 1), date(2025, 9, 30))
+        monthly = storage.monthly_stats(cur, alice)
+
+    # (기간, total_bets, total_amount, total_profit, ...)
+    assert sorted((str(r[0]), r[1], r[2], r[3]) for r in daily) == [
+        ("2025-08-31", 1, 3000, 2700),
+        ("2025-09-01", 1, 1000, 900),
+        ("2025-09-02", 1, 2000, -2000),
+    ]
+    assert sorted((str(r[0])[:7], r[1], r[2], r[3]) for r in monthly) == [
+        ("2025-08", 1, 3000, 2700),
+        ("2025-09", 2, 3000, -1100),
+    ]
+
+
+def test_schema_created_once_per_process(storage, monkeypatch):
+    statements = []
+    execute = storage.execute
+
+    def counting_execute(cur, sql, params=()):
+        statements.append(sql)
+        return execute(cur, sql, params)
+
+    monkeypatch.setattr(storage, "execute", counting_execute)
+    storage.insert_records(synthetic_posts(5))
+    storage.insert_records(synthetic_posts(10))
+    # Postgres 월 파티션은 새 달을 처음 넣을 때 생성 (스키마 DDL 아님)
+    schema = [sql for sql in statements if "PARTITION OF" not in sql]
+    assert not any("CREATE TABLE" in sql or "CREATE INDEX" in sql for sql in schema)
+
+
+def test_backends_match(sqlite_storage, postgres_storage):
+    # 같은 데이터를 두 백엔드에 넣으면 파생 테이블이 행 단위로 같아야 함 (조회 결과 비교는 app/storage/parity.py)
+    posts = synthetic_posts(120)
+    items = list(posts.items())
+    for storage in (sqlite_storage, postgres_storage):
+        storage.insert_records(dict(items[:60]))
+        storage.insert_records(dict(items[60:]))
+
+    expected = dump(sqlite_storage)
+    actual = dump(postgres_storage)
+    for table in DERIVED_TABLES:
+        assert expected[table], table
+        assert expected[table] == actual[table], table
@@ -0,0 +1,154 @@
+from collections import defaultdict
+from datetime import date, timedelta
+
+import pytest
+
+from app.storage.parity import SLUGS, synthetic_posts
+from helpers import dump
+
+DAY_CUTOFF = timedelta(hours=5)
+# 합성 데이터(2025-08-25 ~) 전체를 덮는 조회 범위
+OVERVIEW_RANGE = {"daily": (date(2025, 8, 1), date(2025, 12, 31)), "monthly": (date(2025, 8, 1), date(2025, 12, 1))}
+
+
+@pytest.fixture
+def posts():
+    return synthetic_posts(150)
+
+
+@pytest.fixture
+def loaded(storage, posts):
+    storage.insert_records(posts)
+    return storage
+
+
+def daily_totals(posts, board_slug=None):
+    # {(nickname, stat_date): [bets, amount, profit, wins]} — 양방 참여는 순수익만
+    totals = defaultdict(lambda: [0, 0, 0, 0])
+    for records in posts.values():
+        if board_slug and records[0]["slug"] != board_slug:
+            continue
+        by_user = defaultdict(list)
+        for r in records:
+            by_user[r["nickname"]].append(r)
+        for nickname, rows in by_user.items():
+            day = (rows[0]["deadline_at"] - DAY_CUTOFF).date()
+            profit = sum(r["payout_amount"] - r["bet_amount"] for r in rows)
+            t = totals[nickname, day]
+            t[2] += profit
+            if len({r["bet_side"] for r in rows}) == 1:
+                t[0] += 1
+                t[1] += max(r["bet_amount"] for r in rows)
+                t[3] += profit > 0
+    return totals
+
+
+@pytest.mark.parametrize("board_slug", [None, SLUGS[0]])
+def test_user_summary_matches_daily_totals(loaded, posts, board_slug):
+    totals = daily_totals(posts, board_slug)
+    nicknames = sorted({nickname for nickname, _ in totals})
+    assert nicknames
+    with loaded.cursor() as cur:
+        for nickname in nicknames:
+            days = {day: t for (n, day), t in totals.items() if n == nickname}
+            (bets, amount, profit, wins, win_rate, first_seen, last_seen,
+             best_day, best_profit, worst_day, worst_profit) = loaded.user_summary(cur, nickname, board_slug)
+
+            assert (bets, amount, profit, wins) == tuple(sum(t[i] for t in days.values()) for i in range(4))
+            assert win_rate == (round(wins * 100 / bets, 2) if bets else 0.0)
+            assert (str(first_seen), str(last_seen)) == (str(min(days)), str(max(days)))
+            # 같은 수익이면 이른 날짜
+            best = min(days, key=lambda d: (-days[d][2], d))
+            worst = min(days, key=lambda d: (days[d][2], d))
+            assert (str(best_day), best_profit) == (str(best), days[best][2])
+            assert (str(worst_day), worst_profit) == (str(worst), days[worst][2])
+        assert loaded.user_summary(cur, "nobody", board_slug) is None
+
+
+def test_post_summaries_match_records(loaded, posts):
+    with loaded.cursor() as cur:
+        loaded.execute(cur, """
+            SELECT b.slug, p.post_id, p.stat_date, p.stat_month, p.participants, p.side_count,
+                   p.total_amount, p.total_payout, p.winning_side, u.nickname, p.top_bet_amount
+            FROM post_summary p JOIN boards b ON b.id = p.board_id JOIN users u ON u.id = p.top_user_id
+        """)
+        summaries = {str(row[1]): row for row in cur.fetchall()}
+        loaded.execute(cur, """
+            SELECT s.post_id, s.bet_side, s.bettors, s.bet_amount, s.payout_amount, s.max_bet
+            FROM post_side_summary s
+        """)
+        sides = defaultdict(dict)
+        for post_id, side, *values in cur.fetchall():
+            sides[str(post_id)][side] = tuple(values)
+
+    assert set(summaries) == set(posts)
+    for post_id, records in posts.items():
+        slug, _, stat_date, stat_month, participants, side_count, amount, payout, winner, top_nickname, top_bet = \
+            summaries[post_id]
+        day = (records[0]["deadline_at"] - DAY_CUTOFF).date()
+        by_side = defaultdict(list)
+        for r in records:
+            by_side[r["bet_side"]].append(r)
+        top = max(r["bet_amount"] for r in records)
+        payouts = {side: sum(r["payout_amount"] for r in rows) for side, rows in by_side.items()}
+
+        assert (slug, str(stat_date), str(stat_month)[:7]) == (records[0]["slug"], str(day), str(day)[:7])
+        assert participants == len({r["nickname"] for r in records})
+        assert side_count == len(by_side)
+        assert (amount, payout) == (sum(r["bet_amount"] for r in records), sum(payouts.values()))
+        # 반환액이 가장 큰 사이드 (동률은 작은 사이드 번호, 반환 없으면 None)
+        expected_winner = min(payouts, key=lambda s: (-payouts[s], s))
+        assert winner == (expected_winner if payouts[expected_winner] > 0 else None)
+        assert top_bet == top
+        assert top_nickname in {r["nickname"] for r in records if r["bet_amount"] == top}
+        assert sides[post_id] == {
+            side: (len({r["nickname"] for r in rows}), sum(r["bet_amount"] for r in rows),
+                   payouts[side], max(r["bet_amount"] for r in rows))
+            for side, rows in by_side.items()
+        }
+
+
+def test_pre_summary_database_is_backfilled(storage, posts):
+    # 요약 테이블 도입 전 DB: 원본 / 기간 통계만 있고 post_summary 는 비어 있음
+    post_ids = sorted(posts)
+    storage.insert_records({post_id: posts[post_id] for post_id in post_ids[:100]})
+    with storage.cursor(commit=True) as cur:
+        storage.execute(cur, "DELETE FROM post_side_summary")
+        storage.execute(cur, "DELETE FROM post_summary")
+    storage._post_summary_ready = False
+
+    # 다음 배치 집계가 기존 게시물까지 포함해야 함 (경계 날짜는 두 배치에 걸침)
+    storage.insert_records({post_id: posts[post_id] for post_id in post_ids[100:]})
+    tables = ("daily_betting_stats", "monthly_betting_stats")
+    incremental = dump(storage, tables)
+    storage.rebuild_stats()
+    assert dump(storage, tables) == incremental
+
+
+@pytest.mark.parametrize("period", ["daily", "monthly"])
+@pytest.mark.parametrize("board_slug", [None, SLUGS[1]])
+def test_board_overview_matches_records(loaded, posts, period, board_slug):
+    # 기간별 게시물 수 / 참여자(중복 제거) / 배팅액 / 지급액
+    expected = defaultdict(lambda: [set(), set(), 0, 0])
+    for post_id, records in posts.items():
+        if board_slug and records[0]["slug"] != board_slug:
+            continue
+        day = (records[0]["deadline_at"] - DAY_CUTOFF).date()
+        key = str(day) if period == "daily" else str(day)[:7]
+        e = expected[key]
+        e[0].add(post_id)
+        e[1].update(r["nickname"] for r in records)
+        e[2] += sum(r["bet_amount"] for r in records)
+        e[3] += sum(r["payout_amount"] for r in records)
+
+    with loaded.cursor() as cur:
+        rows = loaded.board_overview(cur, board_slug, period, *OVERVIEW_RANGE[period])
+        assert loaded.board_overview(cur, "no_such_board", period, *OVERVIEW_RANGE[period]) is None
+
+    keys = [str(row[0]) if period == "daily" else str(row[0])[:7] for row in rows]
+    assert keys == sorted(expected)
+    for key, (_, n_posts, participants, amount, payout, house, player) in zip(keys, rows):
+        e = expected[key]
+        assert (n_posts, participants, amount, payout) == (len(e[0]), len(e[1]), e[2], e[3])
+        assert house == amount - payout == -player
+